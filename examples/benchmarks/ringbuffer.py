@@ -0,0 +1,60 @@
+"""Per-item cost of take_last and ReplaySubject as the buffer grows.
+
+With a list drained by pop(0) the cost grew linearly with the buffer
+size. Backed by RingBuffer it stays flat.
+"""
+import timeit
+
+import rx
+from rx import operators as ops
+from rx.internal import RingBuffer
+from rx.subject import ReplaySubject
+
+ITEMS = 200000
+
+
+def dequeue(size):
+    queue = RingBuffer(size, range(size))
+
+    def run():
+        for i in range(ITEMS):
+            queue.enqueue(i)
+            queue.dequeue()
+    return run
+
+
+def list_pop(size):
+    queue = list(range(size))
+
+    def run():
+        for i in range(ITEMS):
+            queue.append(i)
+            queue.pop(0)
+    return run
+
+
+def take_last(size):
+    def run():
+        rx.range(0, ITEMS).pipe(ops.take_last(size)).subscribe()
+    return run
+
+
+def replay_subject(size):
+    def run():
+        subject = ReplaySubject(buffer_size=size)
+        for i in range(ITEMS):
+            subject.on_next(i)
+    return run
+
+
+def main():
+    print("%-16s %10s %14s" % ("benchmark", "size", "ns per item"))
+    for name, bench in [("list.pop(0)", list_pop), ("RingBuffer", dequeue),
+                        ("take_last", take_last), ("ReplaySubject", replay_subject)]:
+        for size in (10, 10000, 100000):
+            elapsed = min(timeit.repeat(bench(size), number=1, repeat=3))
+            print("%-16s %10d %14.0f" % (name, size, elapsed / ITEMS * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
 # pylint: disable=too-many-lines,redefined-outer-name,redefined-builtin
 
+from asyncio import AbstractEventLoop as _AbstractEventLoop
 from asyncio.futures import Future as _Future
-from typing import Iterable, Callable, Any, Optional, Union, Mapping
+from typing import AsyncIterable, Iterable, Callable, Any, Optional, Union, Mapping
 
 from .core import Observable, pipe, typing
 from .internal.utils import alias
@@ -151,7 +152,7 @@ def create(subscribe: typing.Subscription) -> Observable:
     return Observable(subscribe)
 
 
-def combine_latest(*sources: Observable) -> Observable:
+def combine_latest(*sources: Observable, snapshot: bool = False) -> Observable:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever any of the observable
     sequences emits an element.
@@ -166,9 +167,18 @@ def combine_latest(*sources: Observable) -> Observable:
 
     Examples:
         >>> obs = rx.combine_latest(obs1, obs2, obs3)
+        >>> obs = rx.combine_latest(*price_streams, snapshot=True)
 
     Args:
         sources: Sequence of observables.
+        snapshot: [Optional] If True, a read-only sequence sharing the
+            latest values with the operator is emitted instead of a new
+            tuple. The values are only copied when a new value arrives
+            while the previous snapshot is still referenced, so with
+            many sources this avoids copying all values per element as
+            long as consumers drop each snapshot before the next
+            element. Consumers keeping snapshots make every element
+            copy all values.
 
     Returns:
         An observable sequence containing the result of combining elements from
@@ -176,7 +186,7 @@ def combine_latest(*sources: Observable) -> Observable:
     """
 
     from .core.observable.combinelatest import _combine_latest
-    return _combine_latest(*sources)
+    return _combine_latest(*sources, snapshot=snapshot)
 
 
 def concat(*sources: Observable) -> Observable:
@@ -319,6 +329,33 @@ def for_in(values: Iterable[Any], mapper: typing.Mapper) -> Observable:
     return concat_with_iterable(map(mapper, values))
 
 
+def from_async_iterable(iterable: AsyncIterable,
+                        loop: Optional[_AbstractEventLoop] = None
+                        ) -> Observable:
+    """Converts an asynchronous iterable to an observable sequence.
+
+    The elements are pulled one at a time by a task on the event loop,
+    and the next element is only requested after the observers have
+    handled the previous one.
+
+    Example:
+        >>> rx.from_async_iterable(response.content.iter_chunked(1024))
+
+    Args:
+        iterable: An object supporting ``async for``, e.g. an
+            asynchronous generator.
+        loop: [Optional] The asyncio event loop to iterate on. If not
+            specified, the current event loop is used.
+
+    Returns:
+        The observable sequence whose elements are pulled from the
+        given asynchronous iterable. Disposing the subscription cancels
+        the iteration.
+    """
+    from .core.observable.fromasynciterable import _from_async_iterable
+    return _from_async_iterable(iterable, loop)
+
+
 def from_callable(supplier: Callable[[], Any],
                   scheduler: Optional[typing.Scheduler] = None
                   ) -> Observable:
@@ -394,7 +431,10 @@ def from_future(future: _Future) -> Observable:
     return _from_future(future)
 
 
-def from_iterable(iterable: Iterable, scheduler: Optional[typing.Scheduler] = None) -> Observable:
+def from_iterable(iterable: Iterable,
+                  scheduler: Optional[typing.Scheduler] = None,
+                  batch_size: Optional[int] = None
+                  ) -> Observable:
     """Converts an iterable to an observable sequence.
 
     .. marble::
@@ -406,19 +446,25 @@ def from_iterable(iterable: Iterable, scheduler: Optional[typing.Scheduler] = No
 
     Example:
         >>> rx.from_iterable([1,2,3])
+        >>> rx.from_iterable(records, batch_size=1000)
 
     Args:
         iterable: An Iterable to change into an observable sequence.
         scheduler: [Optional] Scheduler instance to schedule the values on.
             If not specified, the default is to use an instance of
             :class:`CurrentThreadScheduler <rx.scheduler.CurrentThreadScheduler>`.
+        batch_size: [Optional] If given, the values are pushed in lists
+            of up to batch_size elements through the observers'
+            ``on_next_batch``. Operators that support batches process a
+            whole list in one call, others receive the elements one by
+            one.
 
     Returns:
         The observable sequence whose elements are pulled from the
         given iterable sequence.
     """
     from .core.observable.fromiterable import from_iterable as from_iterable_
-    return from_iterable_(iterable, scheduler)
+    return from_iterable_(iterable, scheduler, batch_size)
 
 
 from_ = alias('from_', 'Alias for :func:`rx.from_iterable`.', from_iterable)
@@ -795,7 +841,8 @@ def on_error_resume_next(*sources: Union[Observable, _Future]) -> Observable:
 def range(start: int,
           stop: Optional[int] = None,
           step: Optional[int] = None,
-          scheduler: Optional[typing.Scheduler] = None
+          scheduler: Optional[typing.Scheduler] = None,
+          batch_size: Optional[int] = None
           ) -> Observable:
     """Generates an observable sequence of integral numbers within a
     specified range, using the specified scheduler to send out observer
@@ -811,6 +858,7 @@ def range(start: int,
         >>> res = rx.range(10)
         >>> res = rx.range(0, 10)
         >>> res = rx.range(0, 10, 1)
+        >>> res = rx.range(0, 1000000, batch_size=1000)
 
     Args:
         start: The value of the first integer in the sequence.
@@ -818,13 +866,16 @@ def range(start: int,
         scheduler: [Optional] The scheduler to schedule the values on. If not
             specified, the default is to use an instance of
             :class:`CurrentThreadScheduler <rx.scheduler.CurrentThreadScheduler>`.
+        batch_size: [Optional] If given, the integers are pushed in lists
+            of up to batch_size elements through the observers'
+            ``on_next_batch``.
 
     Returns:
         An observable sequence that contains a range of sequential
         integral numbers.
     """
     from .core.observable.range import _range
-    return _range(start, stop, step, scheduler)
+    return _range(start, stop, step, scheduler, batch_size)
 
 
 def return_value(value: Any, scheduler: Optional[typing.Scheduler] = None) -> Observable:
@@ -1,16 +1,62 @@
-from typing import Optional
+import weakref
+from collections.abc import Sequence
+from typing import Any, List, Optional
 
 from rx.core import Observable, typing
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
 
 
-def _combine_latest(*sources: Observable) -> Observable:
+class CombineLatestSnapshot(Sequence):
+    """A read-only view of the latest values of the sources of
+    combine_latest.
+
+    Snapshots share the list of values with combine_latest. The list is
+    only copied when a new value arrives while a previous snapshot is
+    still referenced, so a snapshot never changes. That copy is O(n) in
+    the number of sources, so consumers holding on to every snapshot
+    pay for a full copy per element.
+    """
+
+    __slots__ = ('_values', '__weakref__')
+
+    def __init__(self, values: List[Any]) -> None:
+        self._values = values
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CombineLatestSnapshot):
+            return self._values == other._values
+        if isinstance(other, tuple):
+            return tuple(self._values) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return 'CombineLatestSnapshot(%r)' % (tuple(self._values),)
+
+
+def _combine_latest(*sources: Observable, snapshot: bool = False) -> Observable:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever any of the
     observable sequences produces an element.
 
     Examples:
         >>> obs = combine_latest(obs1, obs2, obs3)
+        >>> obs = combine_latest(*streams, snapshot=True)
+
+    Args:
+        sources: Sequence of observables.
+        snapshot: If True, a CombineLatestSnapshot of the values is
+            emitted instead of a tuple.
 
     Returns:
         An observable sequence containing the result of combining
@@ -25,25 +71,43 @@ def _combine_latest(*sources: Observable) -> Observable:
 
         n = len(sources)
         has_value = [False] * n
-        has_value_all = [False]
         is_done = [False] * n
-        values = [None] * n
-
-        def _next(i):
-            has_value[i] = True
-
-            if has_value_all[0] or all(has_value):
-                res = tuple(values)
+        values: List[Any] = [None] * n
+        value_count = 0
+        done_count = 0
+        last_snapshot: Optional[weakref.ReferenceType] = None
+
+        def _next(i: int, value: Any) -> None:
+            nonlocal values, value_count, last_snapshot
+
+            if last_snapshot is not None:
+                if last_snapshot() is not None:
+                    values = values.copy()
+                last_snapshot = None
+            values[i] = value
+
+            if not has_value[i]:
+                has_value[i] = True
+                value_count += 1
+
+            if value_count == n:
+                if snapshot:
+                    res: Any = CombineLatestSnapshot(values)
+                    last_snapshot = weakref.ref(res)
+                else:
+                    res = tuple(values)
                 observer.on_next(res)
 
-            elif all([x for j, x in enumerate(is_done) if j != i]):
+            elif done_count - is_done[i] == n - 1:
                 observer.on_completed()
 
-            has_value_all[0] = all(has_value)
+        def done(i: int) -> None:
+            nonlocal done_count
 
-        def done(i):
-            is_done[i] = True
-            if all(is_done):
+            if not is_done[i]:
+                is_done[i] = True
+                done_count += 1
+            if done_count == n:
                 observer.on_completed()
 
         subscriptions = [None] * n
@@ -53,8 +117,7 @@ def _combine_latest(*sources: Observable) -> Observable:
 
             def on_next(x):
                 with parent.lock:
-                    values[i] = x
-                    _next(i)
+                    _next(i, x)
 
             def on_completed():
                 with parent.lock:
@@ -0,0 +1,52 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from typing import Any, AsyncIterable, Optional
+
+from rx.disposable import Disposable
+from rx.core import typing
+from rx.core import Observable
+
+
+def _from_async_iterable(iterable: AsyncIterable,
+                         loop: Optional[AbstractEventLoop] = None
+                         ) -> Observable:
+    """Converts an asynchronous iterable to an observable sequence.
+
+    Args:
+        iterable: An object supporting async for.
+        loop: [Optional] The event loop to iterate on.
+
+    Returns:
+        The observable sequence whose elements are pulled from the
+        given asynchronous iterable.
+    """
+
+    def subscribe(observer: typing.Observer,
+                  scheduler: Optional[typing.Scheduler] = None
+                  ) -> typing.Disposable:
+
+        async def iterate() -> None:
+            try:
+                async for value in iterable:
+                    observer.on_next(value)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                observer.on_error(ex)
+            else:
+                observer.on_completed()
+
+        loop_ = loop or asyncio.get_event_loop()
+
+        task: Any
+        if asyncio._get_running_loop() is loop_:
+            task = loop_.create_task(iterate())
+        else:
+            task = asyncio.run_coroutine_threadsafe(iterate(), loop_)
+
+        def dispose() -> None:
+            task.cancel()
+
+        return Disposable(dispose)
+
+    return Observable(subscribe)
@@ -1,19 +1,27 @@
+from itertools import islice
 from typing import Iterable, Any, Optional
 
 from rx.core import Observable, typing
 from rx.scheduler import CurrentThreadScheduler
 from rx.disposable import CompositeDisposable, Disposable
+from rx.internal.utils import batch_emitter
 
 
-def from_iterable(iterable: Iterable, scheduler: Optional[typing.Scheduler] = None) -> Observable:
+def from_iterable(iterable: Iterable,
+                  scheduler: Optional[typing.Scheduler] = None,
+                  batch_size: Optional[int] = None
+                  ) -> Observable:
     """Converts an iterable to an observable sequence.
 
     Example:
         >>> from_iterable([1,2,3])
+        >>> from_iterable(records, batch_size=1000)
 
     Args:
         iterable: A Python iterable
         scheduler: An optional scheduler to schedule the values on.
+        batch_size: [Optional] If given, values are pushed in lists of
+            up to batch_size elements through on_next_batch.
 
     Returns:
         The observable sequence whose elements are pulled from the
@@ -37,10 +45,24 @@ def from_iterable(iterable: Iterable, scheduler: Optional[typing.Scheduler] = No
             except Exception as error:  # pylint: disable=broad-except
                 observer.on_error(error)
 
+        def action_batch(_: typing.Scheduler, __: Any = None) -> None:
+            nonlocal disposed
+
+            on_next_batch = batch_emitter(observer)
+            try:
+                while not disposed:
+                    batch = list(islice(iterator, batch_size))
+                    if not batch:
+                        observer.on_completed()
+                        return
+                    on_next_batch(batch)
+            except Exception as error:  # pylint: disable=broad-except
+                observer.on_error(error)
+
         def dispose() -> None:
             nonlocal disposed
             disposed = True
 
         disp = Disposable(dispose)
-        return CompositeDisposable(_scheduler.schedule(action), disp)
+        return CompositeDisposable(_scheduler.schedule(action_batch if batch_size else action), disp)
     return Observable(subscribe)
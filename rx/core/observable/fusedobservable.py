@@ -0,0 +1,325 @@
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from rx.internal.utils import NotSet, batch_emitter
+
+from .. import typing
+
+from .observable import Observable
+
+
+# Kinds of stages that may be fused into a single subscription.
+MAP = 0
+FILTER = 1
+TAP = 2
+TAKE_WHILE = 3
+SKIP_WHILE = 4
+SCAN = 5
+
+# Kinds of stages with per subscription state, run by their own closure.
+STATEFUL = (TAKE_WHILE, SKIP_WHILE, SCAN)
+
+
+class FusedStage(NamedTuple):
+    """A stateless (or per subscription stateful) operator stage that
+    can be executed inline by a :class:`FusedObservable`.
+
+    Args:
+        kind: One of MAP, FILTER, TAP, TAKE_WHILE, SKIP_WHILE or SCAN.
+        func: The mapper, predicate, action or accumulator of the stage.
+        on_error: [Optional] Action invoked on exceptional termination
+            (TAP only).
+        on_completed: [Optional] Action invoked on graceful termination
+            (TAP only).
+        inclusive: Whether the element that stops a TAKE_WHILE stage is
+            emitted.
+        seed: [Optional] Initial accumulator value of a SCAN stage. If
+            not set, the first element is the initial accumulation.
+    """
+
+    kind: int
+    func: Optional[Callable[..., Any]]
+    on_error: Optional[typing.OnError] = None
+    on_completed: Optional[typing.OnCompleted] = None
+    inclusive: bool = False
+    seed: Any = NotSet
+
+
+class FusedObservable(Observable):
+    """Represents a chain of adjacent fusible operators applied to a
+    source observable.
+
+    Instead of building one observable, one auto detach observer and
+    one on_next closure per operator, the whole chain is executed by a
+    single observer. Runs of MAP, FILTER and TAP stages are compiled
+    into straight-line functions, which together with the TAKE_WHILE,
+    SKIP_WHILE and SCAN stages are composed into one function per
+    subscription, so no dispatch on the kind of stage is done per
+    element. Applying another fusible
+    operator to a fused observable returns a new fused observable with
+    the stage appended, so chains of any length collapse into one
+    subscription to the original source. Batches pushed through
+    on_next_batch are run through all stages and forwarded as a single
+    batch.
+    """
+
+    def __init__(self, source: Observable, stages: Tuple[FusedStage, ...]) -> None:
+        super().__init__()
+
+        self.source = source
+        self.stages = stages
+        self._factories: Optional[List[Callable[..., Callable[[Any], None]]]] = None
+
+    def _compile(self) -> List[Callable[..., Callable[[Any], None]]]:
+        """Returns the factories of the functions running the stages,
+        compiled on first use. Runs of MAP, FILTER and TAP stages share
+        a single function, while each TAKE_WHILE, SKIP_WHILE and SCAN
+        stage gets its own."""
+
+        if self._factories is None:
+            stages = self.stages
+            factories: List[Callable[..., Callable[[Any], None]]] = []
+            start = 0
+            while start < len(stages):
+                end = start + 1
+                if stages[start].kind in STATEFUL:
+                    factories.append(partial(_stage, stages[start], start))
+                else:
+                    while end < len(stages) and stages[end].kind not in STATEFUL:
+                        end += 1
+                    factories.append(_straight_line(stages[start:end], start))
+                start = end
+            self._factories = factories
+        return self._factories
+
+    def _subscribe_core(self,
+                        observer: typing.Observer,
+                        scheduler: Optional[typing.Scheduler] = None
+                        ) -> typing.Disposable:
+        stages = self.stages
+        factories = self._compile()
+        is_stopped = False
+        forward_batch = batch_emitter(observer)
+
+        # Per subscription state of the stateful stages by stage index:
+        # whether a TAKE_WHILE or SKIP_WHILE stage is still active, or
+        # the accumulation of a SCAN stage. The lock only guards the
+        # stage functions and the state, elements are emitted outside
+        # of it.
+        state: List[Any] = [stage.seed if stage.kind == SCAN else True for stage in stages]
+        lock = threading.RLock()
+        is_stateful = any(stage.kind in STATEFUL for stage in stages)
+
+        def error(start: int, err: Exception) -> None:
+            nonlocal is_stopped
+            is_stopped = True
+
+            for stage in stages[start:]:
+                if stage.on_error is not None:
+                    try:
+                        stage.on_error(err)
+                    except Exception as ex:  # pylint: disable=broad-except
+                        err = ex
+
+            observer.on_error(err)
+
+        def complete(start: int) -> None:
+            nonlocal is_stopped
+            is_stopped = True
+
+            for index in range(start, len(stages)):
+                on_completed = stages[index].on_completed
+                if on_completed is not None:
+                    try:
+                        on_completed()
+                    except Exception as ex:  # pylint: disable=broad-except
+                        error(index + 1, ex)
+                        return
+
+            observer.on_completed()
+
+        def compose(emit: Callable[[Any], None],
+                    fail: Callable[[int, Exception], None],
+                    stop: Callable[[int], None]
+                    ) -> Callable[[Any], None]:
+            """Composes the stages into a single function, where each
+            compiled function calls the next one directly, so no
+            dispatch on the kind of stage is left per element."""
+
+            step = emit
+            for factory in reversed(factories):
+                step = factory(step, fail, stop, state, lock)
+            return step
+
+        head = compose(observer.on_next, error, complete)
+        if is_stateful:
+            run_stages = head
+
+            def head(value: Any) -> None:
+                if not is_stopped:
+                    run_stages(value)
+
+        def on_next_batch(values: List[Any]) -> None:
+            if is_stopped:
+                return
+
+            results: List[Any] = []
+            failed: List[Tuple[int, Exception]] = []
+            stopped: List[int] = []
+
+            def fail(index: int, err: Exception) -> None:
+                failed.append((index, err))
+
+            run_stages = compose(results.append, fail, stopped.append)
+            for value in values:
+                run_stages(value)
+                if failed or stopped:
+                    break
+
+            if results:
+                forward_batch(results)
+
+            if is_stopped:
+                return
+            if failed:
+                error(*failed[0])
+            elif stopped:
+                complete(stopped[0])
+
+        def on_error(err: Exception) -> None:
+            if not is_stopped:
+                error(0, err)
+
+        def on_completed() -> None:
+            if not is_stopped:
+                complete(0)
+
+        return self.source.subscribe_(head, on_error, on_completed, scheduler, on_next_batch=on_next_batch)
+
+
+def _straight_line(stages: Tuple[FusedStage, ...], start: int) -> Callable[..., Callable[[Any], None]]:
+    """Returns the factory of a function running a run of MAP, FILTER
+    and TAP stages, generated as straight-line code calling the
+    functions of the stages one after the other. Elements that pass
+    all stages are passed on to step, exceptions to fail with the index
+    of the stage following the one that raised."""
+
+    if all(stage.func is None for stage in stages):
+        return lambda step, fail, stop, state, lock: step
+
+    namespace: Dict[str, Any] = {}
+    lines = [
+        "def make(step, fail, stop, state, lock):",
+        "  def run(value):",
+        "    at = %d" % (start + 1),
+        "    try:"
+    ]
+    for offset, stage in enumerate(stages):
+        if stage.func is None:
+            continue
+
+        func = "func%d" % offset
+        namespace[func] = stage.func
+        if stage.kind == MAP:
+            lines.append("        value = %s(value)" % func)
+        elif stage.kind == FILTER:
+            lines.append("        if not %s(value):" % func)
+            lines.append("            return")
+        else:
+            lines.append("        %s(value)" % func)
+        lines.append("        at = %d" % (start + offset + 2))
+
+    lines += [
+        "    except Exception as err:  # pylint: disable=broad-except",
+        "        fail(at, err)",
+        "        return",
+        "    step(value)",
+        "  return run"
+    ]
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["make"]
+
+
+def _stage(stage: FusedStage,
+           index: int,
+           step: Callable[[Any], None],
+           fail: Callable[[int, Exception], None],
+           stop: Callable[[int], None],
+           state: List[Any],
+           lock: threading.RLock
+           ) -> Callable[[Any], None]:
+    """Returns the function running a single TAKE_WHILE, SKIP_WHILE or
+    SCAN stage, which passes the elements it lets through on to step.
+    Exceptions of the stage function are passed to fail with the index
+    of the next stage, and a TAKE_WHILE stage ends the chain by calling
+    stop with the index of the next stage."""
+
+    kind, func, inclusive = stage.kind, stage.func, stage.inclusive
+
+    if kind == SCAN:
+        def run_scan(value: Any) -> None:
+            with lock:
+                accumulation = state[index]
+                try:
+                    accumulation = value if accumulation is NotSet else func(accumulation, value)
+                except Exception as err:  # pylint: disable=broad-except
+                    fail(index + 1, err)
+                    return
+                state[index] = accumulation
+            step(accumulation)
+        return run_scan
+
+    if kind == SKIP_WHILE:
+        def run_skip_while(value: Any) -> None:
+            if state[index]:
+                with lock:
+                    if state[index]:
+                        try:
+                            if func(value):
+                                return
+                        except Exception as err:  # pylint: disable=broad-except
+                            fail(index + 1, err)
+                            return
+                        state[index] = False
+            step(value)
+        return run_skip_while
+
+    def run_take_while(value: Any) -> None:
+        with lock:
+            if not state[index]:
+                return
+            try:
+                running = func(value)
+            except Exception as err:  # pylint: disable=broad-except
+                fail(index + 1, err)
+                return
+            if not running:
+                state[index] = False
+
+        if running:
+            step(value)
+            return
+
+        if inclusive:
+            step(value)
+        stop(index + 1)
+    return run_take_while
+
+
+def fuse(source: Observable, stage: FusedStage) -> Observable:
+    """Applies a fusible stage to the source. If the source is already
+    a fused observable, the stage is appended to its chain instead of
+    wrapping it in yet another observable.
+
+    Args:
+        source: The source observable.
+        stage: The stage to apply.
+
+    Returns:
+        A fused observable running all stages in a single subscription.
+    """
+
+    if isinstance(source, FusedObservable):
+        return FusedObservable(source.source, source.stages + (stage,))
+    return FusedObservable(source, (stage,))
@@ -9,9 +9,9 @@ class GroupedObservable(Observable):
         self.key = key
 
         def subscribe(observer, scheduler=None):
-            return CompositeDisposable(merged_disposable.disposable, underlying_observable.subscribe(observer, scheduler=scheduler))
+            return CompositeDisposable(merged_disposable.disposable, underlying_observable._subscribe_internal(observer, scheduler))
 
         self.underlying_observable = underlying_observable if not merged_disposable else Observable(subscribe)
 
     def _subscribe_core(self, observer, scheduler=None):
-        return self.underlying_observable.subscribe(observer, scheduler=scheduler)
+        return self.underlying_observable._subscribe_internal(observer, scheduler)
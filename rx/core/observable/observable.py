@@ -84,6 +84,7 @@ class Observable(typing.Observable):
             Disposable object representing an observer's subscription to
             the observable sequence.
         """
+        on_next_batch = None
         if observer:
             if isinstance(observer, typing.Observer) \
                     or hasattr(observer, 'on_next') \
@@ -91,15 +92,18 @@ class Observable(typing.Observable):
                 on_next = cast(typing.Observer, observer).on_next
                 on_error = cast(typing.Observer, observer).on_error
                 on_completed = cast(typing.Observer, observer).on_completed
+                on_next_batch = getattr(observer, 'on_next_batch', None)
             else:
                 on_next = observer
-        return self.subscribe_(on_next, on_error, on_completed, scheduler)
+        return self.subscribe_(on_next, on_error, on_completed, scheduler, on_next_batch=on_next_batch)
 
     def subscribe_(self,
                    on_next: Optional[typing.OnNext] = None,
                    on_error: Optional[typing.OnError] = None,
                    on_completed: Optional[typing.OnCompleted] = None,
-                   scheduler: Optional[typing.Scheduler] = None
+                   scheduler: Optional[typing.Scheduler] = None,
+                   *,
+                   on_next_batch: Optional[typing.OnNextBatch] = None
                    ) -> typing.Disposable:
         """Subscribe callbacks to the observable sequence.
 
@@ -116,13 +120,16 @@ class Observable(typing.Observable):
             on_completed: [Optional] Action to invoke upon graceful termination
                 of the observable sequence.
             scheduler: [Optional] The scheduler to use for this subscription.
+            on_next_batch: [Optional] Action to invoke for a batch of
+                elements pushed by a batching source. If not given,
+                batches are delivered element by element to on_next.
 
         Returns:
             Disposable object representing an observer's subscription to
             the observable sequence.
         """
 
-        auto_detach_observer = AutoDetachObserver(on_next, on_error, on_completed)
+        auto_detach_observer = AutoDetachObserver(on_next, on_error, on_completed, on_next_batch)
 
         def fix_subscriber(subscriber):
             """Fixes subscriber to make sure it returns a Disposable instead
@@ -158,6 +165,50 @@ class Observable(typing.Observable):
         # Hide the identity of the auto detach observer
         return Disposable(auto_detach_observer.dispose)
 
+    def _subscribe_internal(self,
+                            observer: typing.Observer,
+                            scheduler: Optional[typing.Scheduler] = None
+                            ) -> typing.Disposable:
+        """Subscribe an internal observer to the observable sequence.
+
+        Used by operators instead of :func:`subscribe_` when the
+        observer already enforces the observer grammar, e.g. the auto
+        detach observer the operator was itself subscribed with. The
+        observer is handed directly to the subscription function, so
+        the auto detach observer, subscriber fixing and identity hiding
+        of :func:`subscribe_` are only paid once for the outermost
+        subscription. If no trampoline is running on the current
+        thread, the subscription falls back to :func:`subscribe_` so it
+        is still set up on the trampoline.
+
+        Args:
+            observer: The observer to subscribe. Must implement
+                :code:`fail` like :class:`AutoDetachObserver` and
+                :class:`Observer <rx.core.Observer>` do.
+            scheduler: [Optional] The scheduler to use for this
+                subscription.
+
+        Returns:
+            Disposable object representing the subscription to the
+            observable sequence.
+        """
+
+        if CurrentThreadScheduler.singleton().schedule_required():
+            return self.subscribe_(observer.on_next, observer.on_error, observer.on_completed, scheduler,
+                                   on_next_batch=getattr(observer, 'on_next_batch', None))
+
+        try:
+            subscriber = self._subscribe_core(observer, scheduler)
+        except Exception as ex:  # By design. pylint: disable=W0703
+            if not observer.fail(ex):
+                raise
+            return Disposable()
+
+        if not hasattr(subscriber, 'dispose'):
+            subscriber = Disposable(subscriber)
+
+        return subscriber
+
     @overload
     def pipe(self,
              *operators: Callable[['Observable'], 'Observable']
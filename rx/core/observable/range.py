@@ -1,3 +1,4 @@
+from itertools import islice
 from sys import maxsize
 from typing import Optional
 
@@ -5,12 +6,14 @@ from rx.core import typing
 from rx.core import Observable
 from rx.scheduler import CurrentThreadScheduler
 from rx.disposable import MultipleAssignmentDisposable
+from rx.internal.utils import batch_emitter
 
 
 def _range(start: int,
            stop: Optional[int] = None,
            step: Optional[int] = None,
-           scheduler: Optional[typing.Scheduler] = None
+           scheduler: Optional[typing.Scheduler] = None,
+           batch_size: Optional[int] = None
            ) -> Observable:
     """Generates an observable sequence of integral numbers within a
     specified range, using the specified scheduler to send out observer
@@ -20,11 +23,14 @@ def _range(start: int,
         >>> res = range(10)
         >>> res = range(0, 10)
         >>> res = range(0, 10, 1)
+        >>> res = range(0, 1000000, batch_size=1000)
 
     Args:
         start: The value of the first integer in the sequence.
         count: The number of sequential integers to generate.
         scheduler: The scheduler to schedule the values on.
+        batch_size: [Optional] If given, values are pushed in lists of
+            up to batch_size elements through on_next_batch.
 
     Returns:
         An observable sequence that contains a range of sequential
@@ -54,6 +60,18 @@ def _range(start: int,
             except StopIteration:
                 observer.on_completed()
 
-        sd.disposable = _scheduler.schedule(action, iter(range_t))
+        def action_batch(scheduler, iterator):
+            batch = list(islice(iterator, batch_size))
+            if batch:
+                on_next_batch(batch)
+                sd.disposable = _scheduler.schedule(action_batch, state=iterator)
+            else:
+                observer.on_completed()
+
+        if batch_size:
+            on_next_batch = batch_emitter(observer)
+            sd.disposable = _scheduler.schedule(action_batch, iter(range_t))
+        else:
+            sd.disposable = _scheduler.schedule(action, iter(range_t))
         return sd
     return Observable(subscribe)
@@ -3,6 +3,7 @@ from typing import Optional, List
 from rx import from_future
 from rx.core import Observable, typing
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal import RingBuffer
 from rx.internal.utils import is_future
 
 # pylint: disable=redefined-builtin
@@ -28,25 +29,36 @@ def _zip(*args: Observable) -> Observable:
 
     def subscribe(observer: typing.Observer, scheduler: Optional[typing.Scheduler] = None):
         n = len(sources)
-        queues : List[List] = [[] for _ in range(n)]
+        queues: List[RingBuffer] = [RingBuffer() for _ in range(n)]
         is_done = [False] * n
+        ready_count = 0  # Number of non-empty queues
+        done_count = 0
 
         def next(i):
-            if all([len(q) for q in queues]):
+            nonlocal ready_count
+
+            if ready_count == n:
                 try:
-                    queued_values = [x.pop(0) for x in queues]
-                    res = tuple(queued_values)
+                    res = tuple([q.dequeue() for q in queues])
                 except Exception as ex:  # pylint: disable=broad-except
                     observer.on_error(ex)
                     return
 
+                for q in queues:
+                    if not q:
+                        ready_count -= 1
+
                 observer.on_next(res)
-            elif all([x for j, x in enumerate(is_done) if j != i]):
+            elif done_count - is_done[i] == n - 1:
                 observer.on_completed()
 
         def done(i):
-            is_done[i] = True
-            if all(is_done):
+            nonlocal done_count
+
+            if not is_done[i]:
+                is_done[i] = True
+                done_count += 1
+            if done_count == n:
                 observer.on_completed()
 
         subscriptions = [None]*n
@@ -57,7 +69,12 @@ def _zip(*args: Observable) -> Observable:
             source = from_future(source) if is_future(source) else source
 
             def on_next(x):
-                queues[i].append(x)
+                nonlocal ready_count
+
+                queue = queues[i]
+                if not queue:
+                    ready_count += 1
+                queue.enqueue(x)
                 next(i)
 
             sad.disposable = source.subscribe_(on_next, observer.on_error, lambda: done(i), scheduler)
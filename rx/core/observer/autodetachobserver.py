@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from rx.internal import noop, default_error
 from rx.disposable import SingleAssignmentDisposable
@@ -11,11 +11,13 @@ class AutoDetachObserver(typing.Observer):
     def __init__(self,
                  on_next: Optional[typing.OnNext] = None,
                  on_error: Optional[typing.OnError] = None,
-                 on_completed: Optional[typing.OnCompleted] = None
+                 on_completed: Optional[typing.OnCompleted] = None,
+                 on_next_batch: Optional[typing.OnNextBatch] = None
                  ) -> None:
         self._on_next = on_next or noop
         self._on_error = on_error or default_error
         self._on_completed = on_completed or noop
+        self._on_next_batch = on_next_batch
 
         self._subscription = SingleAssignmentDisposable()
         self.is_stopped = False
@@ -25,6 +27,20 @@ class AutoDetachObserver(typing.Observer):
             return
         self._on_next(value)
 
+    def on_next_batch(self, values: List[Any]) -> None:
+        if self.is_stopped:
+            return
+
+        if self._on_next_batch is not None:
+            self._on_next_batch(values)
+            return
+
+        on_next = self._on_next
+        for value in values:
+            if self.is_stopped:
+                return
+            on_next(value)
+
     def on_error(self, error) -> None:
         if self.is_stopped:
             return
@@ -1,12 +1,96 @@
-from typing import Any
+import threading
+from typing import Any, List, Optional
 
-from .scheduledobserver import ScheduledObserver
+from rx.core import typing
+from rx.internal import BufferOverflowException
+
+from .scheduledobserver import ScheduledObserver, ON_NEXT
+
+OVERFLOW_STRATEGIES = ('block', 'drop_newest', 'drop_oldest', 'latest', 'error')
 
 
 class ObserveOnObserver(ScheduledObserver):
+    """Scheduled observer for observe_on. With a buffer_size at most
+    buffer_size elements are queued, and the overflow strategy decides
+    what happens to an element arriving at a full queue:
+
+    - block: Wait until the consumer has made room. The producer must
+      not run on the thread of the scheduler.
+    - drop_newest: Discard the arriving element.
+    - drop_oldest: Discard the oldest queued element.
+    - latest: Replace the newest queued element.
+    - error: Terminate the sequence with a BufferOverflowException.
+    """
+
+    def __init__(self,
+                 scheduler: typing.Scheduler,
+                 observer: typing.Observer,
+                 budget: Optional[int] = None,
+                 buffer_size: Optional[int] = None,
+                 overflow: str = 'block'
+                 ) -> None:
+        super().__init__(scheduler, observer, budget)
+
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        self.not_full = threading.Condition(self.lock)
+
+        # Elements are taken one at a time, so the queue and the element
+        # being delivered never hold more than buffer_size + 1 elements,
+        # and the overflow strategy applies to all but that one.
+        if buffer_size is not None:
+            self.take_limit = 1
 
     def _on_next_core(self, value: Any) -> None:
-        super()._on_next_core(value)
+        if self.buffer_size is None:
+            super()._on_next_core(value)
+        elif not self._enqueue_bounded(value):
+            return
+        self.ensure_active()
+
+    def _enqueue_bounded(self, value: Any) -> bool:
+        queue = self.queue
+        buffer_size = self.buffer_size
+        overflow = self.overflow
+
+        with self.lock:
+            if len(queue) < buffer_size:
+                queue.enqueue((ON_NEXT, value))
+                return True
+
+            if overflow == 'drop_newest':
+                return False
+
+            if overflow == 'drop_oldest':
+                queue.dequeue()
+                queue.enqueue((ON_NEXT, value))
+                return True
+
+            if overflow == 'latest':
+                queue[-1] = (ON_NEXT, value)
+                return True
+
+            if overflow == 'block':
+                while len(queue) >= buffer_size and not self.is_disposed:
+                    self.not_full.wait()
+                if self.is_disposed:
+                    return False
+                queue.enqueue((ON_NEXT, value))
+                return True
+
+        self.on_error(BufferOverflowException())
+        return False
+
+    def on_next_batch(self, values: List[Any]) -> None:
+        if self.buffer_size is None:
+            super().on_next_batch(values)
+            return
+
+        for value in values:
+            self.on_next(value)
+
+    def _on_next_batch_core(self, values: List[Any]) -> None:
+        super()._on_next_batch_core(values)
         self.ensure_active()
 
     def _on_error_core(self, error: Exception) -> None:
@@ -16,3 +100,11 @@ class ObserveOnObserver(ScheduledObserver):
     def _on_completed_core(self) -> None:
         super()._on_completed_core()
         self.ensure_active()
+
+    def _on_dequeued(self) -> None:
+        self.not_full.notify_all()
+
+    def dispose(self) -> None:
+        super().dispose()
+        with self.lock:
+            self.not_full.notify_all()
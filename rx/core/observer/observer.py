@@ -1,4 +1,4 @@
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional
 
 from .. import typing
 from rx.internal import noop, default_error
@@ -31,6 +31,17 @@ class Observer(typing.Observer, typing.Disposable):
         """
         self._handler_on_next(value)
 
+    def on_next_batch(self, values: List[Any]) -> None:
+        """Notify the observer of a batch of new elements in the
+        sequence. Unless overridden, each element is delivered through
+        `on_next()`.
+
+        Args:
+            values: The elements, in order.
+        """
+        for value in values:
+            self.on_next(value)
+
     def on_error(self, error: Exception) -> None:
         """Notify the observer that an exception has occurred.
 
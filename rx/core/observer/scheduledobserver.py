@@ -1,42 +1,68 @@
 import threading
-from typing import List, Any
+from typing import Any, List, Optional, Tuple
 
 from rx.core import typing
 from rx.disposable import SerialDisposable
+from rx.internal import RingBuffer
 
 from .observer import Observer
 
+ON_NEXT = 0
+ON_NEXT_BATCH = 1
+ON_ERROR = 2
+ON_COMPLETED = 3
+
 
 class ScheduledObserver(Observer):
-    def __init__(self, scheduler: typing.Scheduler, observer: typing.Observer) -> None:
+    """Observer that queues the notifications and delivers them to the
+    wrapped observer on a scheduler.
+
+    Each scheduled invocation drains all queued notifications, or at
+    most budget of them before yielding back to the scheduler. The
+    elements of a batch count one by one against the budget.
+    """
+
+    def __init__(self,
+                 scheduler: typing.Scheduler,
+                 observer: typing.Observer,
+                 budget: Optional[int] = None
+                 ) -> None:
         super().__init__()
 
         self.scheduler = scheduler
         self.observer = observer
+        self.budget = budget
+        # Maximum number of notifications taken from the queue at once.
+        self.take_limit: Optional[int] = None
 
         self.lock = threading.RLock()
         self.is_acquired = False
         self.has_faulted = False
-        self.queue: List[typing.Action] = []
+        self.is_disposed = False
+        self.queue: RingBuffer[Tuple[int, Any]] = RingBuffer()
         self.disposable = SerialDisposable()
 
-        # Note to self: list append is thread safe
-        # http://effbot.org/pyfaq/what-kinds-of-global-value-mutation-are-thread-safe.htm
+        # Note to self: deque append is thread safe
 
     def _on_next_core(self, value: Any) -> None:
-        def action():
-            self.observer.on_next(value)
-        self.queue.append(action)
+        self.queue.enqueue((ON_NEXT, value))
+
+    def on_next_batch(self, values: List[Any]) -> None:
+        if not self.is_stopped:
+            self._on_next_batch_core(values)
+
+    def _on_next_batch_core(self, values: List[Any]) -> None:
+        self.queue.enqueue((ON_NEXT_BATCH, (values, 0)))
 
     def _on_error_core(self, error: Exception) -> None:
-        def action():
-            self.observer.on_error(error)
-        self.queue.append(action)
+        self.queue.enqueue((ON_ERROR, error))
 
     def _on_completed_core(self) -> None:
-        def action():
-            self.observer.on_completed()
-        self.queue.append(action)
+        self.queue.enqueue((ON_COMPLETED, None))
+
+    def _on_dequeued(self) -> None:
+        """Called with the lock held whenever items have been taken
+        from the queue."""
 
     def ensure_active(self) -> None:
         is_owner = False
@@ -49,26 +75,85 @@ class ScheduledObserver(Observer):
         if is_owner:
             self.disposable.disposable = self.scheduler.schedule(self.run)
 
+    def _take(self, limit: Optional[int]) -> Tuple[List[Tuple[int, Any]], int]:
+        """Takes notifications from the queue, at most limit elements
+        of them. Should be called under the lock.
+
+        Returns:
+            The notifications, where batches are given as (values,
+            start, stop), and the number of elements taken.
+        """
+
+        queue = self.queue
+        items: List[Tuple[int, Any]] = []
+        count = 0
+        while queue and (limit is None or count < limit):
+            kind, value = queue.dequeue()
+            if kind == ON_NEXT_BATCH:
+                values, start = value
+                stop = len(values)
+                if limit is not None and stop - start > limit - count:
+                    # Put the rest of the batch back for the next round.
+                    stop = start + limit - count
+                    queue.requeue((ON_NEXT_BATCH, (values, stop)))
+                items.append((kind, (values, start, stop)))
+                count += stop - start
+            else:
+                items.append((kind, value))
+                count += 1
+        return items, count
+
     def run(self, scheduler: typing.Scheduler, state: typing.TState) -> None:
-        parent = self
+        queue = self.queue
+        observer = self.observer
+        budget = self.budget
+
+        processed = 0
+        while budget is None or processed < budget:
+            with self.lock:
+                if not queue or self.is_disposed:
+                    self.is_acquired = False
+                    return
+
+                limit = None if budget is None else budget - processed
+                if self.take_limit is not None:
+                    limit = self.take_limit if limit is None else min(limit, self.take_limit)
+                items, count = self._take(limit)
+                self._on_dequeued()
+
+            try:
+                for kind, value in items:
+                    if self.is_disposed:
+                        break
+
+                    if kind == ON_NEXT:
+                        observer.on_next(value)
+                    elif kind == ON_NEXT_BATCH:
+                        values, start, stop = value
+                        for i in range(start, stop):
+                            if self.is_disposed:
+                                break
+                            observer.on_next(values[i])
+                    elif kind == ON_ERROR:
+                        observer.on_error(value)
+                    else:
+                        observer.on_completed()
+            except Exception:
+                with self.lock:
+                    queue.clear()
+                    self.has_faulted = True
+                raise
+
+            processed += count
 
         with self.lock:
-            if parent.queue:
-                work = parent.queue.pop(0)
-            else:
-                parent.is_acquired = False
+            if not queue or self.is_disposed:
+                self.is_acquired = False
                 return
 
-        try:
-            work()
-        except Exception:
-            with self.lock:
-                parent.queue = []
-                parent.has_faulted = True
-            raise
-
-        self.scheduler.schedule(self.run)
+        self.disposable.disposable = self.scheduler.schedule(self.run)
 
     def dispose(self) -> None:
         super().dispose()
+        self.is_disposed = True
         self.disposable.dispose()
@@ -15,7 +15,7 @@ def _as_observable() -> Callable[[Observable], Observable]:
         """
 
         def subscribe(observer, scheduler=None):
-            return source.subscribe(observer, scheduler=scheduler)
+            return source._subscribe_internal(observer, scheduler)
 
         return Observable(subscribe)
     return as_observable
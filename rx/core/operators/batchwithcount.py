@@ -0,0 +1,65 @@
+from typing import Any, Callable, List
+
+from rx.core import Observable
+from rx.internal import ArgumentOutOfRangeException
+from rx.internal.utils import batch_emitter
+
+
+def _batch_with_count(count: int) -> Callable[[Observable], Observable]:
+    if count <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def batch_with_count(source: Observable) -> Observable:
+        """Partially applied batch_with_count operator.
+
+        Collects the elements of the source into lists of count
+        elements and pushes each list downstream in a single
+        on_next_batch call.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            An observable sequence with the same elements as the
+            source, delivered in batches.
+        """
+
+        def subscribe(observer, scheduler=None):
+            on_next_batch = batch_emitter(observer)
+            batch: List[Any] = []
+
+            def flush() -> None:
+                nonlocal batch
+                if batch:
+                    values, batch = batch, []
+                    on_next_batch(values)
+
+            def on_next(value: Any) -> None:
+                batch.append(value)
+                if len(batch) >= count:
+                    flush()
+
+            def on_next_batch_(values: List[Any]) -> None:
+                nonlocal batch
+                batch.extend(values)
+                if len(batch) < count:
+                    return
+
+                # Slicing off the front repeatedly would copy the rest of
+                # the list for every batch.
+                end = len(batch) - len(batch) % count
+                pending, batch = batch, batch[end:]
+                for i in range(0, end, count):
+                    on_next_batch(pending[i:i + count])
+
+            def on_error(error: Exception) -> None:
+                flush()
+                observer.on_error(error)
+
+            def on_completed() -> None:
+                flush()
+                observer.on_completed()
+
+            return source.subscribe_(on_next, on_error, on_completed, scheduler, on_next_batch=on_next_batch_)
+        return Observable(subscribe)
+    return batch_with_count
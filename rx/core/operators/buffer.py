@@ -1,7 +1,8 @@
-from typing import Callable, Optional, Any
+from typing import Any, Callable, List, Optional
 
 from rx import operators as ops
 from rx.core import Observable, pipe
+from rx.internal import ArgumentOutOfRangeException, RingBuffer
 
 
 def _buffer(boundaries: Observable) -> Callable[[Observable], Observable]:
@@ -46,17 +47,59 @@ def _buffer_with_count(count: int, skip: Optional[int] = None) -> Callable[[Obse
         observable sequence of buffers.
     """
 
-    def buffer_with_count(source: Observable) -> Observable:
-        nonlocal skip
-
-        if skip is None:
-            skip = count
+    if count <= 0:
+        raise ArgumentOutOfRangeException()
 
-        def mapper(value):
-            return value.pipe(ops.to_iterable(), ops.map(list))
+    if skip is None:
+        skip = count
 
-        def predicate(value):
-            return len(value) > 0
+    if skip <= 0:
+        raise ArgumentOutOfRangeException()
 
-        return source.pipe(ops.window_with_count(count, skip), ops.flat_map(mapper), ops.filter(predicate))
+    def buffer_with_count(source: Observable) -> Observable:
+        def subscribe(observer, scheduler=None):
+            if skip == count:
+                buffer: List[Any] = []
+
+                def on_next(x: Any) -> None:
+                    nonlocal buffer
+
+                    buffer.append(x)
+                    if len(buffer) == count:
+                        values, buffer = buffer, []
+                        observer.on_next(values)
+
+                def on_completed() -> None:
+                    if buffer:
+                        observer.on_next(buffer)
+                    observer.on_completed()
+
+            else:
+                n = 0
+                q: RingBuffer[List[Any]] = RingBuffer()
+                q.enqueue([])
+
+                def on_next(x: Any) -> None:
+                    nonlocal n
+
+                    for values in q:
+                        values.append(x)
+
+                    c = n - count + 1
+                    if c >= 0 and c % skip == 0:
+                        observer.on_next(q.dequeue())
+
+                    n += 1
+                    if n % skip == 0:
+                        q.enqueue([])
+
+                def on_completed() -> None:
+                    while q:
+                        values = q.dequeue()
+                        if values:
+                            observer.on_next(values)
+                    observer.on_completed()
+
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
+        return Observable(subscribe)
     return buffer_with_count
@@ -1,7 +1,11 @@
-from typing import Callable, Optional
+from typing import Any, Callable, List, Optional
+from datetime import timedelta
 
-from rx import operators as ops
-from rx.core import Observable, pipe, typing
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SerialDisposable
+from rx.internal import RingBuffer
+from rx.internal.constants import DELTA_ZERO
+from rx.scheduler import TimeoutScheduler
 
 
 def _buffer_with_time(timespan: typing.RelativeTime, timeshift: Optional[typing.RelativeTime] = None,
@@ -9,7 +13,102 @@ def _buffer_with_time(timespan: typing.RelativeTime, timeshift: Optional[typing.
     if not timeshift:
         timeshift = timespan
 
-    return pipe(
-        ops.window_with_time(timespan, timeshift, scheduler),
-        ops.flat_map(lambda x: x.pipe(ops.to_iterable()))
-    )
+    if not isinstance(timespan, timedelta):
+        timespan = timedelta(seconds=timespan)
+    if not isinstance(timeshift, timedelta):
+        timeshift = timedelta(seconds=timeshift)
+
+    def buffer_with_time(source: Observable) -> Observable:
+        """Partially applied buffer_with_time operator.
+
+        Collects the elements of the source into lists. The list of the
+        current buffer is emitted and replaced by a new one when the
+        timer fires, so no window is created per buffer.
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            An observable sequence of buffers.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+            if timespan == timeshift:
+                buffer: List[Any] = []
+
+                def tick(state: Any = None) -> None:
+                    nonlocal buffer
+
+                    with source.lock:
+                        values, buffer = buffer, []
+                        observer.on_next(values)
+
+                timer: typing.Disposable = _scheduler.schedule_periodic(timespan, tick)
+
+                def on_next(x: Any) -> None:
+                    with source.lock:
+                        buffer.append(x)
+
+                def on_completed() -> None:
+                    with source.lock:
+                        observer.on_next(buffer)
+                        observer.on_completed()
+
+            else:
+                timer = SerialDisposable()
+                next_shift = timeshift
+                next_span = timespan
+                total_time = DELTA_ZERO
+                q: RingBuffer[List[Any]] = RingBuffer()
+
+                def create_timer() -> None:
+                    nonlocal next_shift, next_span, total_time
+
+                    is_span = next_span <= next_shift
+                    is_shift = next_shift <= next_span
+
+                    new_total_time = next_span if is_span else next_shift
+
+                    ts = new_total_time - total_time
+                    total_time = new_total_time
+                    if is_span:
+                        next_span += timeshift
+
+                    if is_shift:
+                        next_shift += timeshift
+
+                    def action(scheduler: typing.Scheduler, state: Any = None) -> None:
+                        with source.lock:
+                            if is_shift:
+                                q.enqueue([])
+
+                            if is_span:
+                                observer.on_next(q.dequeue())
+
+                        create_timer()
+                    timer.disposable = _scheduler.schedule_relative(ts, action)
+
+                q.enqueue([])
+                create_timer()
+
+                def on_next(x: Any) -> None:
+                    with source.lock:
+                        for values in q:
+                            values.append(x)
+
+                def on_completed() -> None:
+                    with source.lock:
+                        while q:
+                            observer.on_next(q.dequeue())
+                        observer.on_completed()
+
+            def on_error(error: Exception) -> None:
+                with source.lock:
+                    observer.on_error(error)
+
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler_)
+            return CompositeDisposable(timer, subscription)
+        return Observable(subscribe)
+    return buffer_with_time
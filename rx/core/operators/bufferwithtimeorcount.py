@@ -1,11 +1,71 @@
-from typing import Callable
+from typing import Any, Callable, List, Optional
 
-from rx import operators as ops
-from rx.core import Observable, pipe
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, SerialDisposable
+from rx.scheduler import TimeoutScheduler
 
 
-def _buffer_with_time_or_count(timespan, count, scheduler = None) -> Callable[[Observable], Observable]:
-    return pipe(
-        ops.window_with_time_or_count(timespan, count, scheduler),
-        ops.flat_map(lambda x: x.pipe(ops.to_iterable()))
-    )
+def _buffer_with_time_or_count(timespan: typing.RelativeTime, count: int, scheduler: Optional[typing.Scheduler] = None
+                               ) -> Callable[[Observable], Observable]:
+    def buffer_with_time_or_count(source: Observable) -> Observable:
+        """Partially applied buffer_with_time_or_count operator.
+
+        Collects the elements of the source into lists, emitted when
+        count elements have been collected or timespan has passed since
+        the buffer was started, whichever comes first.
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            An observable sequence of buffers.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+            span = _scheduler.to_timedelta(timespan)
+
+            buffer: List[Any] = []
+            started = _scheduler.now
+            timer = SerialDisposable()
+
+            def flush() -> None:
+                nonlocal buffer, started
+
+                values, buffer = buffer, []
+                started = _scheduler.now
+                observer.on_next(values)
+
+            def action(scheduler: typing.Scheduler, state: Any = None) -> None:
+                # A buffer emitted for being full does not restart the
+                # timer, so it may fire early for the current buffer.
+                with source.lock:
+                    elapsed = _scheduler.now - started
+                    if elapsed < span:
+                        timer.disposable = _scheduler.schedule_relative(span - elapsed, action)
+                        return
+
+                    flush()
+                    timer.disposable = _scheduler.schedule_relative(span, action)
+
+            timer.disposable = _scheduler.schedule_relative(span, action)
+
+            def on_next(x: Any) -> None:
+                with source.lock:
+                    buffer.append(x)
+                    if len(buffer) == count:
+                        flush()
+
+            def on_error(error: Exception) -> None:
+                with source.lock:
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with source.lock:
+                    observer.on_next(buffer)
+                    observer.on_completed()
+
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler_)
+            return CompositeDisposable(timer, subscription)
+        return Observable(subscribe)
+    return buffer_with_time_or_count
@@ -4,7 +4,7 @@ import rx
 from rx.core import Observable, typing
 
 
-def _combine_latest(*others: Observable) -> Callable[[Observable], Observable]:
+def _combine_latest(*others: Observable, snapshot: bool = False) -> Callable[[Observable], Observable]:
     def combine_latest(source: Observable) -> Observable:
         """Merges the specified observable sequences into one
         observable sequence by creating a tuple whenever any
@@ -20,5 +20,5 @@ def _combine_latest(*others: Observable) -> Callable[[Observable], Observable]:
 
         sources = (source,) + others
 
-        return rx.combine_latest(*sources)
+        return rx.combine_latest(*sources, snapshot=snapshot)
     return combine_latest
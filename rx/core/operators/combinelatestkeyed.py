@@ -0,0 +1,129 @@
+import weakref
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional
+
+from rx.core import Observable, GroupedObservable, typing
+from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+
+
+class CombineLatestKeyedSnapshot(Mapping):
+    """A read-only mapping of the latest value of every key of
+    combine_latest_keyed.
+
+    Snapshots share the dictionary of values with combine_latest_keyed.
+    The dictionary is only copied when a new value arrives while a
+    previous snapshot is still referenced, so a snapshot never changes.
+    That copy is O(n) in the number of keys, so consumers holding on to
+    every snapshot pay for a full copy per update.
+    """
+
+    __slots__ = ('_values', '__weakref__')
+
+    def __init__(self, values: Dict[Any, Any]) -> None:
+        self._values = values
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __contains__(self, key) -> bool:
+        return key in self._values
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CombineLatestKeyedSnapshot):
+            return self._values == other._values
+        if isinstance(other, dict):
+            return self._values == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return 'CombineLatestKeyedSnapshot(%r)' % (self._values,)
+
+
+def _combine_latest_keyed() -> Callable[[Observable], Observable]:
+    def combine_latest_keyed(source: Observable) -> Observable:
+        """Keeps the latest value of every keyed inner observable
+        sequence of the source, and emits an update for every value of
+        an inner sequence.
+
+        Examples:
+            >>> res = combine_latest_keyed()(source)
+
+        Args:
+            source: Observable sequence of (key, observable) pairs or
+                of grouped observables.
+
+        Returns:
+            An observable sequence of (key, value, snapshot) tuples.
+        """
+
+        def subscribe(observer: typing.Observer,
+                      scheduler: Optional[typing.Scheduler] = None
+                      ) -> CompositeDisposable:
+            group = CompositeDisposable()
+            m = SingleAssignmentDisposable()
+            group.add(m)
+
+            values: Dict[Any, Any] = {}
+            last_snapshot: Optional[weakref.ReferenceType] = None
+            is_stopped = False
+
+            def on_next_inner(key: Any, value: Any) -> None:
+                nonlocal values, last_snapshot
+
+                with source.lock:
+                    if last_snapshot is not None:
+                        if last_snapshot() is not None:
+                            values = values.copy()
+                        last_snapshot = None
+                    values[key] = value
+
+                    snapshot = CombineLatestKeyedSnapshot(values)
+                    last_snapshot = weakref.ref(snapshot)
+                    observer.on_next((key, value, snapshot))
+
+            def on_error(error: Exception) -> None:
+                with source.lock:
+                    observer.on_error(error)
+
+            def on_next(item: Any) -> None:
+                if isinstance(item, GroupedObservable):
+                    key, inner_source = item.key, item
+                else:
+                    key, inner_source = item
+
+                inner_subscription = SingleAssignmentDisposable()
+                group.add(inner_subscription)
+
+                def on_completed() -> None:
+                    with source.lock:
+                        group.remove(inner_subscription)
+                        if is_stopped and len(group) == 1:
+                            observer.on_completed()
+
+                inner_subscription.disposable = inner_source.subscribe_(
+                    lambda value: on_next_inner(key, value),
+                    on_error,
+                    on_completed,
+                    scheduler
+                )
+
+            def on_completed() -> None:
+                nonlocal is_stopped
+
+                with source.lock:
+                    is_stopped = True
+                    if len(group) == 1:
+                        observer.on_completed()
+
+            m.disposable = source.subscribe_(on_next, on_error, on_completed, scheduler)
+            return group
+        return Observable(subscribe)
+    return combine_latest_keyed
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from rx import operators as ops
 from rx.core import Observable, typing
+from rx.internal import RingBuffer
 from rx.internal.constants import DELTA_ZERO
 from rx.disposable import CompositeDisposable, SerialDisposable, MultipleAssignmentDisposable
 from rx.scheduler import TimeoutScheduler
@@ -31,19 +32,19 @@ def observable_delay_timespan(source: Observable, duetime: typing.RelativeTime,
         exception = [None]
         active = [False]
         running = [False]
-        queue = []
+        queue = RingBuffer()
 
         def on_next(notification):
             should_run = False
 
             with source.lock:
                 if notification.value.kind == 'E':
-                    del queue[:]
-                    queue.append(notification)
+                    queue.clear()
+                    queue.enqueue(notification)
                     exception[0] = notification.value.exception
                     should_run = not running[0]
                 else:
-                    queue.append(Timestamp(value=notification.value, timestamp=notification.timestamp + duetime))
+                    queue.enqueue(Timestamp(value=notification.value, timestamp=notification.timestamp + duetime))
                     should_run = not active[0]
                     active[0] = True
 
@@ -62,8 +63,8 @@ def observable_delay_timespan(source: Observable, duetime: typing.RelativeTime,
                             running[0] = True
                             while True:
                                 result = None
-                                if queue and queue[0].timestamp <= scheduler.now:
-                                    result = queue.pop(0).value
+                                if queue and queue.peek().timestamp <= scheduler.now:
+                                    result = queue.dequeue().value
 
                                 if result:
                                     result.accept(observer)
@@ -75,7 +76,7 @@ def observable_delay_timespan(source: Observable, duetime: typing.RelativeTime,
                             recurse_duetime = 0
                             if queue:
                                 should_continue = True
-                                diff = queue[0].timestamp - scheduler.now
+                                diff = queue.peek().timestamp - scheduler.now
                                 zero = DELTA_ZERO if isinstance(diff, timedelta) else 0
                                 recurse_duetime = max(zero, diff)
                             else:
@@ -1,32 +1,175 @@
-from typing import Callable, Optional
-from rx.core import Observable
+import math
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Optional, Tuple
+
+from rx.core import Observable, typing
 from rx.core.typing import Mapper, Comparer
+from rx.internal import ArgumentOutOfRangeException
 from rx.internal.basic import default_comparer
+from rx.scheduler import TimeoutScheduler
+
+
+class ComparerSet:
+    """Set of keys compared with a custom comparer. Membership is
+    tested with a linear scan."""
+
+    def __init__(self, comparer: Comparer,
+                 max_keys: Optional[int] = None,
+                 ttl: Optional[timedelta] = None,
+                 clock: Optional[Callable[[], datetime]] = None
+                 ) -> None:
+        self.comparer = comparer
+        self.max_keys = max_keys
+        self.ttl = ttl
+        self.clock = clock
+        self.keys: Deque[Tuple[Any, Optional[datetime]]] = deque()
+
+    def push(self, value: Any) -> bool:
+        keys = self.keys
+        expires = None
+        if self.ttl is not None:
+            now = self.clock()
+            while keys and keys[0][1] <= now:
+                keys.popleft()
+            expires = now + self.ttl
 
+        comparer = self.comparer
+        for index, (key, _) in enumerate(keys):
+            if comparer(key, value):
+                if self.max_keys is not None or expires is not None:
+                    del keys[index]
+                    keys.append((key, expires))
+                return False
 
-def array_index_of_comparer(array, item, comparer):
-    for i, a in enumerate(array):
-        if comparer(a, item):
-            return i
-    return -1
+        keys.append((value, expires))
+        if self.max_keys is not None and len(keys) > self.max_keys:
+            keys.popleft()
+        return True
 
 
 class HashSet:
-    def __init__(self, comparer):
-        self.comparer = comparer
-        self.set = []
+    """Set of hashable keys. Unhashable keys are kept apart and
+    compared for equality with a linear scan."""
+
+    def __init__(self) -> None:
+        self.keys = set()
+        self.unhashable = ComparerSet(default_comparer)
+
+    def push(self, value: Any) -> bool:
+        keys = self.keys
+        try:
+            if value in keys:
+                return False
+            keys.add(value)
+            return True
+        except TypeError:
+            return self.unhashable.push(value)
+
+
+class LruHashSet:
+    """Set of hashable keys that forgets the least recently seen key
+    beyond max_keys keys, and any key not seen for ttl."""
+
+    def __init__(self, max_keys: Optional[int] = None,
+                 ttl: Optional[timedelta] = None,
+                 clock: Optional[Callable[[], datetime]] = None
+                 ) -> None:
+        self.max_keys = max_keys
+        self.ttl = ttl
+        self.clock = clock
+        self.keys: 'OrderedDict[Any, Optional[datetime]]' = OrderedDict()
+
+    def push(self, value: Any) -> bool:
+        keys = self.keys
+        expires = None
+        if self.ttl is not None:
+            now = self.clock()
+            while keys and next(iter(keys.values())) <= now:
+                keys.popitem(last=False)
+            expires = now + self.ttl
+
+        if value in keys:
+            keys.move_to_end(value)
+            keys[value] = expires
+            return False
+
+        keys[value] = expires
+        if self.max_keys is not None and len(keys) > self.max_keys:
+            keys.popitem(last=False)
+        return True
 
-    def push(self, value):
-        ret_value = array_index_of_comparer(self.set, value, self.comparer) == -1
-        if ret_value:
-            self.set.append(value)
-        return ret_value
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+class BloomFilter:
+    """Probabilistic set of hashable keys in bounded memory.
+
+    Two Bloom filters sized for capacity keys each are kept. Keys are
+    added to the current filter and looked up in both. When the current
+    filter holds capacity keys it replaces the previous one, so a key is
+    remembered for at least capacity subsequent distinct keys. A new key
+    is mistaken for a duplicate with a probability of at most about
+    twice false_positive_rate.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001) -> None:
+        if capacity <= 0 or not 0.0 < false_positive_rate < 1.0:
+            raise ArgumentOutOfRangeException()
+
+        self.capacity = capacity
+        self.size = max(8, int(math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.current = bytearray((self.size + 7) // 8)
+        self.previous = bytearray(len(self.current))
+        self.count = 0
+
+    def _indices(self, value: Any) -> Any:
+        # SplitMix64 finalizer, so that e.g. consecutive integers, which
+        # hash to themselves, spread over the whole filter.
+        h = hash(value) & _MASK64
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+        h ^= h >> 31
+
+        size = self.size
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def push(self, value: Any) -> bool:
+        indices = self._indices(value)
+        current, previous = self.current, self.previous
+
+        if all(current[i >> 3] & (1 << (i & 7)) for i in indices):
+            return False
+        if all(previous[i >> 3] & (1 << (i & 7)) for i in indices):
+            return False
+
+        for i in indices:
+            current[i >> 3] |= 1 << (i & 7)
+
+        self.count += 1
+        if self.count >= self.capacity:
+            self.previous, self.current = current, bytearray(len(current))
+            self.count = 0
+        return True
 
 
 def _distinct(key_mapper: Optional[Mapper] = None,
-              comparer: Optional[Comparer] = None
+              comparer: Optional[Comparer] = None,
+              max_keys: Optional[int] = None,
+              ttl: Optional[typing.RelativeTime] = None,
+              bloom_capacity: Optional[int] = None,
+              false_positive_rate: float = 0.001,
+              scheduler: Optional[typing.Scheduler] = None
               ) -> Callable[[Observable], Observable]:
-    comparer = comparer or default_comparer
+    if max_keys is not None and max_keys <= 0:
+        raise ArgumentOutOfRangeException()
+    if bloom_capacity is not None:
+        if comparer is not None or max_keys is not None or ttl is not None:
+            raise ValueError("bloom_capacity cannot be combined with comparer, max_keys or ttl")
+        BloomFilter(bloom_capacity, false_positive_rate)  # Validate arguments eagerly
 
     def distinct(source: Observable) -> Observable:
         """Returns an observable sequence that contains only distinct
@@ -46,20 +189,39 @@ def _distinct(key_mapper: Optional[Mapper] = None,
             sequence.
         """
 
-        def subscribe(observer, scheduler=None):
-            hashset = HashSet(comparer)
+        def subscribe(observer, scheduler_=None):
+            if bloom_capacity is not None:
+                keys = BloomFilter(bloom_capacity, false_positive_rate)
+            else:
+                timespan = clock = None
+                if ttl is not None:
+                    _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+                    timespan = _scheduler.to_timedelta(ttl)
+
+                    def clock() -> datetime:
+                        return _scheduler.now
+
+                if comparer is not None:
+                    keys = ComparerSet(comparer, max_keys, timespan, clock)
+                elif max_keys is not None or ttl is not None:
+                    keys = LruHashSet(max_keys, timespan, clock)
+                else:
+                    keys = HashSet()
+            push = keys.push
 
             def on_next(x):
                 key = x
 
-                if key_mapper:
-                    try:
+                try:
+                    if key_mapper:
                         key = key_mapper(x)
-                    except Exception as ex:
-                        observer.on_error(ex)
-                        return
+                    is_new = push(key)
+                except Exception as ex:  # pylint: disable=broad-except
+                    observer.on_error(ex)
+                    return
 
-                hashset.push(key) and observer.on_next(x)
-            return source.subscribe_(on_next, observer.on_error,observer.on_completed, scheduler)
+                if is_new:
+                    observer.on_next(x)
+            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler_)
         return Observable(subscribe)
     return distinct
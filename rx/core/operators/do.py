@@ -1,6 +1,7 @@
 from typing import Callable, Optional
 
 from rx.core import Observable, typing
+from rx.core.observable.fusedobservable import FusedStage, TAP, fuse
 from rx.core.typing import Observer, Disposable
 from rx.disposable import CompositeDisposable
 
@@ -35,42 +36,7 @@ def _do_action(on_next: Optional[typing.OnNext] = None,
             behavior applied.
         """
 
-        def subscribe(observer, scheduler=None):
-            def _on_next(x):
-                if not on_next:
-                    observer.on_next(x)
-                else:
-                    try:
-                        on_next(x)
-                    except Exception as e:  # pylint: disable=broad-except
-                        observer.on_error(e)
-
-                    observer.on_next(x)
-
-            def _on_error(exception):
-                if not on_error:
-                    observer.on_error(exception)
-                else:
-                    try:
-                        on_error(exception)
-                    except Exception as e:  # pylint: disable=broad-except
-                        observer.on_error(e)
-
-                    observer.on_error(exception)
-
-            def _on_completed():
-                if not on_completed:
-                    observer.on_completed()
-                else:
-                    try:
-                        on_completed()
-                    except Exception as e:   # pylint: disable=broad-except
-                        observer.on_error(e)
-
-                    observer.on_completed()
-
-            return source.subscribe_(_on_next, _on_error, _on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, FusedStage(TAP, on_next, on_error, on_completed))
     return do_action
 
 
@@ -126,7 +92,7 @@ def do_on_subscribe(source: Observable, on_subscribe):
     """
     def subscribe(observer, scheduler=None):
         on_subscribe()
-        return source.subscribe_(observer.on_next, observer.on_error, observer.on_completed, scheduler)
+        return source._subscribe_internal(observer, scheduler)
 
     return Observable(subscribe)
 
@@ -149,7 +115,7 @@ def do_on_dispose(source: Observable, on_dispose):
     def subscribe(observer, scheduler=None):
         composite_disposable = CompositeDisposable()
         composite_disposable.add(OnDispose())
-        subscription = source.subscribe_(observer.on_next, observer.on_error, observer.on_completed, scheduler)
+        subscription = source._subscribe_internal(observer, scheduler)
         composite_disposable.add(subscription)
         return composite_disposable
 
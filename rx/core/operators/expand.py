@@ -3,6 +3,7 @@ from typing import Callable
 from rx.core import Observable
 from rx.core.typing import Mapper
 from rx.disposable import SerialDisposable, CompositeDisposable, SingleAssignmentDisposable
+from rx.internal import RingBuffer
 from rx.scheduler import ImmediateScheduler
 
 
@@ -21,7 +22,7 @@ def _expand(mapper: Mapper) -> Callable[[Observable], Observable]:
         def subscribe(observer, scheduler=None):
             scheduler = scheduler or ImmediateScheduler.singleton()
 
-            queue = []
+            queue = RingBuffer()
             m = SerialDisposable()
             d = CompositeDisposable(m)
             active_count = [0]
@@ -35,7 +36,7 @@ def _expand(mapper: Mapper) -> Callable[[Observable], Observable]:
 
                 def action(scheduler, state):
                     if queue:
-                        work = queue.pop(0)
+                        work = queue.dequeue()
                     else:
                         is_acquired[0] = False
                         return
@@ -52,7 +53,7 @@ def _expand(mapper: Mapper) -> Callable[[Observable], Observable]:
                             observer.on_error(ex)
                             return
 
-                        queue.append(result)
+                        queue.enqueue(result)
                         active_count[0] += 1
                         ensure_active()
 
@@ -68,7 +69,7 @@ def _expand(mapper: Mapper) -> Callable[[Observable], Observable]:
                 if is_owner:
                     m.disposable = scheduler.schedule(action)
 
-            queue.append(source)
+            queue.enqueue(source)
             active_count[0] += 1
             ensure_active()
             return d
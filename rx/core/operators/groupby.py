@@ -2,15 +2,20 @@ from typing import Callable, Optional
 
 import rx
 from rx import operators as ops
-from rx.core import Observable
+from rx.core import Observable, typing
 from rx.core.typing import Mapper
 
 
 def _group_by(key_mapper: Mapper,
-              element_mapper: Optional[Mapper] = None
+              element_mapper: Optional[Mapper] = None,
+              max_groups: Optional[int] = None,
+              idle_timeout: Optional[typing.RelativeTime] = None,
+              scheduler: Optional[typing.Scheduler] = None
               ) -> Callable[[Observable], Observable]:
 
     def duration_mapper(_):
         return rx.never()
 
-    return ops.group_by_until(key_mapper, element_mapper, duration_mapper)
+    from rx.core.operators.groupbyuntil import _group_by_until
+    return _group_by_until(key_mapper, element_mapper, duration_mapper,
+                           max_groups=max_groups, idle_timeout=idle_timeout, scheduler=scheduler)
@@ -0,0 +1,72 @@
+import os
+import threading
+from typing import Any, Callable, List, Optional, Set, cast
+
+from rx import operators as ops
+from rx.core import Observable, GroupedObservable, typing
+from rx.core.typing import Mapper
+from rx.disposable import CompositeDisposable, Disposable, RefCountDisposable
+from rx.internal.exceptions import ArgumentOutOfRangeException
+from rx.scheduler import EventLoopScheduler
+
+
+def _group_by_parallel(key_mapper: Mapper,
+                       element_mapper: Optional[Mapper] = None,
+                       workers: Optional[int] = None,
+                       scheduler: Optional[typing.Scheduler] = None
+                       ) -> Callable[[Observable], Observable]:
+    if workers is not None and workers <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def group_by_parallel(source: Observable) -> Observable:
+        """Partially applied group_by_parallel operator.
+
+        Groups the elements of the source, and delivers the elements of
+        every group on the worker scheduler its key hashes to.
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            A sequence of observable groups, each observed on a worker.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            pool: List[EventLoopScheduler] = []
+            used: Set[EventLoopScheduler] = set()
+            lock = threading.Lock()
+
+            if scheduler is not None:
+                shard: Callable[[Any], typing.Scheduler] = cast(Any, scheduler).shard
+            else:
+                pool.extend(EventLoopScheduler() for _ in range(workers or os.cpu_count() or 1))
+
+                def shard(key: Any) -> typing.Scheduler:
+                    worker = pool[hash(key) % len(pool)]
+                    with lock:
+                        used.add(worker)
+                    return worker
+
+            def shutdown() -> None:
+                # Only workers that got a group have a thread to stop.
+                # Work already queued on them still runs.
+                with lock:
+                    started = list(used)
+                for worker in started:
+                    worker.schedule(lambda _, __, worker=worker: worker.dispose())
+
+            # The workers stop when the subscription and all subscriptions
+            # to the groups have been disposed.
+            pool_disposable = RefCountDisposable(Disposable(shutdown))
+
+            def observe_on_worker(group: GroupedObservable) -> GroupedObservable:
+                observable = group.pipe(ops.observe_on(shard(group.key)))
+                return GroupedObservable(group.key, observable, pool_disposable)
+
+            subscription = source.pipe(
+                ops.group_by(key_mapper, element_mapper),
+                ops.map(observe_on_worker)
+            ).subscribe(observer, scheduler=scheduler_)
+            return CompositeDisposable(subscription, pool_disposable)
+        return Observable(subscribe)
+    return group_by_parallel
@@ -1,17 +1,65 @@
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional
 from collections import OrderedDict
 
 from rx import operators as ops
-from rx.core import Observable, GroupedObservable
+from rx.core import Observable, GroupedObservable, typing
 from rx.core.typing import Mapper
 from rx.subject import Subject
-from rx.disposable import CompositeDisposable, RefCountDisposable, SingleAssignmentDisposable
+from rx.disposable import (CompositeDisposable, Disposable, RefCountDisposable,
+                           SerialDisposable, SingleAssignmentDisposable)
 from rx.internal.basic import identity
+from rx.internal.concurrency import synchronized
+from rx.internal.exceptions import ArgumentOutOfRangeException
+from rx.scheduler import TimeoutScheduler
+
+
+class _Group(object):
+    """The state of a live group."""
+
+    __slots__ = ('writer', 'subscription', 'timer', 'last_seen', 'count')
+
+    def __init__(self, writer: Subject) -> None:
+        self.writer = writer
+        self.subscription = CompositeDisposable()
+        self.timer: Optional[SerialDisposable] = None
+        self.last_seen: Any = None
+        self.count = 0
+
+
+class GroupByObservable(Observable):
+    """The observable sequence of groups returned by group_by and
+    group_by_until, which can be asked about the groups that are
+    currently live over all of its subscriptions."""
+
+    def __init__(self, subscribe: typing.Subscription) -> None:
+        super().__init__(subscribe)
+        self._live: Dict[int, 'OrderedDict[Any, _Group]'] = {}
+
+    @property
+    def group_count(self) -> int:
+        """The number of live groups."""
+
+        with self.lock:
+            return sum(len(groups) for groups in self._live.values())
+
+    def group_sizes(self) -> Dict[Any, int]:
+        """Returns the number of elements every live group has received
+        since it was created, by key."""
+
+        sizes: Dict[Any, int] = {}
+        with self.lock:
+            for groups in self._live.values():
+                for key, group in list(groups.items()):
+                    sizes[key] = sizes.get(key, 0) + group.count
+        return sizes
 
 
 def _group_by_until(key_mapper: Mapper,
                     element_mapper: Optional[Mapper],
-                    duration_mapper: Callable[[GroupedObservable], Observable]
+                    duration_mapper: Callable[[GroupedObservable], Observable],
+                    max_groups: Optional[int] = None,
+                    idle_timeout: Optional[typing.RelativeTime] = None,
+                    scheduler: Optional[typing.Scheduler] = None
                     ) -> Callable[[Observable], Observable]:
     """Groups the elements of an observable sequence according to a
     specified key mapper function. A duration mapper function is used
@@ -23,10 +71,16 @@ def _group_by_until(key_mapper: Mapper,
     Examples:
         >>> group_by_until(lambda x: x.id, None, lambda : rx.never())
         >>> group_by_until(lambda x: x.id,lambda x: x.name, lambda grp: rx.never())
+        >>> group_by_until(lambda x: x.id, None, lambda grp: rx.never(), max_groups=1000)
 
     Args:
         key_mapper: A function to extract the key for each element.
         duration_mapper: A function to signal the expiration of a group.
+        max_groups: [Optional] The maximum number of live groups. When
+            exceeded, the least recently used group expires.
+        idle_timeout: [Optional] A group expires when it has not
+            received an element for this long.
+        scheduler: [Optional] Scheduler to run the idle timers on.
 
     Returns: a sequence of observable groups, each of which corresponds to
     a unique key value, containing all elements that share that same key
@@ -37,92 +91,127 @@ def _group_by_until(key_mapper: Mapper,
 
     element_mapper = element_mapper or identity
 
+    if max_groups is not None and max_groups < 1:
+        raise ArgumentOutOfRangeException()
+
     def group_by_until(source: Observable) -> Observable:
-        def subscribe(observer, scheduler=None):
-            writers = OrderedDict()
+        def subscribe(observer, scheduler_=None):
+            groups: 'OrderedDict[Any, _Group]' = OrderedDict()
             group_disposable = CompositeDisposable()
             ref_count_disposable = RefCountDisposable(group_disposable)
 
-            def on_next(x):
-                writer = None
-                key = None
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+            idle = _scheduler.to_timedelta(idle_timeout) if idle_timeout is not None else None
+
+            with result.lock:
+                result._live[id(groups)] = groups
+
+            def unregister() -> None:
+                with result.lock:
+                    result._live.pop(id(groups), None)
+
+            def dispose_groups() -> None:
+                unregister()
+                for group in list(groups.values()):
+                    group.subscription.dispose()
+
+            def expire(key, group: _Group) -> None:
+                if groups.get(key) is group:
+                    del groups[key]
+                    group.writer.on_completed()
+
+                group.subscription.dispose()
+
+            def fail(error: Exception) -> None:
+                unregister()
+                for group in list(groups.values()):
+                    group.writer.on_error(error)
 
+                observer.on_error(error)
+
+            def schedule_idle(key, group: _Group, duetime) -> None:
+                @synchronized(source.lock)
+                def action(_: typing.Scheduler, __: Any = None) -> None:
+                    if groups.get(key) is not group:
+                        return
+
+                    elapsed = _scheduler.now - group.last_seen
+                    if elapsed >= idle:
+                        expire(key, group)
+                    else:
+                        schedule_idle(key, group, idle - elapsed)
+
+                group.timer.disposable = _scheduler.schedule_relative(duetime, action)
+
+            def on_next(x):
                 try:
                     key = key_mapper(x)
-                except Exception as e:
-                    for wrt in writers.values():
-                        wrt.on_error(e)
-
-                    observer.on_error(e)
+                except Exception as e:  # pylint: disable=broad-except
+                    fail(e)
                     return
 
-                fire_new_map_entry = False
-                writer = writers.get(key)
-                if not writer:
+                group = groups.get(key)
+                if group is None:
+                    if max_groups is not None and len(groups) >= max_groups:
+                        oldest_key, oldest = next(iter(groups.items()))
+                        expire(oldest_key, oldest)
+
                     writer = Subject()
-                    writers[key] = writer
-                    fire_new_map_entry = True
+                    group = _Group(writer)
+                    groups[key] = group
 
-                if fire_new_map_entry:
-                    group = GroupedObservable(key, writer, ref_count_disposable)
                     duration_group = GroupedObservable(key, writer)
                     try:
                         duration = duration_mapper(duration_group)
-                    except Exception as e:
-                        for wrt in writers.values():
-                            wrt.on_error(e)
-
-                        observer.on_error(e)
+                    except Exception as e:  # pylint: disable=broad-except
+                        fail(e)
                         return
 
-                    observer.on_next(group)
-                    sad = SingleAssignmentDisposable()
-                    group_disposable.add(sad)
-
-                    def expire():
-                        if writers[key]:
-                            del writers[key]
-                            writer.on_completed()
-
-                        group_disposable.remove(sad)
+                    observer.on_next(GroupedObservable(key, writer, ref_count_disposable))
 
-                    def on_next(value):
-                        pass
+                    def on_completed(key=key, group=group):
+                        expire(key, group)
 
-                    def on_error(exn):
-                        for wrt in writers.values():
-                            wrt.on_error(exn)
-                        observer.on_error(exn)
+                    sad = SingleAssignmentDisposable()
+                    group.subscription.add(sad)
+                    sad.disposable = duration.pipe(ops.take(1)).subscribe_(None, fail, on_completed, scheduler_)
 
-                    def on_completed():
-                        expire()
+                    if idle is not None:
+                        group.timer = SerialDisposable()
+                        group.subscription.add(group.timer)
+                        group.last_seen = _scheduler.now
+                        schedule_idle(key, group, idle)
 
-                    sad.disposable = duration.pipe(ops.take(1)).subscribe_(on_next, on_error, on_completed, scheduler)
+                elif max_groups is not None:
+                    groups.move_to_end(key)
 
                 try:
                     element = element_mapper(x)
-                except Exception as error:
-                    for wrt in writers.values():
-                        wrt.on_error(error)
-
-                    observer.on_error(error)
+                except Exception as error:  # pylint: disable=broad-except
+                    fail(error)
                     return
 
-                writer.on_next(element)
-
-            def on_error(ex):
-                for wrt in writers.values():
-                    wrt.on_error(ex)
-
-                observer.on_error(ex)
+                group.count += 1
+                if idle is not None:
+                    group.last_seen = _scheduler.now
+                group.writer.on_next(element)
 
             def on_completed():
-                for wrt in writers.values():
-                    wrt.on_completed()
+                unregister()
+                for group in list(groups.values()):
+                    group.writer.on_completed()
 
                 observer.on_completed()
 
-            group_disposable.add(source.subscribe_(on_next, on_error, on_completed, scheduler))
+            if idle is not None:
+                on_next = synchronized(source.lock)(on_next)
+                fail = synchronized(source.lock)(fail)
+                on_completed = synchronized(source.lock)(on_completed)
+
+            group_disposable.add(Disposable(dispose_groups))
+            group_disposable.add(source.subscribe_(on_next, fail, on_completed, scheduler_))
             return ref_count_disposable
-        return Observable(subscribe)
+
+        result = GroupByObservable(subscribe)
+        return result
     return group_by_until
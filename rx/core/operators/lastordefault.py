@@ -19,6 +19,11 @@ def last_or_default_async(source: Observable,
             value[0] = x
             seen_value[0] = True
 
+        def on_next_batch(values):
+            if values:
+                value[0] = values[-1]
+                seen_value[0] = True
+
         def on_completed():
             if not seen_value[0] and not has_default:
                 observer.on_error(SequenceContainsNoElementsError())
@@ -26,7 +31,7 @@ def last_or_default_async(source: Observable,
                 observer.on_next(value[0])
                 observer.on_completed()
 
-        return source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
+        return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch=on_next_batch)
     return Observable(subscribe)
 
 
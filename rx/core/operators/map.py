@@ -5,7 +5,8 @@ from rx.internal.utils import infinite
 
 from rx import operators as ops
 from rx.core import Observable, pipe
-from rx.core.typing import Mapper, MapperIndexed, Observer, Disposable, Scheduler
+from rx.core.observable.fusedobservable import FusedStage, MAP, fuse
+from rx.core.typing import Mapper, MapperIndexed
 
 
 # pylint: disable=redefined-builtin
@@ -31,17 +32,7 @@ def _map(mapper: Optional[Mapper] = None) -> Callable[[Observable], Observable]:
             of the source.
         """
 
-        def subscribe(obv: Observer, scheduler: Scheduler = None) -> Disposable:
-            def on_next(value: Any) -> None:
-                try:
-                    result = _mapper(value)
-                except Exception as err:  # pylint: disable=broad-except
-                    obv.on_error(err)
-                else:
-                    obv.on_next(result)
-
-            return source.subscribe_(on_next, obv.on_error, obv.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, FusedStage(MAP, _mapper))
     return map
 
 
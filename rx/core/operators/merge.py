@@ -3,7 +3,9 @@ from typing import Callable, Optional
 import rx
 from rx import from_future
 from rx.core import Observable
+from rx.core.observer import AutoDetachObserver
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal import RingBuffer
 from rx.internal.concurrency import synchronized
 from rx.internal.utils import is_future
 
@@ -37,7 +39,7 @@ def _merge(*sources: Observable,
             active_count = [0]
             group = CompositeDisposable()
             is_stopped = [False]
-            queue = []
+            queue = RingBuffer()
 
             def subscribe(xs):
                 subscription = SingleAssignmentDisposable()
@@ -47,7 +49,7 @@ def _merge(*sources: Observable,
                 def on_completed():
                     group.remove(subscription)
                     if queue:
-                        s = queue.pop(0)
+                        s = queue.dequeue()
                         subscribe(s)
                     else:
                         active_count[0] -= 1
@@ -56,14 +58,16 @@ def _merge(*sources: Observable,
 
                 on_next = synchronized(source.lock)(observer.on_next)
                 on_error = synchronized(source.lock)(observer.on_error)
-                subscription.disposable = xs.subscribe_(on_next, on_error, on_completed, scheduler)
+                inner_observer = AutoDetachObserver(on_next, on_error, on_completed)
+                inner_observer.subscription = xs._subscribe_internal(inner_observer, scheduler)
+                subscription.disposable = inner_observer
 
             def on_next(inner_source):
                 if active_count[0] < max_concurrent:
                     active_count[0] += 1
                     subscribe(inner_source)
                 else:
-                    queue.append(inner_source)
+                    queue.enqueue(inner_source)
 
             def on_completed():
                 is_stopped[0] = True
@@ -110,8 +114,9 @@ def _merge_all() -> Callable[[Observable], Observable]:
 
                 on_next = synchronized(source.lock)(observer.on_next)
                 on_error = synchronized(source.lock)(observer.on_error)
-                subscription = inner_source.subscribe_(on_next, on_error, on_completed, scheduler)
-                inner_subscription.disposable = subscription
+                inner_observer = AutoDetachObserver(on_next, on_error, on_completed)
+                inner_observer.subscription = inner_source._subscribe_internal(inner_observer, scheduler)
+                inner_subscription.disposable = inner_observer
 
             def on_completed():
                 is_stopped[0] = True
@@ -0,0 +1,260 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from rx import defer, from_iterable, operators as ops
+from rx.core import Observable, pipe, typing
+from rx.internal import ArgumentOutOfRangeException
+from rx.internal.exceptions import SequenceContainsNoElementsError
+from rx.internal.utils import NotSet
+
+
+def _chunk(count: int, dtype: Any = None) -> Callable[[Observable], Observable]:
+    if count <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def chunk(source: Observable) -> Observable:
+        """Partially applied chunk operator.
+
+        Collects the scalar elements of the source into NumPy arrays
+        of count elements. Batches pushed by batching sources are
+        sliced directly into chunks.
+
+        Args:
+            source: Source observable of scalars.
+
+        Returns:
+            An observable sequence of arrays. The last array may be
+            shorter than count.
+        """
+
+        def subscribe(observer, scheduler=None):
+            pending: List[Any] = []
+
+            def on_next(value: Any) -> None:
+                nonlocal pending
+                pending.append(value)
+                if len(pending) >= count:
+                    values, pending = pending, []
+                    observer.on_next(np.asarray(values, dtype=dtype))
+
+            def on_next_batch(values: List[Any]) -> None:
+                nonlocal pending
+                pending.extend(values)
+                if len(pending) < count:
+                    return
+
+                values, pending = pending, []
+                start = 0
+                while len(values) - start >= count:
+                    observer.on_next(np.asarray(values[start:start + count], dtype=dtype))
+                    start += count
+                pending = values[start:]
+
+            def on_completed() -> None:
+                if pending:
+                    observer.on_next(np.asarray(pending, dtype=dtype))
+                observer.on_completed()
+
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch=on_next_batch)
+        return Observable(subscribe)
+    return chunk
+
+
+def _map(mapper: Callable[[np.ndarray], Any]) -> Callable[[Observable], Observable]:
+    def projection(chunk: Any) -> Any:
+        return mapper(np.asarray(chunk))
+
+    return ops.map(projection)
+
+
+def _filter(predicate: Callable[[np.ndarray], np.ndarray]) -> Callable[[Observable], Observable]:
+    def select(chunk: Any) -> np.ndarray:
+        chunk = np.asarray(chunk)
+        return chunk[predicate(chunk)]
+
+    return pipe(
+        ops.map(select),
+        ops.filter(lambda chunk: len(chunk) > 0)
+    )
+
+
+def _scan(ufunc: np.ufunc, seed: Any = NotSet) -> Callable[[Observable], Observable]:
+    def scan(source: Observable) -> Observable:
+        """Partially applied scan operator.
+
+        Accumulates each chunk with the ufunc, continuing from the
+        last accumulated value of the previous chunk.
+
+        Args:
+            source: Source observable of chunks.
+
+        Returns:
+            An observable sequence of accumulated chunks.
+        """
+
+        def factory(scheduler):
+            carry = seed
+
+            def accumulate(chunk: Any) -> np.ndarray:
+                nonlocal carry
+
+                chunk = np.asarray(chunk)
+                if not len(chunk):
+                    return chunk
+
+                result = ufunc.accumulate(chunk, axis=0)
+                if carry is not NotSet:
+                    result = ufunc(carry, result)
+                carry = result[-1]
+                return result
+            return source.pipe(ops.map(accumulate))
+        return defer(factory)
+    return scan
+
+
+def _aggregate(accumulator: Callable[[Any, np.ndarray], Any],
+               seed: Any,
+               result_mapper: Callable[[Any], Any]
+               ) -> Callable[[Observable], Observable]:
+    def accumulate(acc: Any, chunk: Any) -> Any:
+        chunk = np.asarray(chunk)
+        if not len(chunk):
+            return acc
+        return accumulator(acc, chunk)
+
+    return pipe(
+        ops.reduce(accumulate, seed),
+        ops.map(result_mapper)
+    )
+
+
+def _sum() -> Callable[[Observable], Observable]:
+    return _aggregate(
+        lambda acc, chunk: acc + np.sum(chunk, axis=0),
+        0,
+        lambda acc: acc
+    )
+
+
+def _average() -> Callable[[Observable], Observable]:
+    def accumulator(acc: Tuple[Any, int], chunk: np.ndarray) -> Tuple[Any, int]:
+        total, count = acc
+        return total + np.sum(chunk, axis=0), count + len(chunk)
+
+    def result_mapper(acc: Tuple[Any, int]) -> Any:
+        total, count = acc
+        if not count:
+            raise SequenceContainsNoElementsError()
+        return total / count
+
+    return _aggregate(accumulator, (0, 0), result_mapper)
+
+
+def _extremum(reduction: Callable[..., Any], ufunc: np.ufunc) -> Callable[[Observable], Observable]:
+    def accumulator(acc: Any, chunk: np.ndarray) -> Any:
+        value = reduction(chunk, axis=0)
+        return value if acc is None else ufunc(acc, value)
+
+    def result_mapper(acc: Any) -> Any:
+        if acc is None:
+            raise SequenceContainsNoElementsError()
+        return acc
+
+    return _aggregate(accumulator, None, result_mapper)
+
+
+def _min() -> Callable[[Observable], Observable]:
+    return _extremum(np.min, np.minimum)
+
+
+def _max() -> Callable[[Observable], Observable]:
+    return _extremum(np.max, np.maximum)
+
+
+def _moments() -> Callable[[Observable], Observable]:
+    """Combines count, mean and sum of squared deviations of all chunks
+    using the pairwise update of Chan et al."""
+
+    def accumulator(acc: Tuple[int, Any, Any], chunk: np.ndarray) -> Tuple[int, Any, Any]:
+        count_a, mean_a, m2_a = acc
+        count_b = len(chunk)
+        mean_b = np.mean(chunk, axis=0)
+        m2_b = np.sum((chunk - mean_b) ** 2, axis=0)
+
+        count = count_a + count_b
+        delta = mean_b - mean_a
+        mean = mean_a + delta * count_b / count
+        m2 = m2_a + m2_b + delta ** 2 * count_a * count_b / count
+        return count, mean, m2
+
+    def result_mapper(acc: Tuple[int, Any, Any]) -> Tuple[int, Any, Any]:
+        if not acc[0]:
+            raise SequenceContainsNoElementsError()
+        return acc
+
+    return _aggregate(accumulator, (0, 0.0, 0.0), result_mapper)
+
+
+def _variance(ddof: int = 1) -> Callable[[Observable], Observable]:
+    def mapper(moments: Tuple[int, Any, Any]) -> Any:
+        count, _, m2 = moments
+        if count <= ddof:
+            return m2 * np.nan
+        return m2 / (count - ddof)
+
+    return pipe(_moments(), ops.map(mapper))
+
+
+def _standard_deviation(ddof: int = 1) -> Callable[[Observable], Observable]:
+    return pipe(_variance(ddof), ops.map(np.sqrt))
+
+
+def _median() -> Callable[[Observable], Observable]:
+    # An exact median needs all samples, so memory use is O(n) in the
+    # number of samples.
+    def mapper(chunks: List[np.ndarray]) -> Any:
+        chunks = [chunk for chunk in chunks if len(chunk)]
+        if not chunks:
+            raise SequenceContainsNoElementsError()
+        return np.median(np.concatenate(chunks), axis=0)
+
+    return pipe(
+        ops.map(np.asarray),
+        ops.to_list(),
+        ops.map(mapper)
+    )
+
+
+def _mode() -> Callable[[Observable], Observable]:
+    def accumulator(counts: Dict[Any, int], chunk: np.ndarray) -> Dict[Any, int]:
+        values, occurrences = np.unique(chunk, return_counts=True)
+        for value, occurrence in zip(values.tolist(), occurrences.tolist()):
+            counts[value] = counts.get(value, 0) + occurrence
+        return counts
+
+    def result_mapper(counts: Dict[Any, int]) -> np.ndarray:
+        if not counts:
+            raise SequenceContainsNoElementsError()
+        highest = max(counts.values())
+        return np.array(sorted(value for value, count in counts.items() if count == highest))
+
+    def mode(source: Observable) -> Observable:
+        def factory(_: Optional[typing.Scheduler]) -> Observable:
+            return source.pipe(_aggregate(accumulator, {}, result_mapper))
+        return defer(factory)
+    return mode
+
+
+def _from_array(array: Any,
+                chunk_size: int,
+                scheduler: Optional[typing.Scheduler] = None
+                ) -> Observable:
+    if chunk_size <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def factory(_: Optional[typing.Scheduler]) -> Observable:
+        data = np.asarray(array)
+        chunks = (data[index:index + chunk_size] for index in range(0, len(data), chunk_size))
+        return from_iterable(chunks, scheduler)
+    return defer(factory)
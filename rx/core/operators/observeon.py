@@ -1,11 +1,23 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from rx.core import Observable
 from rx.core.typing import Scheduler
 from rx.core.observer import ObserveOnObserver
+from rx.core.observer.observeonobserver import OVERFLOW_STRATEGIES
+from rx.disposable import CompositeDisposable
+from rx.internal import ArgumentOutOfRangeException
 
 
-def _observe_on(scheduler: Scheduler) -> Callable[[Observable], Observable]:
+def _observe_on(scheduler: Scheduler,
+                budget: Optional[int] = None,
+                buffer_size: Optional[int] = None,
+                overflow: str = 'block'
+                ) -> Callable[[Observable], Observable]:
+    if buffer_size is not None and buffer_size <= 0:
+        raise ArgumentOutOfRangeException()
+    if overflow not in OVERFLOW_STRATEGIES:
+        raise ValueError("overflow must be one of %s" % ", ".join(OVERFLOW_STRATEGIES))
+
     def observe_on(source: Observable) -> Observable:
         """Wraps the source sequence in order to run its observer
         callbacks on the specified scheduler.
@@ -15,6 +27,11 @@ def _observe_on(scheduler: Scheduler) -> Callable[[Observable], Observable]:
         side-effects that require to be run on a scheduler, use
         subscribe_on.
 
+        Queued notifications are delivered in a single scheduled
+        action, yielding back to the scheduler after budget of them.
+        With a buffer_size, elements arriving while buffer_size
+        elements are queued are handled by the overflow strategy.
+
         Args:
             source: Source observable.
 
@@ -24,8 +41,9 @@ def _observe_on(scheduler: Scheduler) -> Callable[[Observable], Observable]:
             the specified scheduler.
         """
         def subscribe(observer, subscribe_scheduler=None):
-            return source.subscribe(ObserveOnObserver(scheduler, observer),
-                                    scheduler=subscribe_scheduler)
+            observe_on_observer = ObserveOnObserver(scheduler, observer, budget, buffer_size, overflow)
+            subscription = source.subscribe(observe_on_observer, scheduler=subscribe_scheduler)
+            return CompositeDisposable(subscription, observe_on_observer)
 
         return Observable(subscribe)
     return observe_on
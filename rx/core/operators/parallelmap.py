@@ -0,0 +1,192 @@
+import threading
+from typing import Any, Callable, List, Optional
+
+from rx.core import Observable
+from rx.core.typing import Mapper
+from rx.disposable import CompositeDisposable, Disposable
+from rx.internal import ArgumentOutOfRangeException, BufferOverflowException, RingBuffer
+from rx.scheduler import ProcessPoolScheduler
+
+
+# Strategies for chunks arriving while buffer_size chunks are pending.
+OVERFLOW_STRATEGIES = ('block', 'error')
+
+
+def map_chunk(mapper: Mapper, chunk: List[Any]) -> List[Any]:
+    """Runs in the worker process."""
+
+    return [mapper(value) for value in chunk]
+
+
+def _parallel_map(mapper: Mapper,
+                  max_workers: Optional[int] = None,
+                  ordered: bool = True,
+                  chunksize: int = 1,
+                  scheduler: Optional[ProcessPoolScheduler] = None,
+                  buffer_size: Optional[int] = None,
+                  overflow: str = 'block'
+                  ) -> Callable[[Observable], Observable]:
+    if chunksize <= 0:
+        raise ArgumentOutOfRangeException()
+    if max_workers is not None and max_workers <= 0:
+        raise ArgumentOutOfRangeException()
+    if buffer_size is not None and buffer_size <= 0:
+        raise ArgumentOutOfRangeException()
+    if overflow not in OVERFLOW_STRATEGIES:
+        raise ValueError("overflow must be one of %s" % ", ".join(OVERFLOW_STRATEGIES))
+
+    def parallel_map(source: Observable) -> Observable:
+        """Partially applied parallel_map operator.
+
+        Collects the elements into chunks, maps the chunks in worker
+        processes, and emits the results from the thread delivering
+        the results of the pool. At most buffer_size chunks wait to be
+        submitted, beyond that the overflow strategy applies.
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            An observable sequence of mapped elements.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            pool = scheduler or ProcessPoolScheduler(max_workers)
+            max_in_flight = 2 * (max_workers or pool.max_workers)
+
+            lock = threading.RLock()
+            not_full = threading.Condition(lock)
+            chunk: List[Any] = []
+            pending: RingBuffer[List[Any]] = RingBuffer()
+            in_flight = RingBuffer() if ordered else set()
+            is_stopped = False
+            is_disposed = False
+
+            def dispose() -> None:
+                nonlocal is_disposed
+                with lock:
+                    if is_disposed:
+                        return
+                    is_disposed = True
+                    futures = list(in_flight)
+                    in_flight.clear()
+                    pending.clear()
+                    not_full.notify_all()
+
+                for future in futures:
+                    future.cancel()
+                if scheduler is None:
+                    pool.dispose()
+
+            def submit_pending() -> None:
+                while pending and len(in_flight) < max_in_flight:
+                    future = pool.submit(map_chunk, mapper, pending.dequeue())
+                    if ordered:
+                        in_flight.enqueue(future)
+                    else:
+                        in_flight.add(future)
+                    future.add_done_callback(on_done)
+
+            def on_done(future) -> None:
+                with lock:
+                    if is_disposed:
+                        return
+
+                    if ordered:
+                        done = []
+                        while in_flight and in_flight.peek().done():
+                            done.append(in_flight.dequeue())
+                    else:
+                        in_flight.discard(future)
+                        done = [future]
+
+                    for future_ in done:
+                        try:
+                            results = future_.result()
+                        except Exception as ex:  # pylint: disable=broad-except
+                            observer.on_error(ex)
+                            dispose()
+                            return
+
+                        for result in results:
+                            observer.on_next(result)
+
+                    try:
+                        submit_pending()
+                    except Exception as ex:  # pylint: disable=broad-except
+                        observer.on_error(ex)
+                        dispose()
+                        return
+                    not_full.notify_all()
+
+                    if is_stopped and not in_flight and not pending:
+                        observer.on_completed()
+                        dispose()
+
+            def add_pending(values: List[Any]) -> bool:
+                """Queues a chunk for submission. Returns False if the
+                subscription was disposed or the buffer overflowed."""
+
+                if buffer_size is not None:
+                    while len(pending) >= buffer_size and not is_disposed:
+                        submit_pending()
+                        if len(pending) < buffer_size:
+                            break
+                        if overflow == 'error':
+                            observer.on_error(BufferOverflowException())
+                            dispose()
+                            return False
+                        not_full.wait()
+
+                if is_disposed:
+                    return False
+                pending.enqueue(values)
+                return True
+
+            def enqueue(values: List[Any]) -> None:
+                nonlocal chunk
+                with lock:
+                    if is_disposed:
+                        return
+
+                    chunk.extend(values)
+                    if len(chunk) >= chunksize:
+                        end = len(chunk) - len(chunk) % chunksize
+                        values, chunk = chunk, chunk[end:]
+                        for i in range(0, end, chunksize):
+                            if not add_pending(values[i:i + chunksize]):
+                                return
+                    submit_pending()
+
+            def on_next(value: Any) -> None:
+                enqueue([value])
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    if not is_disposed:
+                        observer.on_error(error)
+                dispose()
+
+            def on_completed() -> None:
+                nonlocal chunk, is_stopped
+                with lock:
+                    if is_disposed:
+                        return
+
+                    is_stopped = True
+                    if chunk:
+                        values, chunk = chunk, []
+                        if not add_pending(values):
+                            return
+                    submit_pending()
+                    completed = not in_flight and not pending
+                    if completed:
+                        observer.on_completed()
+
+                if completed:
+                    dispose()
+
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler_, on_next_batch=enqueue)
+            return CompositeDisposable(subscription, Disposable(dispose))
+        return Observable(subscribe)
+    return parallel_map
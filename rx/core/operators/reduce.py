@@ -31,9 +31,8 @@ def _reduce(accumulator: Accumulator, seed: Any = NotSet) -> Callable[[Observabl
 
 
     if seed is not NotSet:
-        initial = ops.start_with(seed)
         scanner = ops.scan(accumulator, seed=seed)
 
-        return pipe(scanner, initial, ops.last())
+        return pipe(scanner, ops.last_or_default(default_value=seed))
 
     return pipe(ops.scan(accumulator), ops.last())
@@ -1,13 +1,11 @@
 from typing import Any, Callable
 
-from rx import defer, operators as ops
 from rx.internal.utils import NotSet
 from rx.core import Observable
+from rx.core.observable.fusedobservable import FusedStage, SCAN, fuse
 from rx.core.typing import Accumulator
 
 def _scan(accumulator: Accumulator, seed: Any = NotSet) -> Callable[[Observable], Observable]:
-    has_seed = seed is not NotSet
-
     def scan(source: Observable) -> Observable:
         """Partially applied scan operator.
 
@@ -24,21 +22,5 @@ def _scan(accumulator: Accumulator, seed: Any = NotSet) -> Callable[[Observable]
             An observable sequence containing the accumulated values.
         """
 
-        def factory(scheduler):
-            has_accumulation = False
-            accumulation = None
-
-            def projection(x):
-                nonlocal has_accumulation
-                nonlocal accumulation
-
-                if has_accumulation:
-                    accumulation = accumulator(accumulation, x)
-                else:
-                    accumulation = accumulator(seed, x) if has_seed else x
-                    has_accumulation = True
-
-                return accumulation
-            return source.pipe(ops.map(projection))
-        return defer(factory)
+        return fuse(source, FusedStage(SCAN, accumulator, seed=seed))
     return scan
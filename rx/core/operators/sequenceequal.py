@@ -5,7 +5,7 @@ import rx
 from rx.core import Observable
 from rx.core.typing import Comparer
 from rx.disposable import CompositeDisposable
-from rx.internal import default_comparer
+from rx.internal import default_comparer, RingBuffer
 
 
 def _sequence_equal(second: Observable, comparer: Optional[Comparer] = None
@@ -38,12 +38,12 @@ def _sequence_equal(second: Observable, comparer: Optional[Comparer] = None
         def subscribe(observer, scheduler=None):
             donel = [False]
             doner = [False]
-            ql = []
-            qr = []
+            ql = RingBuffer()
+            qr = RingBuffer()
 
             def on_next1(x):
                 if len(qr) > 0:
-                    v = qr.pop(0)
+                    v = qr.dequeue()
                     try:
                         equal = comparer(v, x)
                     except Exception as e:
@@ -58,7 +58,7 @@ def _sequence_equal(second: Observable, comparer: Optional[Comparer] = None
                     observer.on_next(False)
                     observer.on_completed()
                 else:
-                    ql.append(x)
+                    ql.enqueue(x)
 
             def on_completed1():
                 donel[0] = True
@@ -72,7 +72,7 @@ def _sequence_equal(second: Observable, comparer: Optional[Comparer] = None
 
             def on_next2(x):
                 if len(ql) > 0:
-                    v = ql.pop(0)
+                    v = ql.dequeue()
                     try:
                         equal = comparer(v, x)
                     except Exception as exception:
@@ -87,7 +87,7 @@ def _sequence_equal(second: Observable, comparer: Optional[Comparer] = None
                     observer.on_next(False)
                     observer.on_completed()
                 else:
-                    qr.append(x)
+                    qr.enqueue(x)
 
             def on_completed2():
                 doner[0] = True
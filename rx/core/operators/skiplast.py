@@ -1,5 +1,6 @@
 from typing import Callable
 from rx.core import Observable
+from rx.internal import RingBuffer
 
 
 def _skip_last(count: int) -> Callable[[Observable], Observable]:
@@ -22,16 +23,17 @@ def _skip_last(count: int) -> Callable[[Observable], Observable]:
         """
 
         def subscribe(observer, scheduler=None):
-            q = []
+            q = RingBuffer()
 
             def on_next(value):
-                front = None
+                has_front = False
                 with source.lock:
-                    q.append(value)
+                    q.enqueue(value)
                     if len(q) > count:
-                        front = q.pop(0)
+                        front = q.dequeue()
+                        has_front = True
 
-                if front is not None:
+                if has_front:
                     observer.on_next(front)
 
             return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
@@ -1,6 +1,7 @@
 from typing import Callable, Optional
 
 from rx.core import Observable, typing
+from rx.internal import RingBuffer
 from rx.scheduler import TimeoutScheduler
 
 
@@ -34,18 +35,18 @@ def _skip_last_with_time(duration: typing.RelativeTime, scheduler: Optional[typi
 
             _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
             duration = _scheduler.to_timedelta(duration)
-            q = []
+            q = RingBuffer()
 
             def on_next(x):
                 now = _scheduler.now
-                q.append({"interval": now, "value": x})
-                while q and now - q[0]["interval"] >= duration:
-                    observer.on_next(q.pop(0)["value"])
+                q.enqueue((now, x))
+                while q and now - q.peek()[0] >= duration:
+                    observer.on_next(q.dequeue()[1])
 
             def on_completed():
                 now = _scheduler.now
-                while q and now - q[0]["interval"] >= duration:
-                    observer.on_next(q.pop(0)["value"])
+                while q and now - q.peek()[0] >= duration:
+                    observer.on_next(q.dequeue()[1])
 
                 observer.on_completed()
 
@@ -2,6 +2,7 @@ from typing import Callable
 
 from rx import operators as ops
 from rx.core import Observable, typing, pipe
+from rx.core.observable.fusedobservable import FusedStage, SKIP_WHILE, fuse
 
 
 def _skip_while(predicate: typing.Predicate) -> Callable[[Observable], Observable]:
@@ -22,24 +23,7 @@ def _skip_while(predicate: typing.Predicate) -> Callable[[Observable], Observabl
             input sequence starting at the first element in the linear
             series that does not pass the test specified by predicate.
         """
-        def subscribe(observer, scheduler=None):
-            running = False
-
-            def on_next(value):
-                nonlocal running
-
-                if not running:
-                    try:
-                        running = not predicate(value)
-                    except Exception as exn:
-                        observer.on_error(exn)
-                        return
-
-                if running:
-                    observer.on_next(value)
-
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, FusedStage(SKIP_WHILE, predicate))
     return skip_while
 
 
@@ -1,57 +1,231 @@
-from rx.core import Observable
+import heapq
 import math
+from bisect import bisect_right, insort
+from typing import Any, Callable, Dict, List
 
+from rx.core import Observable
+from rx.internal import ArgumentOutOfRangeException
+from rx.internal.exceptions import SequenceContainsNoElementsError
 
-def determine_median(sorted_list):
-    if len(sorted_list) == 0:
-        raise Exception("The input sequence was empty")
 
-    if len(sorted_list) % 2 == 1:
-        return sorted_list[int((len(sorted_list) + 1) / 2) - 1]
-    else:
-        median_1 = sorted_list[int((len(sorted_list) + 1) / 2) - 1]
-        median_2 = sorted_list[int((len(sorted_list) + 1) / 2)]
-        return float(median_1 + median_2) / 2.0
+class Moments:
+    """Running count, mean and sum of squared deviations, updated with
+    Welford's online algorithm in O(1) memory."""
 
+    __slots__ = ('count', 'mean', 'm2')
 
-def median(source: Observable) -> Observable:
-    """
-    Calculates the statistical median on numerical emissions. The sequence must be finite.
-    """
-    return source.to_sorted_list().map(lambda l: determine_median(l))
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
 
+    def update(self, value: Any) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
 
-def mode(source: Observable) -> Observable:
-    """
-    Returns the most frequently emitted value (or "values" if they have the same number of occurrences).
-    The sequence must be finite.
-    """
-    return source.group_by(lambda v: v) \
-        .flat_map(lambda grp: grp.count().map(lambda ct: (grp.key, ct))) \
-        .to_sorted_list(lambda t: t[1], reverse=True) \
-        .flat_map(lambda l: Observable.from_(l).take_while(lambda t: t[1] == l[0][1])) \
-        .map(lambda t: t[0])
+    def variance(self, ddof: int = 1) -> float:
+        if not self.count:
+            raise SequenceContainsNoElementsError()
+        if self.count <= ddof:
+            return math.nan
+        return self.m2 / (self.count - ddof)
 
 
-def variance(source: Observable) -> Observable:
-    """
-    Returns the statistical variance of the numerical emissions.
-    The sequence must be finite.
-    """
-    squared_values = source.to_list() \
-        .flat_map(lambda l: Observable.from_(l).average().flat_map(lambda avg: Observable.from_(l).map(lambda i: i - avg))) \
-        .map(lambda i: i * i) \
-        .publish() \
-        .auto_connect(2)
+class P2Quantile:
+    """Running estimate of a quantile with the P-square algorithm of
+    Jain and Chlamtac. Only five markers are kept, whatever the length
+    of the sequence. Until five values have been seen the quantile is
+    computed exactly."""
 
-    return Observable.zip(squared_values.sum(), squared_values.count(), lambda sum, ct: sum / (ct - 1))
+    __slots__ = ('q', 'heights', 'positions', 'desired', 'increments')
 
+    def __init__(self, q: float) -> None:
+        if not 0.0 <= q <= 1.0:
+            raise ArgumentOutOfRangeException()
 
-def standard_deviation(source: Observable) -> Observable:
-    """
-    Returns the standard deviation of the numerical emissions:
-    The sequence must be finite.
+        self.q = q
+        self.heights: List[float] = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1.0, 1.0 + 2.0 * q, 1.0 + 4.0 * q, 3.0 + 2.0 * q, 5.0]
+        self.increments = [0.0, q / 2.0, q, (1.0 + q) / 2.0, 1.0]
+
+    def update(self, value: Any) -> None:
+        heights = self.heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = bisect_right(heights, value) - 1
+
+        positions = self.positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        desired = self.desired
+        for i, increment in enumerate(self.increments):
+            desired[i] += increment
+
+        for i in (1, 2, 3):
+            d = desired[i] - positions[i]
+            if d >= 1.0 and positions[i + 1] - positions[i] > 1 or d <= -1.0 and positions[i - 1] - positions[i] < -1:
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1]))
+
+    def _linear(self, i: int, d: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + d * (h[i + d] - h[i]) / (n[i + d] - n[i])
+
+    def value(self) -> Any:
+        heights = self.heights
+        if not heights:
+            raise SequenceContainsNoElementsError()
+
+        if len(heights) == 5 and self.positions[4] > 5:
+            return heights[2]
+
+        index = self.q * (len(heights) - 1)
+        lower = math.floor(index)
+        upper = math.ceil(index)
+        if lower == upper:
+            return heights[lower]
+        return heights[lower] + (heights[upper] - heights[lower]) * (index - lower)
+
+
+class SpaceSaving:
+    """Approximate occurrence counts of the most frequent values with
+    the Space-Saving algorithm of Metwally et al.
+
+    At most max_counters values are tracked. When a new value arrives
+    and all counters are taken, the value with the lowest count is
+    evicted and the new value inherits its count. Any value occurring
+    more than n / max_counters times in a sequence of n values is
+    guaranteed to be tracked, and counts are never underestimated.
     """
-    return source.variance().map(lambda i: math.sqrt(i))
+
+    __slots__ = ('max_counters', 'counts', 'heap', 'sequence')
+
+    def __init__(self, max_counters: int) -> None:
+        if max_counters <= 0:
+            raise ArgumentOutOfRangeException()
+
+        self.max_counters = max_counters
+        self.counts: Dict[Any, int] = {}
+        self.heap: List[Any] = []  # (count, sequence, value), lazily invalidated
+        self.sequence = 0
+
+    def _push(self, value: Any, count: int) -> None:
+        self.sequence += 1
+        heapq.heappush(self.heap, (count, self.sequence, value))
+        if len(self.heap) > 4 * self.max_counters:
+            self.heap = [(c, i, v) for i, (v, c) in enumerate(self.counts.items())]
+            heapq.heapify(self.heap)
+
+    def _pop_min(self) -> Any:
+        heap, counts = self.heap, self.counts
+        while True:
+            count, _, value = heapq.heappop(heap)
+            if counts.get(value) == count:
+                return value, count
+
+    def update(self, value: Any) -> None:
+        counts = self.counts
+        count = counts.get(value)
+        if count is None:
+            if len(counts) >= self.max_counters:
+                evicted, count = self._pop_min()
+                del counts[evicted]
+            else:
+                count = 0
+
+        count += 1
+        counts[value] = count
+        self._push(value, count)
+
+    def most_frequent(self) -> List[Any]:
+        counts = self.counts
+        if not counts:
+            raise SequenceContainsNoElementsError()
+
+        highest = max(counts.values())
+        return [value for value, count in counts.items() if count == highest]
+
+
+def _aggregate(state_factory: Callable[[], Any],
+               result_mapper: Callable[[Any], List[Any]]
+               ) -> Callable[[Observable], Observable]:
+    """Feeds every element to the update method of a fresh state per
+    subscription and emits the values returned by result_mapper for the
+    final state when the source completes."""
+
+    def aggregate(source: Observable) -> Observable:
+        def subscribe(observer, scheduler=None):
+            state = state_factory()
+            update = state.update
+
+            def on_next(value: Any) -> None:
+                try:
+                    update(value)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+
+            def on_next_batch(values: List[Any]) -> None:
+                try:
+                    for value in values:
+                        update(value)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+
+            def on_completed() -> None:
+                try:
+                    results = result_mapper(state)
+                except Exception as err:  # pylint: disable=broad-except
+                    observer.on_error(err)
+                    return
+
+                for result in results:
+                    observer.on_next(result)
+                observer.on_completed()
+
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch=on_next_batch)
+        return Observable(subscribe)
+    return aggregate
+
+
+def _variance(ddof: int = 1) -> Callable[[Observable], Observable]:
+    return _aggregate(Moments, lambda moments: [moments.variance(ddof)])
+
+
+def _standard_deviation(ddof: int = 1) -> Callable[[Observable], Observable]:
+    return _aggregate(Moments, lambda moments: [math.sqrt(moments.variance(ddof))])
+
+
+def _quantile(q: float) -> Callable[[Observable], Observable]:
+    P2Quantile(q)  # Validate q eagerly
+    return _aggregate(lambda: P2Quantile(q), lambda estimator: [estimator.value()])
+
+
+def _median() -> Callable[[Observable], Observable]:
+    return _quantile(0.5)
 
 
+def _mode(max_counters: int = 1000) -> Callable[[Observable], Observable]:
+    SpaceSaving(max_counters)  # Validate max_counters eagerly
+    return _aggregate(lambda: SpaceSaving(max_counters), lambda counter: counter.most_frequent())
@@ -3,6 +3,7 @@ from typing import cast, Any, Callable, Union
 
 from rx import from_future
 from rx.core import Observable
+from rx.core.observer import AutoDetachObserver
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable, SerialDisposable
 from rx.internal.utils import is_future
 
@@ -57,7 +58,9 @@ def _switch_latest() -> Callable[[Observable], Observable]:
                         if is_stopped[0]:
                             observer.on_completed()
 
-                d.disposable = obs.subscribe_(on_next, on_error, on_completed, scheduler=scheduler)
+                inner_observer = AutoDetachObserver(on_next, on_error, on_completed)
+                inner_observer.subscription = obs._subscribe_internal(inner_observer, scheduler)
+                d.disposable = inner_observer
 
             def on_completed() -> None:
                 is_stopped[0] = True
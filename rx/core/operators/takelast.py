@@ -1,5 +1,6 @@
 from typing import Callable
 from rx.core import Observable
+from rx.internal import RingBuffer
 
 
 def _take_last(count: int) -> Callable[[Observable], Observable]:
@@ -25,16 +26,14 @@ def _take_last(count: int) -> Callable[[Observable], Observable]:
         """
 
         def subscribe(observer, scheduler=None):
-            q = []
+            q = RingBuffer(max(count, 0))
 
             def on_next(x):
-                q.append(x)
-                if len(q) > count:
-                    q.pop(0)
+                q.enqueue(x)
 
             def on_completed():
                 while q:
-                    observer.on_next(q.pop(0))
+                    observer.on_next(q.dequeue())
                 observer.on_completed()
 
             return source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
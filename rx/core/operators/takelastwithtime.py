@@ -1,5 +1,6 @@
 from typing import Callable, Optional
 from rx.core import Observable, typing
+from rx.internal import RingBuffer
 from rx.scheduler import TimeoutScheduler
 
 
@@ -31,20 +32,20 @@ def _take_last_with_time(duration: typing.RelativeTime, scheduler: Optional[typi
 
             _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
             duration = _scheduler.to_timedelta(duration)
-            q = []
+            q = RingBuffer()
 
             def on_next(x):
                 now = _scheduler.now
-                q.append({"interval": now, "value": x})
-                while q and now - q[0]["interval"] >= duration:
-                    q.pop(0)
+                q.enqueue((now, x))
+                while q and now - q.peek()[0] >= duration:
+                    q.dequeue()
 
             def on_completed():
                 now = _scheduler.now
                 while q:
-                    _next = q.pop(0)
-                    if now - _next["interval"] <= duration:
-                        observer.on_next(_next["value"])
+                    interval, value = q.dequeue()
+                    if now - interval <= duration:
+                        observer.on_next(value)
 
                 observer.on_completed()
 
@@ -1,6 +1,7 @@
 from typing import Any, Callable
 
 from rx.core import Observable
+from rx.core.observable.fusedobservable import FusedStage, TAKE_WHILE, fuse
 from rx.core.typing import Predicate, PredicateIndexed
 
 
@@ -22,31 +23,7 @@ def _take_while(predicate: Predicate, inclusive: bool = False) -> Callable[[Obse
             test no longer passes.
         """
 
-        def subscribe(observer, scheduler=None):
-            running = True
-
-            def on_next(value):
-                nonlocal running
-
-                with source.lock:
-                    if not running:
-                        return
-
-                    try:
-                        running = predicate(value)
-                    except Exception as exn:
-                        observer.on_error(exn)
-                        return
-
-                if running:
-                    observer.on_next(value)
-                else:
-                    if inclusive:
-                        observer.on_next(value)
-                    observer.on_completed()
-
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, FusedStage(TAKE_WHILE, predicate, inclusive=inclusive))
     return take_while
 
 
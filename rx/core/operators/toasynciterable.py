@@ -0,0 +1,117 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, List, Optional, Tuple
+
+from rx.core import Observable
+from rx.internal import ArgumentOutOfRangeException
+
+ON_NEXT = 0
+ON_ERROR = 1
+ON_COMPLETED = 2
+
+
+class AsyncIterableObservable(AsyncIterable):
+    """Iterating subscribes to the source, so every async for gets the
+    elements of a subscription of its own."""
+
+    def __init__(self, source: Observable, max_buffer: Optional[int]) -> None:
+        self.source = source
+        self.max_buffer = max_buffer
+
+    def __aiter__(self) -> AsyncIterator:
+        return self.iterate()
+
+    async def iterate(self) -> AsyncIterator:
+        loop = asyncio.get_event_loop()
+        loop_thread = threading.get_ident()
+        max_buffer = self.max_buffer
+
+        condition = threading.Condition()
+        queue: Deque[Tuple[int, Any]] = deque()
+        waiter: Optional[asyncio.Future] = None
+        is_closed = False
+
+        def wake(future: asyncio.Future) -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def push(items: List[Tuple[int, Any]]) -> None:
+            nonlocal waiter
+
+            on_loop = threading.get_ident() == loop_thread
+            with condition:
+                for item in items:
+                    # The producer is paused while the buffer is full,
+                    # unless it runs on the event loop, which would then
+                    # never get to consume the buffer.
+                    if max_buffer is not None and not on_loop and item[0] == ON_NEXT:
+                        while len(queue) >= max_buffer and not is_closed:
+                            condition.wait()
+                    if is_closed:
+                        return
+                    queue.append(item)
+
+                future, waiter = waiter, None
+
+            if future is not None:
+                if on_loop:
+                    wake(future)
+                else:
+                    loop.call_soon_threadsafe(wake, future)
+
+        def on_next(value: Any) -> None:
+            push([(ON_NEXT, value)])
+
+        def on_next_batch(values: List[Any]) -> None:
+            push([(ON_NEXT, value) for value in values])
+
+        def on_error(error: Exception) -> None:
+            push([(ON_ERROR, error)])
+
+        def on_completed() -> None:
+            push([(ON_COMPLETED, None)])
+
+        subscription = self.source.subscribe_(on_next, on_error, on_completed, on_next_batch=on_next_batch)
+        try:
+            while True:
+                with condition:
+                    if queue:
+                        kind, value = queue.popleft()
+                        condition.notify()
+                    else:
+                        kind = None
+                        waiter = future = loop.create_future()
+
+                if kind is None:
+                    await future
+                elif kind == ON_NEXT:
+                    yield value
+                elif kind == ON_ERROR:
+                    raise value
+                else:
+                    return
+        finally:
+            with condition:
+                is_closed = True
+                queue.clear()
+                condition.notify_all()
+            subscription.dispose()
+
+
+def _to_async_iterable(max_buffer: Optional[int] = None) -> Callable[[Observable], AsyncIterable]:
+    if max_buffer is not None and max_buffer <= 0:
+        raise ArgumentOutOfRangeException()
+
+    def to_async_iterable(source: Observable) -> AsyncIterable:
+        """Converts an observable sequence to an asynchronous iterable.
+
+        Args:
+            source: Source observable.
+
+        Returns:
+            An asynchronous iterable of the elements of the source.
+        """
+
+        return AsyncIterableObservable(source, max_buffer)
+    return to_async_iterable
@@ -19,10 +19,13 @@ def _to_iterable() -> Callable[[Observable], Observable]:
             def on_next(item):
                 queue.append(item)
 
+            def on_next_batch(items):
+                queue.extend(items)
+
             def on_completed():
                 observer.on_next(queue)
                 observer.on_completed()
 
-            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
+            return source.subscribe_(on_next, observer.on_error, on_completed, scheduler, on_next_batch=on_next_batch)
         return Observable(subscribe)
     return to_iterable
\ No newline at end of file
@@ -3,6 +3,7 @@ import logging
 
 from rx.core import Observable
 from rx.internal.utils import add_ref
+from rx.internal import RingBuffer
 from rx.disposable import SingleAssignmentDisposable, RefCountDisposable
 from rx.internal.exceptions import ArgumentOutOfRangeException
 from rx.subject import Subject
@@ -42,11 +43,11 @@ def _window_with_count(count: int, skip: Optional[int] = None) -> Callable[[Obse
             m = SingleAssignmentDisposable()
             refCountDisposable = RefCountDisposable(m)
             n = [0]
-            q = []
+            q = RingBuffer()
 
             def create_window():
                 s = Subject()
-                q.append(s)
+                q.enqueue(s)
                 observer.on_next(add_ref(s, refCountDisposable))
 
             create_window()
@@ -57,7 +58,7 @@ def _window_with_count(count: int, skip: Optional[int] = None) -> Callable[[Obse
 
                 c = n[0] - count + 1
                 if c >= 0 and c % skip == 0:
-                    s = q.pop(0)
+                    s = q.dequeue()
                     s.on_completed()
 
                 n[0] += 1
@@ -66,12 +67,12 @@ def _window_with_count(count: int, skip: Optional[int] = None) -> Callable[[Obse
 
             def on_error(exception):
                 while q:
-                    q.pop(0).on_error(exception)
+                    q.dequeue().on_error(exception)
                 observer.on_error(exception)
 
             def on_completed():
                 while q:
-                    q.pop(0).on_completed()
+                    q.dequeue().on_completed()
                 observer.on_completed()
 
             m.disposable = source.subscribe_(on_next, on_error, on_completed, scheduler)
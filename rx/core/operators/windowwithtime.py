@@ -3,6 +3,7 @@ from datetime import timedelta
 
 from rx.core import Observable, typing
 from rx.scheduler import TimeoutScheduler
+from rx.internal import RingBuffer
 from rx.internal.constants import DELTA_ZERO
 from rx.internal.utils import add_ref
 from rx.disposable import SingleAssignmentDisposable, CompositeDisposable, RefCountDisposable, SerialDisposable
@@ -27,7 +28,7 @@ def _window_with_time(timespan: typing.RelativeTime, timeshift: Optional[typing.
             next_shift = [timeshift]
             next_span = [timespan]
             total_time = [DELTA_ZERO]
-            q = []
+            q = RingBuffer()
 
             group_disposable = CompositeDisposable(timer_d)
             ref_count_disposable = RefCountDisposable(group_disposable)
@@ -61,18 +62,18 @@ def _window_with_time(timespan: typing.RelativeTime, timeshift: Optional[typing.
 
                     if is_shift:
                         s = Subject()
-                        q.append(s)
+                        q.enqueue(s)
                         observer.on_next(add_ref(s, ref_count_disposable))
 
                     if is_span:
-                        s = q.pop(0)
+                        s = q.dequeue()
                         s.on_completed()
 
                     create_timer()
                 m.disposable = _scheduler.schedule_relative(ts, action)
 
-            q.append(Subject())
-            observer.on_next(add_ref(q[0], ref_count_disposable))
+            q.enqueue(Subject())
+            observer.on_next(add_ref(q.peek(), ref_count_disposable))
             create_timer()
 
             def on_next(x):
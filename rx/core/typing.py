@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, Callable, Generic, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar, Union
 from datetime import datetime, timedelta
 from threading import Thread
 
@@ -17,6 +17,7 @@ Action = Callable[[], None]
 OnNext = Callable[[Any], None]
 OnError = Callable[[Exception], None]
 OnCompleted = Callable[[], None]
+OnNextBatch = Callable[[List[Any]], None]
 
 Mapper = Callable[[T1], T2]
 MapperIndexed = Callable[[T1, int], T2]
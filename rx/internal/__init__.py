@@ -1,5 +1,7 @@
 from .priorityqueue import PriorityQueue
+from .ringbuffer import RingBuffer
 from .basic import noop, default_error, default_comparer
 from .exceptions import SequenceContainsNoElementsError, ArgumentOutOfRangeException, DisposedException
+from .exceptions import BufferOverflowException
 from . import concurrency
 from . import constants
@@ -29,3 +29,8 @@ class CompletedException(Exception):
 class WouldBlockException(Exception):
     def __init__(self, msg=None):
         super(WouldBlockException, self).__init__(msg or "Would block")
+
+
+class BufferOverflowException(Exception):
+    def __init__(self, msg=None):
+        super(BufferOverflowException, self).__init__(msg or "Buffer overflow")
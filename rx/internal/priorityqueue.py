@@ -1,54 +1,173 @@
-import heapq
 from sys import maxsize
-from typing import Generic, List, Tuple
+from typing import Dict, Generic, List
 
 from rx.core.typing import T1
 
 
+class HeapEntry(Generic[T1]):
+    """An item in a PriorityQueue, knowing its position in the heap."""
+
+    __slots__ = ('item', 'count', 'index', 'removed')
+
+    def __init__(self, item: T1, count: int, index: int) -> None:
+        self.item = item
+        self.count = count
+        self.index = index
+        self.removed = False
+
+    def __lt__(self, other: 'HeapEntry[T1]') -> bool:
+        if self.item < other.item:
+            return True
+        if other.item < self.item:
+            return False
+        return self.count < other.count
+
+
 class PriorityQueue(Generic[T1]):
-    """Priority queue for scheduling. Note that methods aren't thread-safe."""
+    """Priority queue for scheduling. Note that methods aren't thread-safe.
+
+    The queue is an indexed binary heap: every item knows its position,
+    so it can be removed in O(log n) time. Items are identified by
+    identity, and should not be added more than once at the same time.
+
+    Items may also be discarded lazily in O(1) time. They are skipped
+    when they reach the front, and the heap is rebuilt without them once
+    they make up more than COMPACT_RATIO of the heap.
+    """
 
     MIN_COUNT = ~maxsize
+    COMPACT_RATIO = 0.5
+    COMPACT_MIN = 64
 
     def __init__(self) -> None:
-        self.items: List[Tuple[T1, int]] = []
+        self.items: List[HeapEntry[T1]] = []
+        self.index: Dict[int, HeapEntry[T1]] = {}
         self.count = PriorityQueue.MIN_COUNT  # Monotonic increasing for sort stability
+        self.discarded = 0
 
     def __len__(self):
         """Returns length of queue"""
 
-        return len(self.items)
+        return len(self.items) - self.discarded
 
     def peek(self) -> T1:
         """Returns first item in queue without removing it"""
-        return self.items[0][0]
+
+        self._skip_discarded()
+        return self.items[0].item
 
     def dequeue(self) -> T1:
         """Returns and removes item with lowest priority from queue"""
 
-        item: T1 = heapq.heappop(self.items)[0]
+        self._skip_discarded()
+        entry = self.items[0]
+        self._remove_at(0)
         if not self.items:
             self.count = PriorityQueue.MIN_COUNT
-        return item
+        return entry.item
 
     def enqueue(self, item: T1) -> None:
         """Adds item to queue"""
 
-        heapq.heappush(self.items, (item, self.count))
+        entry = HeapEntry(item, self.count, len(self.items))
         self.count += 1
+        self.items.append(entry)
+        self.index[id(item)] = entry
+        self._sift_up(entry.index)
 
     def remove(self, item: T1) -> bool:
         """Remove given item from queue"""
 
-        for index, _item in enumerate(self.items):
-            if _item[0] == item:
-                self.items.pop(index)
-                heapq.heapify(self.items)
-                return True
+        entry = self.index.get(id(item))
+        if entry is None or entry.removed:
+            return False
+
+        self._remove_at(entry.index)
+        return True
+
+    def discard(self, item: T1) -> bool:
+        """Marks given item as removed without restructuring the heap.
+        The item no longer counts towards the length of the queue."""
+
+        entry = self.index.pop(id(item), None)
+        if entry is None or entry.removed:
+            return False
+
+        entry.removed = True
+        self.discarded += 1
+        if self.discarded >= PriorityQueue.COMPACT_MIN \
+                and self.discarded > len(self.items) * PriorityQueue.COMPACT_RATIO:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Rebuilds the heap without the discarded items."""
 
-        return False
+        items = [entry for entry in self.items if not entry.removed]
+        for index, entry in enumerate(items):
+            entry.index = index
+        self.items = items
+        self.discarded = 0
+        for index in reversed(range(len(items) // 2)):
+            self._sift_down(index)
 
     def clear(self):
         """Remove all items from the queue."""
         self.items = []
+        self.index = {}
         self.count = PriorityQueue.MIN_COUNT
+        self.discarded = 0
+
+    def _skip_discarded(self) -> None:
+        items = self.items
+        while items and items[0].removed:
+            self._remove_at(0)
+            self.discarded -= 1
+
+    def _remove_at(self, index: int) -> None:
+        items = self.items
+        entry = items[index]
+        if not entry.removed and self.index.get(id(entry.item)) is entry:
+            del self.index[id(entry.item)]
+
+        last = items.pop()
+        if index < len(items):
+            items[index] = last
+            last.index = index
+            self._sift_down(index)
+            self._sift_up(last.index)
+
+    def _sift_up(self, index: int) -> None:
+        items = self.items
+        entry = items[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = items[parent_index]
+            if not entry < parent:
+                break
+            items[index] = parent
+            parent.index = index
+            index = parent_index
+        items[index] = entry
+        entry.index = index
+
+    def _sift_down(self, index: int) -> None:
+        items = self.items
+        size = len(items)
+        entry = items[index]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            child = items[child_index]
+            right_index = child_index + 1
+            if right_index < size and items[right_index] < child:
+                child_index = right_index
+                child = items[right_index]
+            if not child < entry:
+                break
+            items[index] = child
+            child.index = index
+            index = child_index
+        items[index] = entry
+        entry.index = index
@@ -0,0 +1,71 @@
+from collections import deque
+from typing import Deque, Generic, Iterable, Iterator, Optional
+
+from rx.core.typing import T1
+
+
+class RingBuffer(Generic[T1]):
+    """First-in first-out queue with constant time enqueue and dequeue.
+
+    With a capacity the buffer never holds more than capacity items;
+    enqueueing into a full buffer drops the oldest item. Note that
+    methods aren't thread-safe."""
+
+    __slots__ = ('items',)
+
+    def __init__(self, capacity: Optional[int] = None, items: Iterable[T1] = ()) -> None:
+        self.items: Deque[T1] = deque(items, capacity)
+
+    def __len__(self) -> int:
+        """Returns length of queue"""
+
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T1]:
+        """Iterates the items from oldest to newest"""
+
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> T1:
+        """Returns item at index, constant time near either end"""
+
+        return self.items[index]
+
+    def __setitem__(self, index: int, item: T1) -> None:
+        """Replaces item at index, constant time near either end"""
+
+        self.items[index] = item
+
+    @property
+    def capacity(self) -> Optional[int]:
+        return self.items.maxlen
+
+    def is_full(self) -> bool:
+        """Returns True if enqueueing would drop the oldest item"""
+
+        return self.items.maxlen is not None and len(self.items) >= self.items.maxlen
+
+    def peek(self) -> T1:
+        """Returns oldest item without removing it"""
+
+        return self.items[0]
+
+    def enqueue(self, item: T1) -> None:
+        """Adds item to the end of queue"""
+
+        self.items.append(item)
+
+    def dequeue(self) -> T1:
+        """Returns and removes oldest item from queue"""
+
+        return self.items.popleft()
+
+    def requeue(self, item: T1) -> None:
+        """Puts item back at the front of queue, to be dequeued next"""
+
+        self.items.appendleft(item)
+
+    def clear(self) -> None:
+        """Removes all items"""
+
+        self.items.clear()
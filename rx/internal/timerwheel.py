@@ -0,0 +1,121 @@
+import heapq
+from typing import Any, Callable, Dict, List, Optional
+
+
+class TimerEntry:
+    """A timer in a TimerWheel, expiring at an integer time."""
+
+    __slots__ = ('expiration', 'action', 'bucket', 'cancelled')
+
+    def __init__(self, expiration: int, action: Callable[[], Any]) -> None:
+        self.expiration = expiration
+        self.action = action
+        self.bucket: Optional['TimerBucket'] = None
+        self.cancelled = False
+
+
+class TimerBucket:
+    """The timers of one slot of a wheel. All of them expire within
+    one tick of the level, and are handled together."""
+
+    __slots__ = ('entries', 'expiration')
+
+    def __init__(self) -> None:
+        self.entries: Dict[TimerEntry, None] = {}
+        self.expiration: Optional[int] = None
+
+
+class TimerLevel:
+    __slots__ = ('tick', 'interval', 'current_time', 'buckets')
+
+    def __init__(self, tick: int, wheel_size: int, now: int) -> None:
+        self.tick = tick
+        self.interval = tick * wheel_size
+        self.current_time = now - now % tick
+        self.buckets = [TimerBucket() for _ in range(wheel_size)]
+
+
+class TimerWheel:
+    """Hierarchical timing wheel. Note that methods aren't thread-safe.
+
+    The first level has wheel_size slots of one tick each. Every next
+    level has wheel_size slots spanning a whole turn of the level below,
+    and is added when a timer expires beyond the levels so far. Timers
+    expiring in the same slot share a bucket, and only buckets holding
+    timers are kept in a priority queue, ordered by expiration. When a
+    bucket of a higher level expires, its timers are cascaded into the
+    levels below.
+
+    Adding and removing a timer takes constant time, apart from pushing
+    a bucket that was empty onto the priority queue.
+    """
+
+    def __init__(self, now: int, tick: int = 1, wheel_size: int = 64) -> None:
+        self.wheel_size = wheel_size
+        self.levels = [TimerLevel(tick, wheel_size, now)]
+        self.queue: List[Any] = []  # (expiration, sequence, bucket)
+        self.sequence = 0
+
+    def add(self, entry: TimerEntry) -> bool:
+        """Adds entry to the wheel. Returns False if the entry is
+        already due, in which case it is not added."""
+
+        expiration = entry.expiration
+        levels = self.levels
+        level = levels[0]
+        if expiration < level.current_time + level.tick:
+            return False
+
+        index = 0
+        while expiration >= level.current_time + level.interval:
+            index += 1
+            if index == len(levels):
+                levels.append(TimerLevel(level.interval, self.wheel_size, level.current_time))
+            level = levels[index]
+
+        virtual = expiration // level.tick
+        bucket = level.buckets[virtual % self.wheel_size]
+        bucket.entries[entry] = None
+        entry.bucket = bucket
+
+        bucket_expiration = virtual * level.tick
+        if bucket.expiration != bucket_expiration:
+            bucket.expiration = bucket_expiration
+            self.sequence += 1
+            heapq.heappush(self.queue, (bucket_expiration, self.sequence, bucket))
+        return True
+
+    def remove(self, entry: TimerEntry) -> None:
+        """Removes entry from the wheel."""
+
+        bucket = entry.bucket
+        if bucket is not None:
+            bucket.entries.pop(entry, None)
+            entry.bucket = None
+
+    def next_expiration(self) -> Optional[int]:
+        """Returns the time at which the earliest bucket expires, or
+        None if the wheel is empty."""
+
+        return self.queue[0][0] if self.queue else None
+
+    def advance(self, now: int) -> List[TimerEntry]:
+        """Advances the wheel to now and returns the timers that are
+        due, in order of expiration."""
+
+        due: List[TimerEntry] = []
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            expiration, _, bucket = heapq.heappop(queue)
+            for level in self.levels:
+                if expiration >= level.current_time + level.tick:
+                    level.current_time = expiration - expiration % level.tick
+
+            entries = bucket.entries
+            bucket.entries = {}
+            bucket.expiration = None
+            for entry in entries:
+                entry.bucket = None
+                if not self.add(entry):
+                    due.append(entry)
+        return due
@@ -1,6 +1,6 @@
 from functools import update_wrapper
 from types import FunctionType
-from typing import cast, Any, Callable, Iterable
+from typing import cast, Any, Callable, Iterable, List
 
 from rx.disposable import CompositeDisposable
 
@@ -9,11 +9,26 @@ def add_ref(xs, r):
     from rx.core import Observable
 
     def subscribe(observer, scheduler=None):
-        return CompositeDisposable(r.disposable, xs.subscribe(observer))
+        return CompositeDisposable(r.disposable, xs._subscribe_internal(observer))
 
     return Observable(subscribe)
 
 
+def batch_emitter(observer: Any) -> Callable[[List[Any]], None]:
+    """Returns a function pushing a list of elements to the observer.
+    The list is passed in a single on_next_batch call if the observer
+    supports batches, else element by element to on_next."""
+
+    on_next_batch = getattr(observer, 'on_next_batch', None)
+    if on_next_batch is not None:
+        return on_next_batch
+
+    def emit(values: List[Any]) -> None:
+        for value in values:
+            observer.on_next(value)
+    return emit
+
+
 def is_future(fut: Any) -> bool:
     return callable(getattr(fut, 'add_done_callback', None))
 
@@ -1,12 +1,13 @@
 # pylint: disable=too-many-lines,redefined-outer-name,redefined-builtin
 
 from asyncio import Future
-from typing import Callable, Union, Any, Iterable, List, Optional, cast, overload
+from typing import AsyncIterable, Callable, Union, Any, Iterable, List, Optional, cast, overload
 from datetime import timedelta, datetime
 
 from rx.internal.utils import NotSet
 from rx.core import Observable, ConnectableObservable, GroupedObservable, typing, pipe
 from rx.core.typing import Mapper, MapperIndexed, Predicate, PredicateIndexed, Comparer, Accumulator
+from rx.scheduler import ProcessPoolScheduler
 from rx.subject import Subject
 
 
@@ -103,6 +104,33 @@ def average(key_mapper: Optional[Mapper] = None) -> Callable[[Observable], Obser
     return _average(key_mapper)
 
 
+def batch_with_count(count: int) -> Callable[[Observable], Observable]:
+    """Pushes the elements of an observable sequence downstream in
+    batches of count elements.
+
+    Unlike :func:`buffer_with_count`, the elements of the sequence are
+    unchanged: each batch is delivered in a single ``on_next_batch``
+    call to observers and operators that support batches (e.g.
+    :func:`map`, :func:`filter`, :func:`scan`, :func:`reduce`,
+    :func:`count`, :func:`sum` and :func:`to_list`), and element by
+    element to all others. Pending elements are flushed when the source
+    terminates.
+
+    Examples:
+        >>> res = batch_with_count(1000)
+
+    Args:
+        count: Number of elements per batch.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence with the same elements delivered
+        in batches.
+    """
+    from rx.core.operators.batchwithcount import _batch_with_count
+    return _batch_with_count(count)
+
+
 def buffer(boundaries: Observable) -> Callable[[Observable], Observable]:
     """Projects each element of an observable sequence into zero or
     more buffers.
@@ -329,7 +357,7 @@ def catch(handler: Union[Observable, Callable[[Exception, Observable], Observabl
     return _catch(handler)
 
 
-def combine_latest(*others: Observable) -> Callable[[Observable], Observable]:
+def combine_latest(*others: Observable, snapshot: bool = False) -> Callable[[Observable], Observable]:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever any of the
     observable sequences produces an element.
@@ -345,6 +373,13 @@ def combine_latest(*others: Observable) -> Callable[[Observable], Observable]:
     Examples:
         >>> obs = combine_latest(other)
         >>> obs = combine_latest(obs1, obs2, obs3)
+        >>> obs = combine_latest(*others, snapshot=True)
+
+    Args:
+        others: Observable sources to combine with the source.
+        snapshot: [Optional] If True, a read-only sequence sharing the
+            latest values is emitted instead of a tuple, see
+            :func:`rx.combine_latest`.
 
     Returns:
         An operator function that takes an observable sources and
@@ -352,7 +387,38 @@ def combine_latest(*others: Observable) -> Callable[[Observable], Observable]:
         combining elements of the sources into a tuple.
     """
     from rx.core.operators.combinelatest import _combine_latest
-    return _combine_latest(*others)
+    return _combine_latest(*others, snapshot=snapshot)
+
+
+def combine_latest_keyed() -> Callable[[Observable], Observable]:
+    """Keeps the latest value of every inner observable sequence of
+    an observable sequence of keyed sequences, and emits an update for
+    every value of an inner sequence.
+
+    The source emits (key, observable) pairs or grouped observables,
+    e.g. from :func:`group_by`, so sources can be added while
+    running. Instead of a tuple of all the latest values, every update
+    is a (key, value, snapshot) tuple, where snapshot is a read-only
+    mapping of the latest value of every key that has emitted so far.
+    The mapping is shared between updates and only copied when a
+    previous snapshot is still referenced. The work per update does
+    not grow with the number of keys as long as consumers drop each
+    snapshot before the next update; otherwise every update copies the
+    latest values of all keys.
+
+    Examples:
+        >>> res = source.pipe(group_by(lambda x: x.id), combine_latest_keyed())
+        >>> res = rx.of(("a", obs1), ("b", obs2)).pipe(combine_latest_keyed())
+
+    Returns:
+        An operator function that takes an observable sequence of
+        (key, observable) pairs or grouped observables and returns an
+        observable sequence of (key, value, snapshot) tuples. The
+        sequence completes when the source and all inner sequences
+        have completed.
+    """
+    from rx.core.operators.combinelatestkeyed import _combine_latest_keyed
+    return _combine_latest_keyed()
 
 
 def concat(*sources: Observable) -> Callable[[Observable], Observable]:
@@ -611,7 +677,12 @@ def delay(duetime: typing.RelativeTime,
 
 
 def distinct(key_mapper: Optional[Mapper] = None,
-             comparer: Optional[Comparer] = None
+             comparer: Optional[Comparer] = None,
+             max_keys: Optional[int] = None,
+             ttl: Optional[typing.RelativeTime] = None,
+             bloom_capacity: Optional[int] = None,
+             false_positive_rate: float = 0.001,
+             scheduler: Optional[typing.Scheduler] = None
              ) -> Callable[[Observable], Observable]:
     """Returns an observable sequence that contains only distinct
     elements according to the key_mapper and the comparer. Usage of
@@ -626,15 +697,36 @@ def distinct(key_mapper: Optional[Mapper] = None,
         -0-1-2---3-4-------|
 
 
+    Without a comparer the keys are kept in a hash set and must be
+    hashable when any of max_keys, ttl or bloom_capacity is given. The
+    lookup structure can be bounded by forgetting keys: with max_keys
+    the least recently seen keys beyond max_keys, with ttl the keys not
+    seen for ttl. A forgotten key is emitted again when it reappears.
+    For huge key spaces bloom_capacity switches to a probabilistic
+    filter of fixed size, which may occasionally drop a new element.
+
     Examples:
         >>> res = obs = xs.distinct()
         >>> obs = xs.distinct(lambda x: x.id)
         >>> obs = xs.distinct(lambda x: x.id, lambda a,b: a == b)
+        >>> obs = xs.distinct(lambda x: x.id, max_keys=100000)
+        >>> obs = xs.distinct(lambda x: x.id, ttl=60.0)
+        >>> obs = xs.distinct(lambda x: x.id, bloom_capacity=10000000)
 
     Args:
         key_mapper: [Optional]  A function to compute the comparison
             key for each element.
         comparer: [Optional]  Used to compare items in the collection.
+            Keys are then looked up with a linear scan.
+        max_keys: [Optional] Maximum number of keys to remember.
+        ttl: [Optional] Time after which a key that has not been seen
+            again is forgotten.
+        bloom_capacity: [Optional] Use a Bloom filter remembering at
+            least this many most recent distinct keys. Cannot be
+            combined with comparer, max_keys or ttl.
+        false_positive_rate: [Optional] Target rate at which the Bloom
+            filter mistakes a new key for a duplicate.
+        scheduler: [Optional] Scheduler providing the clock for ttl.
 
     Returns:
         An operator function that takes an observable source and
@@ -643,7 +735,7 @@ def distinct(key_mapper: Optional[Mapper] = None,
         sequence.
     """
     from rx.core.operators.distinct import _distinct
-    return _distinct(key_mapper, comparer)
+    return _distinct(key_mapper, comparer, max_keys, ttl, bloom_capacity, false_positive_rate, scheduler)
 
 
 def distinct_until_changed(key_mapper: Optional[Mapper] = None,
@@ -1179,7 +1271,10 @@ def flat_map_latest(mapper: Mapper) -> Callable[[Observable], Observable]:
 
 
 def group_by(key_mapper: Mapper,
-             element_mapper: Optional[Mapper] = None
+             element_mapper: Optional[Mapper] = None,
+             max_groups: Optional[int] = None,
+             idle_timeout: Optional[typing.RelativeTime] = None,
+             scheduler: Optional[typing.Scheduler] = None
              ) -> Callable[[Observable], Observable]:
     """Groups the elements of an observable sequence according to a
     specified key mapper function and comparer and selects the
@@ -1194,14 +1289,29 @@ def group_by(key_mapper: Mapper,
                +a-----b--c-|
          +1--2-----3-------|
 
+    Groups live until the source terminates, unless they are bounded
+    by max_groups or idle_timeout. A group that is evicted or has been
+    idle for too long completes, and a new group with the same key is
+    created when an element with that key arrives again. The returned
+    sequence has a ``group_count`` property and a ``group_sizes()``
+    method, returning the number of elements received by every live
+    group, to keep an eye on the groups that are live.
+
     Examples:
         >>> group_by(lambda x: x.id)
         >>> group_by(lambda x: x.id, lambda x: x.name)
+        >>> group_by(lambda x: x.user, max_groups=10000, idle_timeout=1800)
 
     Keyword arguments:
         key_mapper: A function to extract the key for each element.
         element_mapper: [Optional] A function to map each source
             element to an element in an observable group.
+        max_groups: [Optional] The maximum number of live groups. When
+            a new group would exceed it, the group that received an
+            element least recently completes first.
+        idle_timeout: [Optional] Relative time after which a group that
+            has not received an element completes.
+        scheduler: [Optional] Scheduler to run the idle timers on.
 
     Returns:
         An operator function that takes an observable source and
@@ -1210,7 +1320,47 @@ def group_by(key_mapper: Mapper,
         share that same key value.
     """
     from rx.core.operators.groupby import _group_by
-    return _group_by(key_mapper, element_mapper)
+    return _group_by(key_mapper, element_mapper, max_groups, idle_timeout, scheduler)
+
+
+def group_by_parallel(key_mapper: Mapper,
+                      element_mapper: Optional[Mapper] = None,
+                      workers: Optional[int] = None,
+                      scheduler: Optional[typing.Scheduler] = None
+                      ) -> Callable[[Observable], Observable]:
+    """Groups the elements of an observable sequence like
+    :func:`group_by`, and observes every group on a worker thread.
+
+    Every key is hashed onto one of the workers, so the pipelines of
+    different groups run in parallel while the elements of a group
+    keep their order. All groups of a key run on the same worker, and
+    one worker may run the groups of several keys.
+
+    Examples:
+        >>> res = source.pipe(
+        ...     group_by_parallel(lambda x: x.user, workers=4),
+        ...     flat_map(lambda grp: grp.pipe(reduce(aggregate)))
+        ... )
+
+    Args:
+        key_mapper: A function to extract the key for each element.
+        element_mapper: [Optional] A function to map each source
+            element to an element in an observable group.
+        workers: [Optional] The number of worker threads. Defaults to
+            the number of processors. The threads of the workers are
+            started on demand and end when they have no work left.
+        scheduler: [Optional] A scheduler routing work for a key with
+            a ``shard(key)`` method, e.g.
+            :class:`rx.scheduler.eventloop.AsyncIOShardedScheduler`,
+            to use instead of worker threads.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns a sequence of observable groups, each of which delivers
+        its elements on the worker of its key.
+    """
+    from rx.core.operators.groupbyparallel import _group_by_parallel
+    return _group_by_parallel(key_mapper, element_mapper, workers, scheduler)
 
 
 def group_by_until(key_mapper: Mapper,
@@ -1564,6 +1714,32 @@ def max_by(key_mapper: Mapper,
     return _max_by(key_mapper, comparer)
 
 
+def median() -> Callable[[Observable], Observable]:
+    """Estimates the median of an observable sequence of values.
+
+    The estimate is maintained with the P-square algorithm, so only
+    five markers are kept in memory regardless of the length of the
+    sequence. Sequences of up to five elements give the exact median.
+
+    .. marble::
+        :alt: median
+
+        ---1--5--3--4--2-|
+        [    median()    ]
+        -----------------3|
+
+    Examples:
+        >>> op = median()
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the estimated median of the sequence of values.
+    """
+    from rx.core.operators.statistics import _median
+    return _median()
+
+
 def merge(*sources: Observable,
           max_concurrent: Optional[int] = None
           ) -> Callable[[Observable], Observable]:
@@ -1682,6 +1858,39 @@ def min_by(key_mapper: Mapper,
     return _min_by(key_mapper, comparer)
 
 
+def mode(max_counters: int = 1000) -> Callable[[Observable], Observable]:
+    """Returns the most frequently occurring value(s) of an observable
+    sequence.
+
+    Occurrences are counted with the Space-Saving heavy hitter
+    algorithm, keeping at most max_counters values in memory. Any value
+    occurring more often than once every max_counters elements is
+    guaranteed to be counted. If several values share the highest
+    count, all of them are emitted.
+
+    .. marble::
+        :alt: mode
+
+        ---1--2--2--3--2-|
+        [     mode()     ]
+        -----------------2|
+
+    Examples:
+        >>> op = mode()
+        >>> op = mode(max_counters=100)
+
+    Args:
+        max_counters: [Optional] Maximum number of distinct values to
+            count at once.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of the most frequent values.
+    """
+    from rx.core.operators.statistics import _mode
+    return _mode(max_counters)
+
+
 def multicast(subject: Optional[typing.Subject] = None,
               subject_factory: Optional[Callable[[Optional[typing.Scheduler]], typing.Subject]] = None,
               mapper: Optional[Callable[[ConnectableObservable], Observable]]  = None
@@ -1717,12 +1926,34 @@ def multicast(subject: Optional[typing.Subject] = None,
     return _multicast(subject, subject_factory, mapper)
 
 
-def observe_on(scheduler: typing.Scheduler) -> Callable[[Observable], Observable]:
+def observe_on(scheduler: typing.Scheduler,
+               budget: Optional[int] = None,
+               buffer_size: Optional[int] = None,
+               overflow: str = 'block'
+               ) -> Callable[[Observable], Observable]:
     """Wraps the source sequence in order to run its observer callbacks
     on the specified scheduler.
 
     Args:
         scheduler: Scheduler to notify observers on.
+        budget: [Optional] Maximum number of notifications delivered
+            per scheduled action before yielding to other work on the
+            scheduler, counting every element of a batch. By default
+            all queued notifications are delivered at once.
+        buffer_size: [Optional] Maximum number of elements waiting to
+            be delivered. By default the queue is unbounded.
+        overflow: [Optional] What to do with an element arriving while
+            buffer_size elements are waiting: 'block' the producer
+            until there is room, 'drop_newest' to discard the element,
+            'drop_oldest' to discard the oldest waiting element,
+            'latest' to replace the newest waiting element, or 'error'
+            to terminate the sequence with a BufferOverflowException.
+            Blocking requires the producer to run on another thread
+            than the scheduler.
+
+    Examples:
+        >>> res = observe_on(pool_scheduler)
+        >>> res = observe_on(pool_scheduler, buffer_size=1000, overflow='drop_oldest')
 
     This only invokes observer callbacks on a scheduler. In case the
     subscription and/or unsubscription actions have side-effects
@@ -1734,7 +1965,7 @@ def observe_on(scheduler: typing.Scheduler) -> Callable[[Observable], Observable
         specified scheduler.
     """
     from rx.core.operators.observeon import _observe_on
-    return _observe_on(scheduler)
+    return _observe_on(scheduler, budget, buffer_size, overflow)
 
 
 def on_error_resume_next(second: Observable) -> Callable[[Observable], Observable]:
@@ -1782,6 +2013,60 @@ def pairwise() -> Callable[[Observable], Observable]:
     return _pairwise()
 
 
+def parallel_map(mapper: Mapper,
+                 max_workers: Optional[int] = None,
+                 ordered: bool = True,
+                 chunksize: int = 1,
+                 scheduler: Optional[ProcessPoolScheduler] = None,
+                 buffer_size: Optional[int] = None,
+                 overflow: str = 'block'
+                 ) -> Callable[[Observable], Observable]:
+    """Projects each element of an observable sequence into a new form
+    by running the mapper in worker processes.
+
+    The elements are sent to the processes in chunks of chunksize
+    elements, and at most twice as many chunks as there are workers are
+    processed at a time. Further chunks wait to be submitted, without
+    limit unless buffer_size is given. The mapped elements are emitted
+    from the thread receiving the results of the pool; use
+    :func:`observe_on` to continue on another scheduler.
+
+    Examples:
+        >>> res = parallel_map(parse)
+        >>> res = parallel_map(parse, max_workers=8, chunksize=100)
+        >>> res = parallel_map(parse, ordered=False)
+        >>> res = parallel_map(parse, buffer_size=100, overflow='error')
+
+    Args:
+        mapper: A picklable function to apply to each element, e.g.
+            defined at module level.
+        max_workers: [Optional] Number of worker processes. Defaults to
+            the number of processors.
+        ordered: [Optional] If True, the elements are emitted in source
+            order. Otherwise each chunk is emitted as soon as it has
+            been mapped.
+        chunksize: [Optional] Number of elements sent to a worker
+            process at once.
+        scheduler: [Optional] The :class:`rx.scheduler.ProcessPoolScheduler`
+            providing the worker processes; other schedulers cannot
+            run the chunks. If not given, a pool is
+            created for each subscription and shut down when the
+            subscription ends.
+        buffer_size: [Optional] Maximum number of chunks waiting to be
+            submitted to the pool. By default the queue is unbounded.
+        overflow: [Optional] What to do with a chunk arriving while
+            buffer_size chunks are waiting: 'block' the producer until
+            there is room, or 'error' to terminate the sequence with a
+            BufferOverflowException.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of the mapped elements.
+    """
+    from rx.core.operators.parallelmap import _parallel_map
+    return _parallel_map(mapper, max_workers, ordered, chunksize, scheduler, buffer_size, overflow)
+
+
 def partition(predicate: Predicate) -> Callable[[Observable], List[Observable]]:
     """Returns two observables which partition the observations of the
     source by the given function. The first will trigger observations
@@ -1944,6 +2229,36 @@ def publish_value(initial_value: Any, mapper: Optional[Mapper] = None) -> Callab
     return _publish_value(initial_value, mapper)
 
 
+def quantile(q: float) -> Callable[[Observable], Observable]:
+    """Estimates the q-th quantile of an observable sequence of values.
+
+    The estimate is maintained with the P-square algorithm, so only
+    five markers are kept in memory regardless of the length of the
+    sequence. Sequences of up to five elements give the exact quantile,
+    interpolated linearly between the closest elements.
+
+    .. marble::
+        :alt: quantile
+
+        ---1--5--3--4--2-|
+        [ quantile(0.25) ]
+        -----------------2|
+
+    Examples:
+        >>> op = quantile(0.99)
+
+    Args:
+        q: The quantile to estimate, between 0 and 1.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the estimated quantile of the sequence of values.
+    """
+    from rx.core.operators.statistics import _quantile
+    return _quantile(q)
+
+
 def reduce(accumulator: Accumulator, seed: Any = NotSet) -> Callable[[Observable], Observable]:
     """The reduce operator.
 
@@ -2658,6 +2973,28 @@ def starmap_indexed(mapper: Optional[MapperIndexed] = None
     return pipe(map(lambda values: cast(MapperIndexed, mapper)(*values)))
 
 
+def standard_deviation(ddof: int = 1) -> Callable[[Observable], Observable]:
+    """Computes the standard deviation of an observable sequence of
+    values in constant memory.
+
+    Examples:
+        >>> op = standard_deviation()
+        >>> op = standard_deviation(ddof=0)
+
+    Args:
+        ddof: [Optional] Delta degrees of freedom. The default of 1
+            gives the sample standard deviation. It is nan when there are no more
+            values than ddof.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the standard deviation of the sequence of values.
+    """
+    from rx.core.operators.statistics import _standard_deviation
+    return _standard_deviation(ddof)
+
+
 def start_with(*args: Any) -> Callable[[Observable], Observable]:
     """Prepends a sequence of values to an observable sequence.
 
@@ -3197,6 +3534,37 @@ def time_interval(scheduler: Optional[typing.Scheduler] = None) -> Callable[[Obs
     return _time_interval(scheduler=scheduler)
 
 
+def to_async_iterable(max_buffer: Optional[int] = None) -> Callable[[Observable], AsyncIterable]:
+    """Converts an observable sequence to an asynchronous iterable, to
+    be consumed with ``async for`` on an asyncio event loop.
+
+    Every iteration subscribes to the source. The elements are buffered
+    until the consumer takes them. If max_buffer is given and the source
+    emits on another thread than the event loop, the source is paused
+    while the buffer holds max_buffer elements. A source emitting on the
+    event loop itself cannot be paused without blocking the consumer,
+    so it should be moved off the loop with :func:`subscribe_on` to
+    bound the buffer.
+
+    Examples:
+        >>> async for value in source.pipe(ops.to_async_iterable()):
+        ...     print(value)
+        >>> rows = source.pipe(ops.subscribe_on(scheduler), ops.to_async_iterable(max_buffer=100))
+
+    Args:
+        max_buffer: [Optional] The maximum number of elements to buffer
+            before pausing a source running on another thread.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an asynchronous iterable of its elements. Errors of the
+        source are raised from ``async for``, and leaving the loop
+        disposes the subscription.
+    """
+    from rx.core.operators.toasynciterable import _to_async_iterable
+    return _to_async_iterable(max_buffer)
+
+
 def to_dict(key_mapper: Mapper, element_mapper: Optional[Mapper] = None
            ) -> Callable[[Observable], Observable]:
     """Converts the observable sequence to a Map if it exists.
@@ -3281,6 +3649,37 @@ def to_set() -> Callable[[Observable], Observable]:
     return _to_set()
 
 
+def variance(ddof: int = 1) -> Callable[[Observable], Observable]:
+    """Computes the variance of an observable sequence of values.
+
+    The variance is updated for every element with Welford's online
+    algorithm, so the sequence is never materialized.
+
+    .. marble::
+        :alt: variance
+
+        ---1--2--3--4--5-|
+        [   variance()   ]
+        -----------------2.5|
+
+    Examples:
+        >>> op = variance()
+        >>> op = variance(ddof=0)
+
+    Args:
+        ddof: [Optional] Delta degrees of freedom. The default of 1
+            gives the sample variance. It is nan when there are no more
+            values than ddof.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence containing a single element with
+        the variance of the sequence of values.
+    """
+    from rx.core.operators.statistics import _variance
+    return _variance(ddof)
+
+
 def while_do(condition: Predicate) -> Callable[[Observable], Observable]:
     """Repeats source as long as condition holds emulating a while
     loop.
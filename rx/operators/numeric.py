@@ -0,0 +1,246 @@
+# pylint: disable=redefined-builtin
+"""Vectorized operators for streams of NumPy array chunks.
+
+The operators in this module work on observable sequences whose
+elements are chunks of samples, i.e. NumPy arrays (or anything
+:func:`numpy.asarray` accepts) with the samples along the first axis.
+Every operator evaluates a whole chunk with NumPy ufuncs and reductions
+and carries its running state from one chunk to the next, so the
+per-sample cost of a Python function call is paid once per chunk
+instead.
+
+Chunks can be produced from a scalar stream with :func:`chunk`, from an
+existing array with :func:`from_array`, or by any operator emitting
+lists such as :func:`rx.operators.buffer_with_count`.
+
+NumPy is an optional dependency and is only imported when one of these
+operators is created.
+"""
+
+from typing import Any, Callable, Optional
+
+from rx.core import Observable, typing
+from rx.internal.utils import NotSet
+
+
+def chunk(count: int, dtype: Any = None) -> Callable[[Observable], Observable]:
+    """Collects the scalar elements of an observable sequence into NumPy
+    arrays of count elements.
+
+    Batches pushed through ``on_next_batch`` (see
+    :func:`rx.operators.batch_with_count`) are sliced into chunks
+    without per-element calls.
+
+    Examples:
+        >>> res = chunk(1024)
+        >>> res = chunk(1024, dtype=np.float32)
+
+    Args:
+        count: Number of elements per chunk.
+        dtype: [Optional] NumPy data type of the chunks.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of arrays. The last array may be
+        shorter than count.
+    """
+    from rx.core.operators.numeric import _chunk
+    return _chunk(count, dtype)
+
+
+def from_array(array: Any,
+               chunk_size: int,
+               scheduler: Optional[typing.Scheduler] = None
+               ) -> Observable:
+    """Converts an array into an observable sequence of chunks.
+
+    Examples:
+        >>> res = from_array(samples, 4096)
+
+    Args:
+        array: The array to split along its first axis.
+        chunk_size: Number of samples per chunk.
+        scheduler: [Optional] Scheduler to schedule the chunks on.
+
+    Returns:
+        An observable sequence of views into the array, each
+        containing up to chunk_size samples.
+    """
+    from rx.core.operators.numeric import _from_array
+    return _from_array(array, chunk_size, scheduler)
+
+
+def map(mapper: Callable[[Any], Any]) -> Callable[[Observable], Observable]:
+    """Applies a vectorized function to each chunk.
+
+    Examples:
+        >>> res = map(np.sqrt)
+        >>> res = map(lambda chunk: chunk * 2.0 + 1.0)
+
+    Args:
+        mapper: A function taking and returning an array, typically a
+            ufunc or an expression of ufuncs.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence of the transformed chunks.
+    """
+    from rx.core.operators.numeric import _map
+    return _map(mapper)
+
+
+def filter(predicate: Callable[[Any], Any]) -> Callable[[Observable], Observable]:
+    """Filters the samples of each chunk with a vectorized predicate.
+    Chunks left empty are dropped.
+
+    Examples:
+        >>> res = filter(lambda chunk: chunk > 0)
+
+    Args:
+        predicate: A function taking an array and returning a boolean
+            mask of the same length.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence of the selected samples.
+    """
+    from rx.core.operators.numeric import _filter
+    return _filter(predicate)
+
+
+def scan(ufunc: Any, seed: Any = NotSet) -> Callable[[Observable], Observable]:
+    """Accumulates the samples with an associative binary ufunc,
+    carrying the accumulation across chunks.
+
+    Examples:
+        >>> res = scan(np.add)      # running sum
+        >>> res = scan(np.maximum)  # running maximum
+        >>> res = scan(np.add, seed=100.0)
+
+    Args:
+        ufunc: An associative binary ufunc, e.g. :code:`np.add`,
+            :code:`np.multiply`, :code:`np.minimum` or
+            :code:`np.maximum`.
+        seed: [Optional] The initial accumulator value.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence of chunks with the
+        accumulated value for every sample.
+    """
+    from rx.core.operators.numeric import _scan
+    return _scan(ufunc, seed)
+
+
+def sum() -> Callable[[Observable], Observable]:
+    """Computes the sum of all samples.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the sum along the first axis.
+    """
+    from rx.core.operators.numeric import _sum
+    return _sum()
+
+
+def average() -> Callable[[Observable], Observable]:
+    """Computes the average of all samples.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the average along the first axis.
+    """
+    from rx.core.operators.numeric import _average
+    return _average()
+
+
+def min() -> Callable[[Observable], Observable]:
+    """Computes the minimum of all samples.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the minimum along the first axis.
+    """
+    from rx.core.operators.numeric import _min
+    return _min()
+
+
+def max() -> Callable[[Observable], Observable]:
+    """Computes the maximum of all samples.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the maximum along the first axis.
+    """
+    from rx.core.operators.numeric import _max
+    return _max()
+
+
+def variance(ddof: int = 1) -> Callable[[Observable], Observable]:
+    """Computes the variance of all samples. Chunk statistics are
+    combined pairwise, so the samples are never materialized.
+
+    Examples:
+        >>> res = variance()
+        >>> res = variance(ddof=0)
+
+    Args:
+        ddof: Delta degrees of freedom. The default of 1 gives the
+            sample variance. It is nan when there are no more samples
+            than ddof.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the variance along the first axis.
+    """
+    from rx.core.operators.numeric import _variance
+    return _variance(ddof)
+
+
+def standard_deviation(ddof: int = 1) -> Callable[[Observable], Observable]:
+    """Computes the standard deviation of all samples.
+
+    Args:
+        ddof: Delta degrees of freedom. The default of 1 gives the
+            sample standard deviation. It is nan when there are no more samples
+            than ddof.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the standard deviation along the first axis.
+    """
+    from rx.core.operators.numeric import _standard_deviation
+    return _standard_deviation(ddof)
+
+
+def median() -> Callable[[Observable], Observable]:
+    """Computes the median of all samples. The chunks are kept until
+    the source completes, so the sequence must be finite and memory
+    use is O(n) in the number of samples.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with the median along the first axis.
+    """
+    from rx.core.operators.numeric import _median
+    return _median()
+
+
+def mode() -> Callable[[Observable], Observable]:
+    """Computes the most frequent sample values. Occurrences are
+    counted per chunk with :func:`numpy.unique`.
+
+    Returns:
+        An operator function that takes an observable source of chunks
+        and returns an observable sequence containing a single element
+        with a sorted array of the most frequent values.
+    """
+    from rx.core.operators.numeric import _mode
+    return _mode()
@@ -6,7 +6,10 @@ from .eventloopscheduler import EventLoopScheduler
 from .historicalscheduler import HistoricalScheduler
 from .immediatescheduler import ImmediateScheduler
 from .newthreadscheduler import NewThreadScheduler
+from .pooledthreadscheduler import PooledThreadScheduler
+from .processpoolscheduler import ProcessPoolScheduler
 from .threadpoolscheduler import ThreadPoolScheduler
 from .timeoutscheduler import TimeoutScheduler
 from .trampolinescheduler import TrampolineScheduler
 from .virtualtimescheduler import VirtualTimeScheduler
+from .workstealingscheduler import WorkStealingScheduler
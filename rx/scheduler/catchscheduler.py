@@ -42,6 +42,9 @@ class CatchScheduler(PeriodicScheduler):
 
         return self._scheduler.now
 
+    def _monotonic(self) -> float:
+        return self.to_seconds(self._scheduler.now)
+
     def schedule(self,
                  action: typing.ScheduledAction,
                  state: Optional[typing.TState] = None
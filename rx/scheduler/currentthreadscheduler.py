@@ -4,7 +4,7 @@ from threading import current_thread, local, Thread
 from typing import MutableMapping
 from weakref import WeakKeyDictionary
 
-from .trampoline import Trampoline
+from .trampoline import Trampoline, ThreadTrampoline
 from .trampolinescheduler import TrampolineScheduler
 
 log = logging.getLogger('Rx')
@@ -56,7 +56,7 @@ class CurrentThreadScheduler(TrampolineScheduler):
         thread = current_thread()
         tramp = self._tramps.get(thread)
         if tramp is None:
-            tramp = Trampoline()
+            tramp = ThreadTrampoline()
             self._tramps[thread] = tramp
         return tramp
 
@@ -65,7 +65,7 @@ class _Local(local):
 
     def __init__(self) -> None:
         super().__init__()
-        self.tramp = Trampoline()
+        self.tramp = ThreadTrampoline()
 
 
 class CurrentThreadSchedulerSingleton(CurrentThreadScheduler):
@@ -1,4 +1,6 @@
 from .asyncioscheduler import AsyncIOScheduler
+from .asynciobatchingscheduler import AsyncIOBatchingScheduler
+from .asyncioshardedscheduler import AsyncIOShardedScheduler
 from .asynciothreadsafescheduler import AsyncIOThreadSafeScheduler
 from .eventletscheduler import EventletScheduler
 from .geventscheduler import GEventScheduler
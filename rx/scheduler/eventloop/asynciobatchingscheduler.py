@@ -0,0 +1,180 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+from rx.core import typing
+
+from .asyncioscheduler import AsyncIOScheduler
+
+
+class AsyncIOHandle(typing.Disposable):
+    """A scheduled action, which is also the disposable to cancel it."""
+
+    __slots__ = ('scheduler', 'action', 'state', 'timer', 'disposable', 'is_disposed')
+
+    def __init__(self,
+                 scheduler: 'AsyncIOBatchingScheduler',
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState]
+                 ) -> None:
+        self.scheduler = scheduler
+        self.action = action
+        self.state = state
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.disposable: Optional[typing.Disposable] = None
+        self.is_disposed = False
+
+    def invoke(self) -> None:
+        if self.is_disposed:
+            return
+
+        ret = self.action(self.scheduler, self.state)
+        if isinstance(ret, typing.Disposable):
+            self.disposable = ret
+            if self.is_disposed:
+                ret.dispose()
+
+    def dispose(self) -> None:
+        if self.is_disposed:
+            return
+        self.is_disposed = True
+
+        timer = self.timer
+        if timer is not None:
+            loop = self.scheduler._loop
+            if asyncio._get_running_loop() is loop:
+                timer.cancel()
+            else:
+                loop.call_soon_threadsafe(timer.cancel)
+
+        disposable = self.disposable
+        if disposable is not None:
+            disposable.dispose()
+
+
+class AsyncIOBatchingScheduler(AsyncIOScheduler):
+    """A scheduler that schedules work via the asyncio mainloop, with
+    less overhead per action than AsyncIOScheduler.
+
+    Actions scheduled for immediate execution during the same iteration
+    of the event loop are run from a single loop callback. Scheduling
+    and disposing are thread-safe. The threadsafe asyncio methods are
+    only used when called from outside of the event loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Create a new AsyncIOBatchingScheduler.
+
+        Args:
+            loop: Instance of asyncio event loop to use; typically, you would
+                get this by asyncio.get_event_loop()
+        """
+
+        super().__init__(loop)
+
+        self._ready: Deque[AsyncIOHandle] = deque()
+        self._ready_scheduled = False
+
+        self._lock = threading.Lock()
+        self._incoming: List[AsyncIOHandle] = []
+        self._incoming_scheduled = False
+
+    def schedule(self,
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState] = None
+                 ) -> typing.Disposable:
+        """Schedules an action to be executed.
+
+        Args:
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        handle = AsyncIOHandle(self, action, state)
+
+        if asyncio._get_running_loop() is self._loop:
+            self._ready.append(handle)
+            if not self._ready_scheduled:
+                self._ready_scheduled = True
+                self._loop.call_soon(self._run_ready)
+            return handle
+
+        with self._lock:
+            self._incoming.append(handle)
+            if self._incoming_scheduled:
+                return handle
+            self._incoming_scheduled = True
+
+        self._loop.call_soon_threadsafe(self._run_incoming)
+        return handle
+
+    def schedule_relative(self,
+                          duetime: typing.RelativeTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed after duetime.
+
+        Args:
+            duetime: Relative time after which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        seconds = self.to_seconds(duetime)
+        if seconds <= 0:
+            return self.schedule(action, state)
+
+        handle = AsyncIOHandle(self, action, state)
+        loop = self._loop
+        when = loop.time() + seconds
+
+        if asyncio._get_running_loop() is loop:
+            handle.timer = loop.call_at(when, self._run_timer, handle)
+        else:
+            def start_timer() -> None:
+                if not handle.is_disposed:
+                    handle.timer = loop.call_at(when, self._run_timer, handle)
+
+            loop.call_soon_threadsafe(start_timer)
+        return handle
+
+    def _run_ready(self) -> None:
+        self._ready_scheduled = False
+
+        # Only actions scheduled before this callback started run now,
+        # later ones wait for the next iteration of the event loop.
+        ready = self._ready
+        for _ in range(len(ready)):
+            self._invoke(ready.popleft())
+
+    def _run_incoming(self) -> None:
+        with self._lock:
+            incoming, self._incoming = self._incoming, []
+            self._incoming_scheduled = False
+
+        for handle in incoming:
+            self._invoke(handle)
+
+    def _run_timer(self, handle: AsyncIOHandle) -> None:
+        handle.timer = None
+        self._invoke(handle)
+
+    def _invoke(self, handle: AsyncIOHandle) -> None:
+        try:
+            handle.invoke()
+        except Exception as ex:  # pylint: disable=broad-except
+            context: Any = {
+                'message': 'Exception in action scheduled on AsyncIOBatchingScheduler',
+                'exception': ex,
+            }
+            self._loop.call_exception_handler(context)
@@ -0,0 +1,196 @@
+import asyncio
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from rx.core import typing
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.exceptions import DisposedException
+
+from ..periodicscheduler import PeriodicScheduler
+from .asynciothreadsafescheduler import AsyncIOThreadSafeScheduler
+
+
+class AsyncIOShardedScheduler(PeriodicScheduler, typing.Disposable):
+    """A scheduler that spreads work over several asyncio event loops,
+    each running on a thread of its own.
+
+    Every loop is wrapped in an AsyncIOThreadSafeScheduler, its shard.
+    Work for a key is always routed to the same shard with
+    :meth:`shard`, so the order of the work for one key is kept while
+    different keys run in parallel::
+
+        scheduler = AsyncIOShardedScheduler(4, loop_factory=uvloop.new_event_loop)
+        source.pipe(
+            ops.group_by(lambda msg: msg.client_id),
+            ops.flat_map(lambda grp: grp.pipe(
+                ops.observe_on(scheduler.shard(grp.key)),
+                ops.map(handle)))
+        )
+
+    Work scheduled on the scheduler itself stays on the current shard
+    when scheduled from one of the loops, and is spread round robin
+    over the shards otherwise.
+    """
+
+    def __init__(self,
+                 shards: Optional[int] = None,
+                 loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
+                 thread_factory: Optional[typing.StartableFactory] = None
+                 ) -> None:
+        """Create a new AsyncIOShardedScheduler. The event loops are
+        started on first use.
+
+        Args:
+            shards: [Optional] The number of event loops. Defaults to
+                the number of processors.
+            loop_factory: [Optional] Creates an event loop, e.g.
+                uvloop.new_event_loop. Defaults to
+                asyncio.new_event_loop.
+            thread_factory: [Optional] Creates the threads running the
+                event loops.
+        """
+
+        super().__init__()
+        self._shard_count = shards or os.cpu_count() or 1
+        self._loop_factory = loop_factory or asyncio.new_event_loop
+        self._thread_factory: typing.StartableFactory = thread_factory or default_thread_factory
+
+        self._lock = threading.Lock()
+        self._shards: List[AsyncIOThreadSafeScheduler] = []
+        self._by_loop: Dict[asyncio.AbstractEventLoop, AsyncIOThreadSafeScheduler] = {}
+        self._next = 0
+        self._is_disposed = False
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    @property
+    def shards(self) -> List[AsyncIOThreadSafeScheduler]:
+        """The schedulers of the event loops."""
+
+        with self._lock:
+            if self._is_disposed:
+                raise DisposedException()
+
+            if not self._shards:
+                self._start()
+            return self._shards
+
+    def shard(self, key: Any) -> AsyncIOThreadSafeScheduler:
+        """Returns the scheduler of the event loop for key.
+
+        Args:
+            key: A hashable key. Equal keys get the same shard.
+
+        Returns:
+            The scheduler of the event loop for key.
+        """
+
+        shards = self.shards
+        return shards[hash(key) % len(shards)]
+
+    def schedule(self,
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState] = None
+                 ) -> typing.Disposable:
+        """Schedules an action to be executed.
+
+        Args:
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        return self._current().schedule(action, state)
+
+    def schedule_relative(self,
+                          duetime: typing.RelativeTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed after duetime.
+
+        Args:
+            duetime: Relative time after which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        return self._current().schedule_relative(duetime, action, state)
+
+    def schedule_absolute(self,
+                          duetime: typing.AbsoluteTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed at duetime.
+
+        Args:
+            duetime: Absolute time at which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now, action, state)
+
+    def dispose(self) -> None:
+        """Stops and closes the event loops. Work that has not started
+        yet is abandoned."""
+
+        with self._lock:
+            self._is_disposed = True
+            shards, self._shards = self._shards, []
+            self._by_loop = {}
+
+        for shard in shards:
+            loop = shard._loop
+            loop.call_soon_threadsafe(loop.stop)
+
+    def _current(self) -> AsyncIOThreadSafeScheduler:
+        shards = self.shards
+        loop = asyncio._get_running_loop()
+        if loop is not None:
+            shard = self._by_loop.get(loop)
+            if shard is not None:
+                return shard
+
+        with self._lock:
+            index = self._next
+            self._next = (index + 1) % len(shards)
+        return shards[index]
+
+    def _start(self) -> None:
+        """Starts the event loops. Should be called under the lock."""
+
+        for _ in range(self._shard_count):
+            loop = self._loop_factory()
+            started = threading.Event()
+
+            def run(loop: asyncio.AbstractEventLoop = loop, started: threading.Event = started) -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.close()
+
+            thread = self._thread_factory(run)
+            thread.start()
+            started.wait()
+            shard = AsyncIOThreadSafeScheduler(loop)
+            self._shards.append(shard)
+            self._by_loop[loop] = shard
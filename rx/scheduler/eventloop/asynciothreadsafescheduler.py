@@ -50,6 +50,10 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
         handle = self._loop.call_soon_threadsafe(interval)
 
         def dispose() -> None:
+            if self._cancel_directly():
+                handle.cancel()
+                return
+
             future: Future = Future()
 
             def cancel_handle() -> None:
@@ -96,17 +100,24 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
         handle.append(self._loop.call_soon_threadsafe(stage2))
 
         def dispose() -> None:
-            future: Future = Future()
-
             def cancel_handle() -> None:
                 try:
                     handle.pop().cancel()
                     handle.pop().cancel()
                 except Exception:
                     pass
+
+            if self._cancel_directly():
+                cancel_handle()
+                return
+
+            future: Future = Future()
+
+            def cancel_and_notify() -> None:
+                cancel_handle()
                 future.set_result(0)
 
-            self._loop.call_soon_threadsafe(cancel_handle)
+            self._loop.call_soon_threadsafe(cancel_and_notify)
             future.result()
 
         return CompositeDisposable(sad, Disposable(dispose))
@@ -130,3 +141,9 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
 
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now, action, state=state)
+
+    def _cancel_directly(self) -> bool:
+        """Waiting for the loop to cancel a handle would deadlock when
+        called from the loop itself, or when the loop is not running."""
+
+        return asyncio._get_running_loop() is self._loop or not self._loop.is_running()
@@ -1,13 +1,12 @@
 import logging
 import threading
 from collections import deque
-from datetime import timedelta
+from time import monotonic
 from typing import Deque, Optional
 
 from rx.core import typing
 from rx.disposable import Disposable
 from rx.internal.concurrency import default_thread_factory
-from rx.internal.constants import DELTA_ZERO
 from rx.internal.exceptions import DisposedException
 from rx.internal.priorityqueue import PriorityQueue
 
@@ -51,7 +50,7 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             (best effort).
         """
 
-        return self.schedule_absolute(self.now, action, state=state)
+        return self._schedule_at(monotonic(), action, state)
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -70,8 +69,8 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             (best effort).
         """
 
-        duetime = max(DELTA_ZERO, self.to_timedelta(duetime))
-        return self.schedule_absolute(self.now + duetime, action, state)
+        seconds = max(0.0, self.to_seconds(duetime))
+        return self._schedule_at(monotonic() + seconds, action, state)
 
     def schedule_absolute(self,
                           duetime: typing.AbsoluteTime,
@@ -90,21 +89,35 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             (best effort).
         """
 
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now, action, state)
+
+    def _schedule_at(self,
+                     duetime: float,
+                     action: typing.ScheduledAction,
+                     state: Optional[typing.TState] = None
+                     ) -> typing.Disposable:
+        """Schedules an action to be executed at a monotonic time."""
+
         if self._is_disposed:
             raise DisposedException()
 
-        dt = self.to_datetime(duetime)
-        si: ScheduledItem = ScheduledItem(self, state, action, dt)
+        si: ScheduledItem = ScheduledItem(self, state, action, duetime)
 
         with self._condition:
-            if dt <= self.now:
+            if duetime <= monotonic():
                 self._ready_list.append(si)
             else:
                 self._queue.enqueue(si)
             self._condition.notify()  # signal that a new item is available
             self._ensure_thread()
 
-        return Disposable(si.cancel)
+        def dispose() -> None:
+            si.cancel()
+            with self._condition:
+                self._queue.discard(si)
+
+        return Disposable(dispose)
 
     def schedule_periodic(self,
                           period: typing.RelativeTime,
@@ -164,7 +177,7 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
 
                 # Sort the ready_list (from recent calls for immediate schedule)
                 # and the due subset of previously queued items.
-                time = self.now
+                time = monotonic()
                 while self._queue:
                     due = self._queue.peek().duetime
                     while self._ready_list and due > self._ready_list[0].duetime:
@@ -184,13 +197,14 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             # Wait for next cycle, or if we're done let's exit if so configured
             with self._condition:
 
-                if self._ready_list:
+                # An action may have disposed the scheduler, which is
+                # handled at the top of the loop.
+                if self._ready_list or self._is_disposed:
                     continue
 
                 elif self._queue:
-                    time = self.now
                     item = self._queue.peek()
-                    seconds = (item.duetime - time).total_seconds()
+                    seconds = item.duetime - monotonic()
                     if seconds > 0:
                         log.debug("timeout: %s", seconds)
                         self._condition.wait(seconds)
@@ -4,6 +4,7 @@ import threading
 from typing import Any, Optional
 
 from rx.core import typing
+from rx.disposable import Disposable
 from rx.internal import PriorityQueue
 from rx.internal.constants import DELTA_ZERO
 
@@ -95,7 +96,12 @@ class PyGameScheduler(PeriodicScheduler):
         with self._lock:
             self._queue.enqueue(si)
 
-        return si.disposable
+        def dispose() -> None:
+            si.cancel()
+            with self._lock:
+                self._queue.discard(si)
+
+        return Disposable(dispose)
 
     def run(self) -> None:
         while self._queue:
@@ -1,7 +1,7 @@
 import logging
 import threading
 
-from datetime import datetime
+from time import monotonic
 from typing import Optional
 
 from rx.core import typing
@@ -22,6 +22,14 @@ class NewThreadScheduler(PeriodicScheduler):
     def __init__(self, thread_factory: Optional[typing.StartableFactory] = None) -> None:
         super().__init__()
         self.thread_factory: typing.StartableFactory = thread_factory or default_thread_factory
+        self._threads_created = 0
+        self._lock = threading.Lock()
+
+    @property
+    def threads_created(self) -> int:
+        """The number of threads started by this scheduler."""
+
+        return self._threads_created
 
     def schedule(self,
                  action: typing.ScheduledAction,
@@ -38,7 +46,7 @@ class NewThreadScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        scheduler = EventLoopScheduler(thread_factory=self.thread_factory, exit_if_empty=True)
+        scheduler = EventLoopScheduler(thread_factory=self._create_thread, exit_if_empty=True)
         return scheduler.schedule(action, state)
 
     def schedule_relative(self,
@@ -58,7 +66,7 @@ class NewThreadScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        scheduler = EventLoopScheduler(thread_factory=self.thread_factory, exit_if_empty=True)
+        scheduler = EventLoopScheduler(thread_factory=self._create_thread, exit_if_empty=True)
         return scheduler.schedule_relative(duetime, action, state)
 
     def schedule_absolute(self,
@@ -112,16 +120,21 @@ class NewThreadScheduler(PeriodicScheduler):
                 if disposed.is_set():
                     return
 
-                time: datetime = self.now
+                start = monotonic()
 
                 state = action(state)
 
-                timeout = seconds - (self.now - time).total_seconds()
+                timeout = seconds - (monotonic() - start)
 
-        thread = self.thread_factory(run)
+        thread = self._create_thread(run)
         thread.start()
 
         def dispose() -> None:
             disposed.set()
 
         return Disposable(dispose)
+
+    def _create_thread(self, target: typing.StartableTarget) -> typing.Startable:
+        with self._lock:
+            self._threads_created += 1
+        return self.thread_factory(target)
@@ -1,5 +1,4 @@
 from abc import abstractmethod
-from datetime import datetime
 from typing import Optional
 
 from rx.core import typing
@@ -41,7 +40,7 @@ class PeriodicScheduler(Scheduler, typing.PeriodicScheduler):
             if disp.is_disposed:
                 return None
 
-            now: datetime = scheduler.now
+            start = self._monotonic()
 
             try:
                 state = action(state)
@@ -49,7 +48,7 @@ class PeriodicScheduler(Scheduler, typing.PeriodicScheduler):
                 disp.dispose()
                 raise
 
-            time = seconds - (scheduler.now - now).total_seconds()
+            time = seconds - (self._monotonic() - start)
             disp.disposable = scheduler.schedule_relative(time, periodic, state=state)
 
             return None
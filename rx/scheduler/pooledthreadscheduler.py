@@ -0,0 +1,195 @@
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from rx.core import typing
+from rx.disposable import CompositeDisposable, Disposable
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.exceptions import DisposedException
+
+from .eventloopscheduler import EventLoopScheduler
+from .periodicscheduler import PeriodicScheduler
+
+
+class PooledThreadScheduler(PeriodicScheduler, typing.Disposable):
+    """A scheduler that runs work on a bounded pool of long-lived event
+    loop threads, as a replacement for NewThreadScheduler that does not
+    start a thread per unit of work.
+
+    Work is given to an event loop that has nothing to do. A new loop is
+    only started when all loops are busy and the pool is not full yet,
+    otherwise the work is given to the loop with the least work. Loops
+    are kept running until the scheduler is disposed. As with
+    NewThreadScheduler, an action receives the event loop it runs on as
+    scheduler, so recursive work stays on the same thread.
+    """
+
+    def __init__(self,
+                 max_threads: Optional[int] = None,
+                 thread_factory: Optional[typing.StartableFactory] = None
+                 ) -> None:
+        super().__init__()
+        self._max_threads = max_threads or min(32, (os.cpu_count() or 1) + 4)
+        self._thread_factory: typing.StartableFactory = thread_factory or default_thread_factory
+
+        self._lock = threading.Lock()
+        self._loops: List[EventLoopScheduler] = []
+        self._pending: List[int] = []
+        self._threads_created = 0
+        self._is_disposed = False
+
+    @property
+    def max_threads(self) -> int:
+        return self._max_threads
+
+    @property
+    def threads_created(self) -> int:
+        """The number of threads started by this scheduler."""
+
+        return self._threads_created
+
+    def schedule(self,
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState] = None
+                 ) -> typing.Disposable:
+        """Schedules an action to be executed.
+
+        Args:
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        loop, action, done = self._acquire(action)
+        return CompositeDisposable(loop.schedule(action, state), done)
+
+    def schedule_relative(self,
+                          duetime: typing.RelativeTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed after duetime.
+
+        Args:
+            duetime: Relative time after which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        loop, action, done = self._acquire(action)
+        return CompositeDisposable(loop.schedule_relative(duetime, action, state), done)
+
+    def schedule_absolute(self,
+                          duetime: typing.AbsoluteTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed at duetime.
+
+        Args:
+            duetime: Absolute time at which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        loop, action, done = self._acquire(action)
+        return CompositeDisposable(loop.schedule_absolute(duetime, action, state), done)
+
+    def schedule_periodic(self,
+                          period: typing.RelativeTime,
+                          action: typing.ScheduledPeriodicAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules a periodic piece of work on one of the event loops.
+        The loop counts as busy until the returned disposable is
+        disposed.
+
+        Args:
+            period: Period in seconds or timedelta for running the
+                work periodically.
+            action: Action to be executed.
+            state: [Optional] Initial state passed to the action upon
+                the first iteration.
+
+        Returns:
+            The disposable object used to cancel the scheduled
+            recurring action (best effort).
+        """
+
+        index = self._select()
+        done = Disposable(lambda: self._release(index))
+        return CompositeDisposable(self._loops[index].schedule_periodic(period, action, state), done)
+
+    def dispose(self) -> None:
+        """Ends the threads of the event loops. Work that has not
+        started yet is abandoned."""
+
+        with self._lock:
+            self._is_disposed = True
+            loops = list(self._loops)
+
+        for loop in loops:
+            loop.dispose()
+
+    def _select(self) -> int:
+        """Returns the index of the loop to give work to, and counts the
+        work as pending on that loop."""
+
+        with self._lock:
+            if self._is_disposed:
+                raise DisposedException()
+
+            pending = self._pending
+            index = min(range(len(pending)), key=pending.__getitem__, default=-1)
+            if (index < 0 or pending[index]) and len(pending) < self._max_threads:
+                self._loops.append(EventLoopScheduler(thread_factory=self._create_thread))
+                pending.append(0)
+                index = len(pending) - 1
+
+            pending[index] += 1
+            return index
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._pending[index] -= 1
+
+    def _acquire(self,
+                 action: typing.ScheduledAction
+                 ) -> Tuple[EventLoopScheduler, typing.ScheduledAction, Disposable]:
+        """Selects a loop for action, and wraps action so that it stops
+        counting as pending once it has run or is disposed."""
+
+        index = self._select()
+        is_done = False
+
+        def release() -> None:
+            nonlocal is_done
+            with self._lock:
+                if is_done:
+                    return
+                is_done = True
+            self._release(index)
+
+        def invoke(scheduler: typing.Scheduler, state: Optional[typing.TState]) -> Optional[typing.Disposable]:
+            try:
+                return action(scheduler, state)
+            finally:
+                release()
+
+        return self._loops[index], invoke, Disposable(release)
+
+    def _create_thread(self, target: typing.StartableTarget) -> typing.Startable:
+        with self._lock:
+            self._threads_created += 1
+        return self._thread_factory(target)
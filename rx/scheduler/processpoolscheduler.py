@@ -0,0 +1,77 @@
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from rx.core import typing
+from rx.internal.exceptions import DisposedException
+
+from .eventloopscheduler import EventLoopScheduler
+
+
+class ProcessPoolScheduler(EventLoopScheduler):
+    """A scheduler backed by a pool of worker processes.
+
+    Scheduled actions close over in-process state and cannot be sent to
+    another process, so they run on the designated thread of the
+    scheduler, as with EventLoopScheduler. Picklable work is sent to the
+    worker processes with submit, e.g. by
+    :func:`rx.operators.parallel_map`.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 mp_context: Any = None,
+                 thread_factory: Optional[typing.StartableFactory] = None
+                 ) -> None:
+        super().__init__(thread_factory=thread_factory)
+
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The process pool, started on first use."""
+
+        with self._executor_lock:
+            if self._is_disposed:
+                raise DisposedException()
+
+            if self._executor is None:
+                if self._mp_context is None:
+                    self._executor = ProcessPoolExecutor(self._max_workers)
+                else:
+                    self._executor = ProcessPoolExecutor(self._max_workers, mp_context=self._mp_context)
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Runs fn(*args) in a worker process.
+
+        Args:
+            fn: A picklable function, e.g. defined at module level.
+            args: Picklable arguments for fn.
+
+        Returns:
+            A future for the result of the call.
+        """
+
+        return self.executor.submit(fn, *args)
+
+    def dispose(self) -> None:
+        """Ends the thread and the worker processes associated with this
+        scheduler. Work that has not started yet is abandoned.
+        """
+
+        super().dispose()
+
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Any, Optional
 
 from rx.core import typing
@@ -8,17 +7,19 @@ from .scheduler import Scheduler
 
 
 class ScheduledItem(object):
+    """An action scheduled at duetime. Schedulers running in real time
+    use monotonic time in seconds, others their own absolute time."""
 
     def __init__(self,
                  scheduler: Scheduler,
                  state: Optional[Any],
                  action: typing.ScheduledAction,
-                 duetime: datetime
+                 duetime: typing.AbsoluteTime
                  ) -> None:
         self.scheduler: Scheduler = scheduler
         self.state: Optional[Any] = state
         self.action: typing.ScheduledAction = action
-        self.duetime: datetime = duetime
+        self.duetime: typing.AbsoluteTime = duetime
         self.disposable: SingleAssignmentDisposable = SingleAssignmentDisposable()
 
     def invoke(self) -> None:
@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from datetime import datetime, timedelta
+from time import monotonic
 from typing import Optional
 
 from rx.core import typing
@@ -26,6 +27,18 @@ class Scheduler(typing.Scheduler):
 
         return default_now()
 
+    def _monotonic(self) -> float:
+        """Returns the time in seconds for measuring intervals. Only
+        differences between two values are meaningful.
+
+        Schedulers running in real time use time.monotonic(), which is
+        cheaper than datetime arithmetic and unaffected by changes of
+        the system clock. Schedulers keeping a time of their own derive
+        the value from now.
+        """
+
+        return monotonic()
+
     @abstractmethod
     def schedule(self,
                  action: typing.ScheduledAction,
@@ -1,15 +1,43 @@
-from threading import Lock, Timer
-from typing import MutableMapping, Optional
+import logging
+import math
+import threading
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Deque, List, MutableMapping, Optional
 from weakref import WeakKeyDictionary
 
 from rx.core import typing
 from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.timerwheel import TimerEntry, TimerWheel
 
 from .periodicscheduler import PeriodicScheduler
 
 
+log = logging.getLogger('Rx')
+
+# Seconds the wheel thread waits before starting another worker while
+# due actions are queued and no worker is idle.
+STALL_TIMEOUT = 0.05
+
+# Seconds an idle worker waits for work before it exits.
+WORKER_IDLE_TIMEOUT = 10.0
+
+
+def _monotonic_ms() -> int:
+    return int(monotonic() * 1000)
+
+
 class TimeoutScheduler(PeriodicScheduler):
-    """A scheduler that schedules work via a timed callback."""
+    """A scheduler that schedules work via a timed callback.
+
+    All timers are kept in a hierarchical timer wheel with a resolution
+    of one millisecond, served by a single daemon thread. Due actions
+    are handed to a pool of daemon worker threads, which grows when no
+    worker is idle, so actions blocking on other timers do not hold up
+    the wheel.
+    """
 
     _lock = Lock()
     _global: MutableMapping[type, 'TimeoutScheduler'] = WeakKeyDictionary()
@@ -21,12 +49,24 @@ class TimeoutScheduler(PeriodicScheduler):
                 self = TimeoutScheduler._global[cls]
             except KeyError:
                 self = super().__new__(cls)
+                self._init_timers()
                 TimeoutScheduler._global[cls] = self
         return self
 
     def __new__(cls) -> 'TimeoutScheduler':
         return cls.singleton()
 
+    def _init_timers(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._wheel = TimerWheel(_monotonic_ms())
+        self._ready: Deque[TimerEntry] = deque()
+        self._thread: Optional[typing.Startable] = None
+        self._wakeup = math.inf
+
+        self._work_condition = threading.Condition(threading.Lock())
+        self._work: Deque[TimerEntry] = deque()
+        self._idle = 0
+
     def schedule(self,
                  action: typing.ScheduledAction,
                  state: Optional[typing.TState] = None
@@ -42,19 +82,7 @@ class TimeoutScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        sad = SingleAssignmentDisposable()
-
-        def interval() -> None:
-            sad.disposable = self.invoke_action(action, state)
-
-        timer = Timer(0, interval)
-        timer.setDaemon(True)
-        timer.start()
-
-        def dispose() -> None:
-            timer.cancel()
-
-        return CompositeDisposable(sad, Disposable(dispose))
+        return self.schedule_relative(0.0, action, state)
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -74,20 +102,15 @@ class TimeoutScheduler(PeriodicScheduler):
         """
 
         seconds = self.to_seconds(duetime)
-        if seconds <= 0.0:
-            return self.schedule(action, state)
-
         sad = SingleAssignmentDisposable()
 
         def interval() -> None:
             sad.disposable = self.invoke_action(action, state)
 
-        timer = Timer(seconds, interval)
-        timer.setDaemon(True)
-        timer.start()
+        entry = self._add_timer(seconds, interval)
 
         def dispose() -> None:
-            timer.cancel()
+            self._cancel_timer(entry)
 
         return CompositeDisposable(sad, Disposable(dispose))
 
@@ -110,3 +133,97 @@ class TimeoutScheduler(PeriodicScheduler):
 
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now, action, state)
+
+    def _add_timer(self, seconds: float, action: Callable[[], Any]) -> TimerEntry:
+        expiration = _monotonic_ms() + max(0, math.ceil(seconds * 1000))
+        entry = TimerEntry(expiration, action)
+
+        with self._condition:
+            if not self._wheel.add(entry):
+                self._ready.append(entry)
+
+            if expiration < self._wakeup:
+                self._condition.notify()
+
+            if self._thread is None:
+                self._thread = default_thread_factory(self._run)
+                self._thread.start()
+
+        return entry
+
+    def _cancel_timer(self, entry: TimerEntry) -> None:
+        entry.cancelled = True
+        with self._condition:
+            self._wheel.remove(entry)
+
+    def _run(self) -> None:
+        condition = self._condition
+        wheel = self._wheel
+        ready = self._ready
+
+        while True:
+            with condition:
+                while True:
+                    now = _monotonic_ms()
+                    due = wheel.advance(now)
+                    if ready:
+                        due[0:0] = ready
+                        ready.clear()
+                    if due or (self._work and not self._idle):
+                        break
+
+                    expiration = wheel.next_expiration()
+                    if expiration is None:
+                        self._wakeup = math.inf
+                        timeout = None
+                    else:
+                        self._wakeup = expiration
+                        timeout = (expiration - now) / 1000.0
+
+                    # Check again for stalled workers while actions are queued.
+                    if self._work:
+                        timeout = STALL_TIMEOUT if timeout is None else min(timeout, STALL_TIMEOUT)
+                    condition.wait(timeout)
+
+                # Not waiting, so new timers need not wake the thread.
+                self._wakeup = -math.inf
+
+            self._dispatch(due)
+
+    def _dispatch(self, entries: List[TimerEntry]) -> None:
+        """Hands due entries to the workers, starting a new worker if
+        none is idle."""
+
+        with self._work_condition:
+            self._work.extend(entries)
+            if not self._work:
+                return
+
+            if self._idle:
+                self._work_condition.notify(len(entries))
+            else:
+                # A new worker counts as idle until it takes an entry.
+                self._idle += 1
+                default_thread_factory(self._work_loop).start()
+
+    def _work_loop(self) -> None:
+        condition = self._work_condition
+        work = self._work
+
+        while True:
+            with condition:
+                while not work:
+                    if not condition.wait(WORKER_IDLE_TIMEOUT) and not work:
+                        self._idle -= 1
+                        return
+                entry = work.popleft()
+                self._idle -= 1
+
+            if not entry.cancelled:
+                try:
+                    entry.action()
+                except Exception:  # pylint: disable=broad-except
+                    log.exception("TimeoutScheduler: unhandled exception in scheduled action")
+
+            with condition:
+                self._idle += 1
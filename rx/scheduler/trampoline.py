@@ -1,6 +1,7 @@
 from collections import deque
 from threading import Condition, Lock
-from typing import Deque
+from time import monotonic, sleep
+from typing import Deque, Optional
 
 from rx.internal.priorityqueue import PriorityQueue
 
@@ -8,9 +9,14 @@ from .scheduleditem import ScheduledItem
 
 
 class Trampoline(object):
+    """Runs scheduled items one after another on the thread that
+    schedules while the trampoline is idle. Items due already are kept
+    in a plain queue, and only items due in the future in a priority
+    queue."""
 
     def __init__(self):
         self._idle: bool = True
+        self._ready: Deque[ScheduledItem] = deque()
         self._queue: PriorityQueue[ScheduledItem] = PriorityQueue()
         self._lock: Lock = Lock()
         self._condition: Condition = Condition(self._lock)
@@ -21,7 +27,7 @@ class Trampoline(object):
 
     def run(self, item: ScheduledItem) -> None:
         with self._lock:
-            self._queue.enqueue(item)
+            self._enqueue(item)
             if self._idle:
                 self._idle = False
             else:
@@ -32,29 +38,95 @@ class Trampoline(object):
         finally:
             with self._lock:
                 self._idle = True
+                self._ready.clear()
                 self._queue.clear()
 
+    def cancel(self, item: ScheduledItem) -> None:
+        item.cancel()
+        with self._lock:
+            self._queue.discard(item)
+
+    def _enqueue(self, item: ScheduledItem) -> None:
+        if item.duetime <= monotonic():
+            self._ready.append(item)
+        else:
+            self._queue.enqueue(item)
+
+    def _next(self) -> Optional[ScheduledItem]:
+        """Returns the item to run next, the earliest of the first ready
+        item and the first queued item that is due. Returns None if
+        there is no item due yet."""
+
+        ready = self._ready
+        queue = self._queue
+        if queue:
+            item = queue.peek()
+            if item.duetime <= monotonic() and (not ready or item.duetime < ready[0].duetime):
+                return queue.dequeue()
+        if ready:
+            return ready.popleft()
+        return None
+
     def _run(self) -> None:
-        ready: Deque[ScheduledItem] = deque()
         while True:
             with self._lock:
-                while len(self._queue) > 0:
-                    item: ScheduledItem = self._queue.peek()
-                    if item.duetime <= item.scheduler.now:
-                        self._queue.dequeue()
-                        ready.append(item)
-                    else:
+                item = self._next()
+                if item is None:
+                    if not self._queue:
                         break
 
-            while len(ready) > 0:
+                    seconds = self._queue.peek().duetime - monotonic()
+                    if seconds > 0.0:
+                        self._condition.wait(seconds)
+                    continue
+
+            if not item.is_cancelled():
+                item.invoke()
+
+
+class ThreadTrampoline(Trampoline):
+    """A trampoline that is only used by the thread owning it, as with
+    CurrentThreadScheduler, so it needs no locking. Other threads may
+    only cancel items, which are then skipped."""
+
+    def idle(self) -> bool:
+        return self._idle
+
+    def run(self, item: ScheduledItem) -> None:
+        self._enqueue(item)
+        if not self._idle:
+            return
+
+        self._idle = False
+        try:
+            self._run()
+        finally:
+            self._idle = True
+            self._ready.clear()
+            self._queue.clear()
+
+    def cancel(self, item: ScheduledItem) -> None:
+        item.cancel()
+
+    def _run(self) -> None:
+        ready = self._ready
+        queue = self._queue
+        while True:
+            if queue:
+                item = self._next()
+                if item is None:
+                    if queue.peek().is_cancelled():
+                        queue.dequeue()
+                        continue
+
+                    seconds = queue.peek().duetime - monotonic()
+                    if seconds > 0.0:
+                        sleep(seconds)
+                    continue
+            elif ready:
                 item = ready.popleft()
-                if not item.is_cancelled():
-                    item.invoke()
+            else:
+                break
 
-            with self._lock:
-                if len(self._queue) == 0:
-                    break
-                item = self._queue.peek()
-                seconds = (item.duetime - item.scheduler.now).total_seconds()
-                if seconds > 0.0:
-                    self._condition.wait(seconds)
+            if not item.is_cancelled():
+                item.invoke()
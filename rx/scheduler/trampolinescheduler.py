@@ -1,9 +1,10 @@
 import logging
 
+from time import monotonic
 from typing import Optional
 
 from rx.core import typing
-from rx.internal.constants import DELTA_ZERO
+from rx.disposable import Disposable
 
 from .scheduleditem import ScheduledItem
 from .scheduler import Scheduler
@@ -47,7 +48,7 @@ class TrampolineScheduler(Scheduler):
             (best effort).
         """
 
-        return self.schedule_absolute(self.now, action, state=state)
+        return self._schedule_at(monotonic(), action, state)
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -66,8 +67,10 @@ class TrampolineScheduler(Scheduler):
             (best effort).
         """
 
-        duetime = max(DELTA_ZERO, self.to_timedelta(duetime))
-        return self.schedule_absolute(self.now + duetime, action, state=state)
+        seconds = self.to_seconds(duetime)
+        if seconds > 0.0:
+            log.warning('Do not schedule blocking work!')
+        return self._schedule_at(monotonic() + max(0.0, seconds), action, state)
 
     def schedule_absolute(self,
                           duetime: typing.AbsoluteTime,
@@ -86,14 +89,22 @@ class TrampolineScheduler(Scheduler):
             (best effort).
         """
 
-        dt = self.to_datetime(duetime)
-        if dt > self.now:
-            log.warning('Do not schedule blocking work!')
-        item: ScheduledItem = ScheduledItem(self, state, action, dt)
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now, action, state)
+
+    def _schedule_at(self,
+                     duetime: float,
+                     action: typing.ScheduledAction,
+                     state: Optional[typing.TState] = None
+                     ) -> typing.Disposable:
+        """Schedules an action to be executed at a monotonic time."""
+
+        item: ScheduledItem = ScheduledItem(self, state, action, duetime)
 
-        self.get_trampoline().run(item)
+        tramp = self.get_trampoline()
+        tramp.run(item)
 
-        return item.disposable
+        return Disposable(lambda: tramp.cancel(item))
 
     def schedule_required(self) -> bool:
         """Test if scheduling is required.
@@ -6,6 +6,7 @@ from typing import Any, Optional
 
 from rx.internal import PriorityQueue, ArgumentOutOfRangeException
 from rx.core import typing
+from rx.disposable import Disposable
 
 from .periodicscheduler import PeriodicScheduler
 from .scheduleditem import ScheduledItem
@@ -51,6 +52,9 @@ class VirtualTimeScheduler(PeriodicScheduler):
 
         return self.to_datetime(self._clock)
 
+    def _monotonic(self) -> float:
+        return self.to_seconds(self._clock)
+
     def schedule(self,
                  action: typing.ScheduledAction,
                  state: Optional[typing.TState] = None
@@ -109,7 +113,13 @@ class VirtualTimeScheduler(PeriodicScheduler):
         si: ScheduledItem = ScheduledItem(self, state, action, dt)
         with self._lock:
             self._queue.enqueue(si)
-        return si.disposable
+
+        def dispose() -> None:
+            si.cancel()
+            with self._lock:
+                self._queue.discard(si)
+
+        return Disposable(dispose)
 
     def start(self) -> None:
         """Starts the virtual time scheduler."""
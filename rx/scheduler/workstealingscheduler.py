@@ -0,0 +1,202 @@
+import logging
+import os
+import threading
+from collections import deque
+from typing import Deque, List, Optional
+
+from rx.core import typing
+from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.exceptions import DisposedException
+
+from .periodicscheduler import PeriodicScheduler
+from .timeoutscheduler import TimeoutScheduler
+
+
+log = logging.getLogger('Rx')
+
+
+class WorkItem(object):
+    __slots__ = ('action', 'state', 'disposable')
+
+    def __init__(self, action: typing.ScheduledAction, state: Optional[typing.TState]) -> None:
+        self.action = action
+        self.state = state
+        self.disposable = SingleAssignmentDisposable()
+
+
+class WorkStealingScheduler(PeriodicScheduler, typing.Disposable):
+    """A scheduler that runs work on a fixed pool of worker threads.
+
+    Every worker owns a queue. Work scheduled from a worker thread is
+    put on the queue of that worker, so recursive scheduling stays on
+    the same thread. Work scheduled from any other thread is spread over
+    the workers. A worker that runs out of work steals from the queues
+    of the other workers before going idle.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 thread_factory: Optional[typing.StartableFactory] = None
+                 ) -> None:
+        super().__init__()
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._thread_factory: typing.StartableFactory = thread_factory or default_thread_factory
+
+        self._queues: List[Deque[WorkItem]] = [deque() for _ in range(self._max_workers)]
+        self._local = threading.local()
+        self._condition = threading.Condition(threading.Lock())
+        self._idle = 0
+        self._next = 0
+        self._threads: List[typing.Startable] = []
+        self._is_disposed = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def schedule(self,
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState] = None
+                 ) -> typing.Disposable:
+        """Schedules an action to be executed.
+
+        Args:
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        if self._is_disposed:
+            raise DisposedException()
+
+        item = WorkItem(action, state)
+        index = getattr(self._local, 'index', None)
+        if index is None:
+            if not self._threads:
+                self._start_workers()
+            index = self._next
+            self._next = (index + 1) % self._max_workers
+
+        self._queues[index].append(item)
+        if self._idle:
+            with self._condition:
+                self._condition.notify()
+        return item.disposable
+
+    def schedule_relative(self,
+                          duetime: typing.RelativeTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed after duetime.
+
+        Args:
+            duetime: Relative time after which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        seconds = self.to_seconds(duetime)
+        if seconds <= 0.0:
+            return self.schedule(action, state)
+
+        sad = SingleAssignmentDisposable()
+
+        def timeout(scheduler: typing.Scheduler, _: typing.TState) -> None:
+            if not self._is_disposed:
+                sad.disposable = self.schedule(action, state)
+
+        timer = TimeoutScheduler.singleton().schedule_relative(seconds, timeout)
+        return CompositeDisposable(sad, timer)
+
+    def schedule_absolute(self,
+                          duetime: typing.AbsoluteTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed at duetime.
+
+        Args:
+            duetime: Absolute time at which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now, action, state)
+
+    def _start_workers(self) -> None:
+        with self._condition:
+            if self._threads:
+                return
+
+            for index in range(self._max_workers):
+                thread = self._thread_factory(lambda index=index: self._run(index))
+                self._threads.append(thread)
+                thread.start()
+
+    def _take(self, index: int) -> Optional[WorkItem]:
+        """Takes the oldest item of the own queue, or else steals the
+        newest item of another queue."""
+
+        queues = self._queues
+        try:
+            return queues[index].popleft()
+        except IndexError:
+            pass
+
+        count = len(queues)
+        for offset in range(1, count):
+            try:
+                return queues[(index + offset) % count].pop()
+            except IndexError:
+                pass
+        return None
+
+    def _run(self, index: int) -> None:
+        self._local.index = index
+        condition = self._condition
+
+        while not self._is_disposed:
+            item = self._take(index)
+            if item is None:
+                with condition:
+                    self._idle += 1
+                    try:
+                        # Check again under the condition, as work may
+                        # have been added before we were counted idle.
+                        item = self._take(index)
+                        if item is None and not self._is_disposed:
+                            condition.wait()
+                    finally:
+                        self._idle -= 1
+                if item is None:
+                    continue
+
+            if item.disposable.is_disposed:
+                continue
+
+            try:
+                item.disposable.disposable = self.invoke_action(item.action, item.state)
+            except Exception:  # pylint: disable=broad-except
+                log.exception("WorkStealingScheduler: unhandled exception in scheduled action")
+
+    def dispose(self) -> None:
+        """Ends the worker threads. Work that has not started yet is
+        discarded."""
+
+        with self._condition:
+            self._is_disposed = True
+            self._condition.notify_all()
@@ -1,7 +1,8 @@
 import sys
 
 from datetime import datetime
-from typing import cast, Any, Optional, List, NamedTuple
+from bisect import bisect_left
+from typing import cast, Any, List, Optional
 from datetime import timedelta
 
 from rx.core import typing
@@ -22,11 +23,6 @@ class RemovableDisposable(typing.Disposable):
             self.subject.observers.remove(self.observer)
 
 
-class QueueItem(NamedTuple):
-    interval: datetime
-    value: Any
-
-
 class ReplaySubject(Subject):
     """Represents an object that is both an observable sequence as well
     as an observer. Each notification is broadcasted to all subscribed
@@ -52,7 +48,14 @@ class ReplaySubject(Subject):
         self.buffer_size = sys.maxsize if buffer_size is None else buffer_size
         self.scheduler = scheduler or CurrentThreadScheduler.singleton()
         self.window = timedelta.max if window is None else self.scheduler.to_timedelta(window)
-        self.queue: List[QueueItem] = []
+
+        # The buffer is stored as parallel arrays of timestamps and
+        # values. Trimmed items are skipped by moving start forward, and
+        # the arrays are compacted once more than half of them is dead.
+        self.times: List[datetime] = []
+        self.values: List[Any] = []
+        self.start = 0
+        self.snapshot: Optional[List[Any]] = None
 
     def _subscribe_core(self,
                         observer: typing.Observer,
@@ -66,8 +69,12 @@ class ReplaySubject(Subject):
             self._trim(self.scheduler.now)
             self.observers.append(so)
 
-            for item in self.queue:
-                so.on_next(item.value)
+            if self.start < len(self.values):
+                # Late subscribers arriving between two values share the
+                # same snapshot, which is replayed as a single batch.
+                if self.snapshot is None:
+                    self.snapshot = self.values[self.start:]
+                so.on_next_batch(self.snapshot)
 
             if self.exception is not None:
                 so.on_error(self.exception)
@@ -78,11 +85,25 @@ class ReplaySubject(Subject):
         return subscription
 
     def _trim(self, now: datetime):
-        while len(self.queue) > self.buffer_size:
-            self.queue.pop(0)
-
-        while self.queue and (now - self.queue[0].interval) > self.window:
-            self.queue.pop(0)
+        times, start = self.times, self.start
+        start = max(start, len(times) - self.buffer_size)
+
+        if self.window != timedelta.max and start < len(times):
+            try:
+                cutoff = now - self.window
+            except OverflowError:
+                pass
+            else:
+                if times[start] < cutoff:
+                    start = bisect_left(times, cutoff, start)
+
+        if start != self.start:
+            self.snapshot = None
+            if start > len(times) // 2:
+                del times[:start]
+                del self.values[:start]
+                start = 0
+            self.start = start
 
     def _on_next_core(self, value: Any) -> None:
         """Notifies all subscribed observers with the value."""
@@ -90,7 +111,9 @@ class ReplaySubject(Subject):
         with self.lock:
             observers = self.observers.copy()
             now = self.scheduler.now
-            self.queue.append(QueueItem(interval=now, value=value))
+            self.times.append(now)
+            self.values.append(value)
+            self.snapshot = None
             self._trim(now)
 
         for observer in observers:
@@ -131,5 +154,8 @@ class ReplaySubject(Subject):
         ReplaySubject class and unsubscribe all observers."""
 
         with self.lock:
-            self.queue.clear()
+            self.times.clear()
+            self.values.clear()
+            self.start = 0
+            self.snapshot = None
             super().dispose()
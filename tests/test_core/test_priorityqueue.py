@@ -131,3 +131,65 @@ class TestPriorityQueue(unittest.TestCase):
         assert p.peek() == 41
         p.enqueue(43)
         assert p.peek() == 41
+
+    def test_priorityqueue_remove_identity(self):
+        """Items are removed by identity, not by equality"""
+
+        p = PriorityQueue()
+        first, second = TestItem(42, "first"), TestItem(42, "second")
+        p.enqueue(first)
+        p.enqueue(second)
+
+        assert p.remove(TestItem(42)) is False
+        assert p.remove(second) is True
+        assert p.remove(second) is False
+        assert p.dequeue() is first
+
+    def test_priorityqueue_remove_many(self):
+        """Heap order is kept when removing from the middle"""
+
+        p = PriorityQueue()
+        items = [TestItem((n * 37) % 101) for n in range(101)]
+        for item in items:
+            p.enqueue(item)
+
+        for item in items[::3]:
+            assert p.remove(item) is True
+
+        expected = sorted(item.value for item in items[1::3] + items[2::3])
+        assert [p.dequeue().value for _ in range(len(p))] == expected
+
+    def test_priorityqueue_discard(self):
+        """Discarded items are skipped"""
+
+        p = PriorityQueue()
+        items = [TestItem(n) for n in range(5)]
+        for item in items:
+            p.enqueue(item)
+
+        assert p.discard(items[0]) is True
+        assert p.discard(items[0]) is False
+        assert p.discard(items[3]) is True
+        assert p.remove(items[3]) is False
+        assert len(p) == 3
+
+        assert p.peek() is items[1]
+        assert [p.dequeue(), p.dequeue(), p.dequeue()] == [items[1], items[2], items[4]]
+        assert len(p) == 0
+        assert p.items == []
+
+    def test_priorityqueue_compact(self):
+        """The heap is rebuilt when most items are discarded"""
+
+        p = PriorityQueue()
+        items = [TestItem(n) for n in range(200)]
+        for item in items:
+            p.enqueue(item)
+
+        for item in items[:101]:
+            p.discard(item)
+
+        assert len(p) == 99
+        assert len(p.items) == 99
+        assert p.discarded == 0
+        assert [p.dequeue() for _ in range(99)] == items[101:]
@@ -0,0 +1,52 @@
+import unittest
+
+from rx.internal import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_ringbuffer_empty(self):
+        q = RingBuffer()
+        assert len(q) == 0
+        assert not q
+        assert q.capacity is None
+        assert not q.is_full()
+
+    def test_ringbuffer_fifo(self):
+        q = RingBuffer()
+        q.enqueue(1)
+        q.enqueue(2)
+        q.enqueue(3)
+        assert q.peek() == 1
+        assert q.dequeue() == 1
+        assert q.dequeue() == 2
+        q.enqueue(4)
+        assert list(q) == [3, 4]
+        assert q[-1] == 4
+
+    def test_ringbuffer_dequeue_empty(self):
+        q = RingBuffer()
+        with self.assertRaises(IndexError):
+            q.dequeue()
+
+    def test_ringbuffer_capacity_drops_oldest(self):
+        q = RingBuffer(3)
+        for i in range(5):
+            q.enqueue(i)
+        assert q.is_full()
+        assert list(q) == [2, 3, 4]
+
+    def test_ringbuffer_capacity_zero(self):
+        q = RingBuffer(0)
+        q.enqueue(1)
+        assert len(q) == 0
+        assert q.is_full()
+
+    def test_ringbuffer_initial_items(self):
+        q = RingBuffer(2, [1, 2, 3])
+        assert list(q) == [2, 3]
+
+    def test_ringbuffer_clear(self):
+        q = RingBuffer(items=[1, 2])
+        q.clear()
+        assert len(q) == 0
@@ -0,0 +1,56 @@
+import unittest
+
+from rx.internal.timerwheel import TimerEntry, TimerWheel
+
+
+def noop():
+    pass
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    def test_timerwheel_due(self):
+        wheel = TimerWheel(100)
+        assert not wheel.add(TimerEntry(100, noop))
+        assert not wheel.add(TimerEntry(50, noop))
+        assert wheel.add(TimerEntry(101, noop))
+
+    def test_timerwheel_empty(self):
+        wheel = TimerWheel(0)
+        assert wheel.next_expiration() is None
+        assert wheel.advance(1000) == []
+
+    def test_timerwheel_advance(self):
+        wheel = TimerWheel(0, wheel_size=4)
+        entries = [TimerEntry(expiration, noop) for expiration in (3, 1, 20, 7, 70, 2)]
+        for entry in entries:
+            assert wheel.add(entry)
+
+        assert wheel.next_expiration() == 1
+        assert [e.expiration for e in wheel.advance(2)] == [1, 2]
+        assert [e.expiration for e in wheel.advance(6)] == [3]
+        assert [e.expiration for e in wheel.advance(19)] == [7]
+        assert [e.expiration for e in wheel.advance(69)] == [20]
+        assert wheel.advance(69) == []
+        assert [e.expiration for e in wheel.advance(1000)] == [70]
+        assert wheel.next_expiration() is None
+
+    def test_timerwheel_exact(self):
+        wheel = TimerWheel(0, wheel_size=8)
+        for expiration in range(1, 1000):
+            wheel.add(TimerEntry(expiration, noop))
+
+        for now in range(1, 1000):
+            due = wheel.advance(now)
+            assert [e.expiration for e in due] == [now]
+
+    def test_timerwheel_remove(self):
+        wheel = TimerWheel(0, wheel_size=4)
+        first, second = TimerEntry(30, noop), TimerEntry(31, noop)
+        wheel.add(first)
+        wheel.add(second)
+        wheel.remove(first)
+        wheel.remove(first)
+
+        assert wheel.advance(100) == [second]
+        assert first.bucket is None
@@ -83,3 +83,33 @@ class TestAsObservable(unittest.TestCase):
         scheduler.start(create)
 
         assert subscribed[0]
+
+    def test_as_observable_passes_observer_through(self):
+        scheduler = TestScheduler()
+        observers = []
+
+        def subscribe(obs, scheduler=None):
+            observers.append(obs)
+            return scheduler.create_hot_observable(on_next(220, 2), on_completed(250)).subscribe(obs)
+
+        xs = rx.create(subscribe)
+
+        def create():
+            return xs.pipe(ops.as_observable(), ops.as_observable())
+
+        results = scheduler.start(create).messages
+        assert results == [on_next(220, 2), on_completed(250)]
+        assert len(observers) == 1
+
+    def test_as_observable_subscribe_throws(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+
+        def subscribe(obs, scheduler=None):
+            raise Exception(ex)
+
+        def create():
+            return rx.create(subscribe).pipe(ops.as_observable())
+
+        results = scheduler.start(create).messages
+        assert results == [on_error(200, ex)]
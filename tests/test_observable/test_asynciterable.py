@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.internal import ArgumentOutOfRangeException
+from rx.scheduler import NewThreadScheduler
+
+
+class TestFromAsyncIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_from_async_iterable(self):
+        async def values():
+            for value in range(3):
+                await asyncio.sleep(0)
+                yield value
+
+        async def go():
+            done = self.loop.create_future()
+            results = []
+            rx.from_async_iterable(values()).subscribe(
+                results.append,
+                done.set_exception,
+                lambda: done.set_result(results))
+            return await done
+
+        assert self.loop.run_until_complete(go()) == [0, 1, 2]
+
+    def test_from_async_iterable_error(self):
+        ex = Exception('ex')
+
+        async def values():
+            yield 1
+            raise ex
+
+        async def go():
+            done = self.loop.create_future()
+            results = []
+            rx.from_async_iterable(values()).subscribe(results.append, done.set_result)
+            return await done, results
+
+        assert self.loop.run_until_complete(go()) == (ex, [1])
+
+    def test_from_async_iterable_dispose(self):
+        closed = False
+
+        async def values():
+            nonlocal closed
+            try:
+                while True:
+                    await asyncio.sleep(0)
+                    yield 1
+            finally:
+                closed = True
+
+        async def go():
+            results = []
+            d = rx.from_async_iterable(values()).subscribe(results.append)
+            await asyncio.sleep(0.01)
+            d.dispose()
+            await asyncio.sleep(0.01)
+            count = len(results)
+            await asyncio.sleep(0.01)
+            return count, len(results)
+
+        count, final = self.loop.run_until_complete(go())
+        assert count > 0
+        assert count == final
+        assert closed is True
+
+    def test_from_async_iterable_loop(self):
+        async def values():
+            yield threading.get_ident()
+
+        results = []
+        evt = threading.Event()
+        thread = threading.Thread(target=self.loop.run_forever)
+        thread.start()
+        try:
+            rx.from_async_iterable(values(), loop=self.loop).subscribe(results.append, on_completed=evt.set)
+            assert evt.wait(5)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            thread.join()
+
+        assert results == [thread.ident]
+
+
+class TestToAsyncIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def collect(self, iterable):
+        async def go():
+            return [value async for value in iterable]
+        return self.loop.run_until_complete(go())
+
+    def test_to_async_iterable(self):
+        iterable = rx.range(0, 5).pipe(ops.to_async_iterable())
+        assert self.collect(iterable) == [0, 1, 2, 3, 4]
+
+        # Every iteration subscribes again.
+        assert self.collect(iterable) == [0, 1, 2, 3, 4]
+
+    def test_to_async_iterable_batch(self):
+        iterable = rx.range(0, 10, batch_size=4).pipe(ops.to_async_iterable())
+        assert self.collect(iterable) == list(range(10))
+
+    def test_to_async_iterable_error(self):
+        ex = Exception('ex')
+        iterable = rx.concat(rx.of(1, 2), rx.throw(ex)).pipe(ops.to_async_iterable())
+        results = []
+
+        async def go():
+            async for value in iterable:
+                results.append(value)
+
+        with self.assertRaises(Exception) as cm:
+            self.loop.run_until_complete(go())
+        assert cm.exception is ex
+        assert results == [1, 2]
+
+    def test_to_async_iterable_thread(self):
+        iterable = rx.range(0, 100).pipe(
+            ops.subscribe_on(NewThreadScheduler()),
+            ops.to_async_iterable())
+        assert self.collect(iterable) == list(range(100))
+
+    def test_to_async_iterable_max_buffer(self):
+        produced = []
+        buffered = []
+
+        def record(value):
+            produced.append(value)
+
+        iterable = rx.range(0, 50).pipe(
+            ops.do_action(record),
+            ops.subscribe_on(NewThreadScheduler()),
+            ops.to_async_iterable(max_buffer=5))
+
+        async def go():
+            results = []
+            async for value in iterable:
+                await asyncio.sleep(0.001)
+                buffered.append(len(produced) - len(results))
+                results.append(value)
+            return results
+
+        assert self.loop.run_until_complete(go()) == list(range(50))
+        # At most max_buffer elements, plus one producer blocked on a
+        # full buffer, are ahead of the consumer.
+        assert max(buffered) <= 7
+
+    def test_to_async_iterable_break(self):
+        disposed = threading.Event()
+        iterable = rx.interval(0.001).pipe(
+            ops.finally_action(disposed.set),
+            ops.to_async_iterable(max_buffer=2))
+
+        async def go():
+            results = []
+            iterator = iterable.__aiter__()
+            async for value in iterator:
+                results.append(value)
+                if len(results) == 3:
+                    break
+            await iterator.aclose()
+            return results
+
+        assert self.loop.run_until_complete(go()) == [0, 1, 2]
+        assert disposed.wait(5)
+
+    def test_to_async_iterable_max_buffer_invalid(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            ops.to_async_iterable(max_buffer=0)
@@ -0,0 +1,147 @@
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.internal.exceptions import ArgumentOutOfRangeException
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class BatchObserver:
+
+    def __init__(self):
+        self.batches = []
+        self.values = []
+        self.completed = False
+        self.error = None
+
+    def on_next(self, value):
+        self.values.append(value)
+
+    def on_next_batch(self, values):
+        self.batches.append(list(values))
+        self.values.extend(values)
+
+    def on_error(self, error):
+        self.error = error
+
+    def on_completed(self):
+        self.completed = True
+
+
+class TestBatchWithCount(unittest.TestCase):
+
+    def test_batch_with_count_preserves_elements(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_completed(300))
+
+        def create():
+            return xs.pipe(ops.batch_with_count(2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, 1), on_next(220, 2),
+            on_next(240, 3), on_next(240, 4),
+            on_next(300, 5), on_completed(300)]
+
+    def test_batch_with_count_flushes_on_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_error(220, ex))
+
+        def create():
+            return xs.pipe(ops.batch_with_count(2))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, 1), on_error(220, ex)]
+
+    def test_batch_with_count_invalid(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            ops.batch_with_count(0)
+
+    def test_batch_with_count_pushes_batches(self):
+        observer = BatchObserver()
+        rx.from_iterable(range(5)).pipe(ops.batch_with_count(2)).subscribe(observer)
+
+        assert observer.batches == [[0, 1], [2, 3], [4]]
+        assert observer.completed
+
+    def test_batch_with_count_splits_large_batch(self):
+        observer = BatchObserver()
+        rx.from_iterable(range(10), batch_size=10).pipe(ops.batch_with_count(3)).subscribe(observer)
+
+        assert observer.batches == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+        assert observer.completed
+
+    def test_from_iterable_batch_size(self):
+        observer = BatchObserver()
+        rx.from_iterable(range(5), batch_size=2).subscribe(observer)
+
+        assert observer.batches == [[0, 1], [2, 3], [4]]
+        assert observer.completed
+
+    def test_range_batch_size(self):
+        observer = BatchObserver()
+        rx.range(0, 5, batch_size=3).subscribe(observer)
+
+        assert observer.batches == [[0, 1, 2], [3, 4]]
+        assert observer.completed
+
+    def test_batch_through_fused_operators(self):
+        observer = BatchObserver()
+        rx.from_iterable(range(10), batch_size=4).pipe(
+            ops.map(lambda x: x * 10),
+            ops.filter(lambda x: x % 20 == 0),
+            ops.take_while(lambda x: x < 60, inclusive=True),
+        ).subscribe(observer)
+
+        assert observer.batches == [[0, 20], [40, 60]]
+        assert observer.completed
+
+    def test_batch_unrolled_by_unsupported_operator(self):
+        observer = BatchObserver()
+        rx.from_iterable(range(4), batch_size=4).pipe(
+            ops.pairwise(),
+        ).subscribe(observer)
+
+        assert observer.batches == []
+        assert observer.values == [(0, 1), (1, 2), (2, 3)]
+        assert observer.completed
+
+    def test_batch_aggregates(self):
+        source = rx.range(0, 100, batch_size=16)
+
+        assert source.pipe(ops.sum()).run() == sum(range(100))
+        assert source.pipe(ops.count()).run() == 100
+        assert source.pipe(ops.reduce(lambda acc, x: acc + x)).run() == sum(range(100))
+        assert source.pipe(ops.scan(lambda acc, x: acc + x), ops.last()).run() == sum(range(100))
+        assert source.pipe(ops.to_list()).run() == list(range(100))
+
+    def test_batch_error_in_mapper(self):
+        observer = BatchObserver()
+        ex = Exception('ex')
+
+        def mapper(x):
+            if x == 2:
+                raise ex
+            return x
+
+        rx.from_iterable(range(4), batch_size=4).pipe(ops.map(mapper)).subscribe(observer)
+
+        assert observer.values == [0, 1]
+        assert observer.error is ex
@@ -1,6 +1,7 @@
 import unittest
 
 from rx import operators as ops
+from rx.subject import Subject
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -130,3 +131,14 @@ class TestBufferWithCount(unittest.TestCase):
             on_next(600, ""),
             on_completed(600)]
         assert xs.subscriptions == [subscribe(200, 600)]
+
+    def test_buffer_with_time_concurrent_timer(self):
+        source = Subject()
+        buffers = []
+        source.pipe(ops.buffer_with_time(0.001)).subscribe(buffers.append)
+
+        for x in range(20000):
+            source.on_next(x)
+        source.on_completed()
+
+        assert [x for values in buffers for x in values] == list(range(20000))
@@ -2,6 +2,7 @@ import unittest
 
 import rx
 from rx import operators as ops
+from rx.subject import Subject
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -471,5 +472,53 @@ class TestCombineLatest(unittest.TestCase):
         assert results.messages == [on_error(220, ex)]
 
 
+    def test_combine_latest_snapshot(self):
+        scheduler = TestScheduler()
+        msgs1 = [on_next(150, 1), on_next(215, 2), on_next(225, 4), on_completed(230)]
+        msgs2 = [on_next(150, 1), on_next(220, 3), on_completed(240)]
+        e1 = scheduler.create_hot_observable(msgs1)
+        e2 = scheduler.create_hot_observable(msgs2)
+
+        def create():
+            return rx.combine_latest(e1, e2, snapshot=True).pipe(ops.map(tuple))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, (2, 3)), on_next(225, (4, 3)), on_completed(240)]
+
+    def test_combine_latest_snapshot_copy_on_write(self):
+        s1 = Subject()
+        s2 = Subject()
+        kept = []
+        seen = []
+
+        def on_next(snapshot):
+            seen.append(tuple(snapshot))
+            if len(seen) == 1:
+                kept.append(snapshot)
+
+        s1.pipe(ops.combine_latest(s2, snapshot=True)).subscribe(on_next)
+        s1.on_next(1)
+        s2.on_next(2)
+        s1.on_next(3)
+        s2.on_next(4)
+
+        assert seen == [(1, 2), (3, 2), (3, 4)]
+        # A snapshot that is still referenced does not change.
+        assert kept[0] == (1, 2)
+        assert len(kept[0]) == 2
+        assert list(kept[0]) == [1, 2]
+
+    def test_combine_latest_many(self):
+        subjects = [Subject() for _ in range(200)]
+        results = []
+        rx.combine_latest(*subjects).subscribe(results.append)
+
+        for i, subject in enumerate(subjects):
+            subject.on_next(i)
+        subjects[7].on_next(-1)
+
+        assert results == [tuple(range(200)), tuple(-1 if i == 7 else i for i in range(200))]
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.subject import Subject
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class RxException(Exception):
+    pass
+
+
+class TestCombineLatestKeyed(unittest.TestCase):
+
+    def test_combine_latest_keyed_pairs(self):
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(on_next(210, 1), on_next(230, 3), on_completed(250))
+        b = scheduler.create_hot_observable(on_next(220, 2), on_completed(260))
+
+        def create():
+            return rx.of(("a", a), ("b", b)).pipe(
+                ops.combine_latest_keyed(),
+                ops.map(lambda update: (update[0], update[1], dict(update[2]))),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, ("a", 1, {"a": 1})),
+            on_next(220, ("b", 2, {"a": 1, "b": 2})),
+            on_next(230, ("a", 3, {"a": 3, "b": 2})),
+            on_completed(260)]
+
+    def test_combine_latest_keyed_group_by(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_completed(240))
+
+        def create():
+            return xs.pipe(
+                ops.group_by(lambda x: x[0]),
+                ops.combine_latest_keyed(),
+                ops.map(lambda update: sorted(update[2].values())),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, ["a1"]),
+            on_next(220, ["a1", "b1"]),
+            on_next(230, ["a2", "b1"]),
+            on_completed(240)]
+
+    def test_combine_latest_keyed_error(self):
+        ex = RxException('ex')
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(on_next(210, 1), on_error(220, ex))
+
+        def create():
+            return rx.of(("a", a), ("b", rx.never())).pipe(
+                ops.combine_latest_keyed(),
+                ops.map(lambda update: update[1]),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+
+    def test_combine_latest_keyed_dispose(self):
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(on_next(210, 1), on_next(300, 2))
+        xs = scheduler.create_hot_observable(on_next(205, ("a", a)))
+
+        def create():
+            return xs.pipe(
+                ops.combine_latest_keyed(),
+                ops.map(lambda update: update[1]),
+            )
+
+        results = scheduler.start(create, disposed=250)
+        assert results.messages == [on_next(210, 1)]
+        assert a.subscriptions == [subscribe(205, 250)]
+        assert xs.subscriptions == [subscribe(200, 250)]
+
+    def test_combine_latest_keyed_snapshot_is_immutable(self):
+        sources = Subject()
+        a = Subject()
+        b = Subject()
+        updates = []
+        sources.pipe(ops.combine_latest_keyed()).subscribe(updates.append)
+
+        sources.on_next(("a", a))
+        sources.on_next(("b", b))
+        a.on_next(1)
+        b.on_next(2)
+        a.on_next(3)
+
+        assert [dict(snapshot) for _, _, snapshot in updates] == [
+            {"a": 1},
+            {"a": 1, "b": 2},
+            {"a": 3, "b": 2}]
+
+    def test_combine_latest_keyed_snapshot_is_shared(self):
+        sources = Subject()
+        a = Subject()
+        snapshots = []
+        sources.pipe(ops.combine_latest_keyed()).subscribe(lambda update: snapshots.append(id(update[2]._values)))
+
+        sources.on_next(("a", a))
+        a.on_next(1)
+        a.on_next(2)
+        a.on_next(3)
+
+        assert len(set(snapshots)) == 1
@@ -94,3 +94,76 @@ class TestDistinctUntilChanged(unittest.TestCase):
 
         assert results.messages == [on_next(280, 3), on_next(350, 1), on_error(380, ex)]
         assert xs.subscriptions == [subscribe(200, 380)]
+
+    def test_distinct_comparer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, 4), on_next(300, 2), on_next(350, 12), on_next(380, 3), on_next(400, 24), on_completed(420))
+
+        def create():
+            return xs.pipe(ops.distinct(comparer=lambda a, b: a % 10 == b % 10))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(280, 4), on_next(300, 2), on_next(380, 3), on_completed(420)]
+
+    def test_distinct_unhashable_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, [1]), on_next(300, 2), on_next(350, [1]), on_next(380, [2]), on_completed(420))
+
+        def create():
+            return xs.pipe(ops.distinct())
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(280, [1]), on_next(300, 2), on_next(380, [2]), on_completed(420)]
+
+    def test_distinct_max_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 1), on_next(240, 3), on_next(250, 2), on_next(260, 1), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.distinct(max_keys=2))
+
+        results = scheduler.start(create)
+
+        # 1 is refreshed at 230, so 2 is evicted when 3 arrives.
+        assert results.messages == [on_next(210, 1), on_next(220, 2), on_next(240, 3), on_next(250, 2), on_next(260, 1), on_completed(300)]
+
+    def test_distinct_max_keys_comparer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 1), on_next(240, 3), on_next(250, 2), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.distinct(comparer=lambda a, b: a == b, max_keys=2))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 1), on_next(220, 2), on_next(240, 3), on_next(250, 2), on_completed(300)]
+
+    def test_distinct_ttl(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 1), on_next(240, 2), on_next(250, 1), on_next(280, 1), on_next(290, 2), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.distinct(ttl=35))
+
+        results = scheduler.start(create)
+
+        # Seeing 1 again keeps it alive, while 2 expires at 275.
+        assert results.messages == [on_next(210, 1), on_next(240, 2), on_next(290, 2), on_completed(300)]
+
+    def test_distinct_bloom(self):
+        values = []
+        rx.from_([1, 2, 1, 3, 2, 4]).pipe(ops.distinct(bloom_capacity=100)).subscribe(values.append)
+        assert values == [1, 2, 3, 4]
+
+    def test_distinct_bloom_false_positives(self):
+        values = []
+        rx.range(0, 10000).pipe(
+            ops.distinct(bloom_capacity=10000, false_positive_rate=0.01)
+        ).subscribe(values.append)
+        assert len(values) > 9900
+
+    def test_distinct_bloom_invalid(self):
+        with self.assertRaises(ValueError):
+            ops.distinct(bloom_capacity=10, max_keys=10)
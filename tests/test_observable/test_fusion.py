@@ -0,0 +1,226 @@
+import unittest
+
+from rx import operators as ops
+from rx.core.observable.fusedobservable import FusedObservable
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class RxException(Exception):
+    pass
+
+
+def _raise(ex):
+    raise RxException(ex)
+
+
+class TestFusion(unittest.TestCase):
+
+    def test_fusion_collapses_chain(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1))
+
+        ys = xs.pipe(
+            ops.map(lambda x: x + 1),
+            ops.filter(lambda x: x > 0),
+            ops.pluck_attr('real'),
+            ops.do_action(lambda x: None),
+            ops.skip_while(lambda x: False),
+            ops.take_while(lambda x: True),
+        )
+
+        assert isinstance(ys, FusedObservable)
+        assert ys.source is xs
+        assert len(ys.stages) == 6
+
+    def test_fusion_map_filter(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(220, 3),
+            on_next(230, 4),
+            on_next(240, 5),
+            on_completed(250))
+
+        def create():
+            return xs.pipe(
+                ops.map(lambda x: x * 10),
+                ops.filter(lambda x: x % 20 == 0),
+                ops.map(lambda x: x + 1),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 21), on_next(230, 41), on_completed(250)]
+        assert xs.subscriptions == [subscribe(200, 250)]
+
+    def test_fusion_skip_while_take_while(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_completed(300))
+
+        def create():
+            return xs.pipe(
+                ops.skip_while(lambda x: x < 2),
+                ops.map(lambda x: x * 2),
+                ops.take_while(lambda x: x < 8, inclusive=True),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, 4), on_next(230, 6), on_next(240, 8), on_completed(240)]
+        assert xs.subscriptions == [subscribe(200, 240)]
+
+    def test_fusion_take_while_completes_downstream_only(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_completed(300))
+        before = []
+        after = []
+
+        def create():
+            return xs.pipe(
+                ops.do_action(on_completed=lambda: before.append(True)),
+                ops.take_while(lambda x: x < 2),
+                ops.do_action(on_completed=lambda: after.append(True)),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_completed(220)]
+        assert before == []
+        assert after == [True]
+
+    def test_fusion_error_in_stage(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(300))
+        errors = []
+
+        def mapper(x):
+            if x == 2:
+                _raise(ex)
+            return x
+
+        def create():
+            return xs.pipe(
+                ops.do_action(on_error=lambda e: errors.append('before')),
+                ops.map(mapper),
+                ops.do_action(on_error=lambda e: errors.append('after')),
+            )
+
+        results = scheduler.start(create)
+        assert len(results.messages) == 2
+        assert results.messages[0] == on_next(210, 1)
+        assert results.messages[1].time == 220
+        assert isinstance(results.messages[1].value.exception, RxException)
+        assert errors == ['after']
+        assert xs.subscriptions == [subscribe(200, 220)]
+
+    def test_fusion_shared_prefix(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_completed(300))
+
+        prefix = xs.pipe(ops.map(lambda x: x + 1))
+        left = prefix.pipe(ops.map(lambda x: x * 2))
+        right = prefix.pipe(ops.filter(lambda x: x > 2))
+
+        results1 = scheduler.create_observer()
+        results2 = scheduler.create_observer()
+        left.subscribe(results1)
+        right.subscribe(results2)
+        scheduler.start()
+
+        assert results1.messages == [on_next(210, 4), on_next(220, 6), on_completed(300)]
+        assert results2.messages == [on_next(220, 3), on_completed(300)]
+
+    def test_fusion_batch_error_in_stage(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(300))
+        errors = []
+
+        def mapper(x):
+            if x == 3:
+                _raise(ex)
+            return x * 10
+
+        def create():
+            return xs.pipe(
+                ops.batch_with_count(3),
+                ops.do_action(on_error=lambda e: errors.append('before')),
+                ops.map(mapper),
+                ops.filter(lambda x: x > 10),
+                ops.do_action(on_error=lambda e: errors.append('after')),
+            )
+
+        results = scheduler.start(create)
+        assert len(results.messages) == 2
+        assert results.messages[0] == on_next(230, 20)
+        assert results.messages[1].time == 230
+        assert isinstance(results.messages[1].value.exception, RxException)
+        assert errors == ['after']
+
+    def test_fusion_scan(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_completed(300))
+
+        ys = xs.pipe(
+            ops.map(lambda x: x * 10),
+            ops.scan(lambda acc, x: acc + x, 5),
+            ops.filter(lambda x: x > 20),
+        )
+        assert isinstance(ys, FusedObservable)
+        assert ys.source is xs
+
+        results = scheduler.start(lambda: ys)
+        assert results.messages == [
+            on_next(220, 35), on_next(230, 65), on_next(240, 105), on_completed(300)]
+
+    def test_fusion_scan_batches(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_completed(300))
+
+        def create():
+            return xs.pipe(
+                ops.batch_with_count(2),
+                ops.scan(lambda acc, x: acc + x),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, 1), on_next(220, 3),
+            on_next(240, 6), on_next(240, 10), on_completed(300)]
@@ -2,6 +2,8 @@ import unittest
 
 import rx
 from rx import operators as ops
+from rx.internal.exceptions import ArgumentOutOfRangeException
+from rx.subject import Subject
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -594,5 +596,101 @@ class TestGroupBy(unittest.TestCase):
             on_completed(200)]
 
 
+    def test_group_by_max_groups(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_next(240, "c1"),
+            on_next(250, "b2"),
+            on_completed(260))
+        results = {}
+
+        def create():
+            def on_group(group):
+                observer = scheduler.create_observer()
+                results.setdefault(group.key, []).append(observer)
+                group.subscribe(observer)
+                return group.key
+
+            return xs.pipe(
+                ops.group_by(lambda x: x[0], max_groups=2),
+                ops.map(on_group))
+
+        res = scheduler.start(create)
+        assert res.messages == [
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(240, "c"),
+            on_next(250, "b"),
+            on_completed(260)]
+        assert results["a"][0].messages == [
+            on_next(210, "a1"),
+            on_next(230, "a2"),
+            on_completed(250)]
+        assert results["b"][0].messages == [
+            on_next(220, "b1"),
+            on_completed(240)]
+        assert results["b"][1].messages == [
+            on_next(250, "b2"),
+            on_completed(260)]
+
+    def test_group_by_max_groups_out_of_range(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            ops.group_by(lambda x: x, max_groups=0)
+
+    def test_group_by_idle_timeout(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(240, "a2"),
+            on_next(300, "b2"),
+            on_completed(400))
+        results = {}
+
+        def create():
+            def on_group(group):
+                observer = scheduler.create_observer()
+                results.setdefault(group.key, []).append(observer)
+                group.subscribe(observer)
+                return group.key
+
+            return xs.pipe(
+                ops.group_by(lambda x: x[0], idle_timeout=50),
+                ops.map(on_group))
+
+        res = scheduler.start(create)
+        assert res.messages == [
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(300, "b"),
+            on_completed(400)]
+        assert results["a"][0].messages == [
+            on_next(210, "a1"),
+            on_next(240, "a2"),
+            on_completed(290)]
+        assert results["b"][0].messages == [
+            on_next(220, "b1"),
+            on_completed(270)]
+        assert results["b"][1].messages == [
+            on_next(300, "b2"),
+            on_completed(350)]
+
+    def test_group_by_group_count(self):
+        source = Subject()
+        groups = source.pipe(ops.group_by(lambda x: x % 3, max_groups=2))
+        disposable = groups.subscribe()
+
+        for x in range(5):
+            source.on_next(x)
+
+        assert groups.group_count == 2
+        assert groups.group_sizes() == {0: 1, 1: 1}
+
+        disposable.dispose()
+        assert groups.group_count == 0
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import rx
+from rx import operators as ops
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.exceptions import ArgumentOutOfRangeException
+from rx.scheduler import ImmediateScheduler
+
+
+class ShardingScheduler(object):
+    def __init__(self):
+        self.keys = []
+
+    def shard(self, key):
+        self.keys.append(key)
+        return ImmediateScheduler()
+
+
+class TestGroupByParallel(unittest.TestCase):
+
+    def collect(self, source):
+        done = threading.Event()
+        results = []
+        source.subscribe(results.append, on_completed=done.set)
+        assert done.wait(5)
+        return results
+
+    def test_group_by_parallel_keeps_order_per_key(self):
+        source = rx.from_iterable(range(1000)).pipe(
+            ops.group_by_parallel(lambda x: x % 4, workers=2),
+            ops.flat_map(lambda grp: grp.pipe(
+                ops.to_list(),
+                ops.map(lambda values: (grp.key, values)))))
+
+        results = dict(self.collect(source))
+        assert results == {key: list(range(key, 1000, 4)) for key in range(4)}
+
+    def test_group_by_parallel_runs_groups_on_workers(self):
+        source = rx.from_iterable(range(100)).pipe(
+            ops.group_by_parallel(lambda x: x % 2, workers=2),
+            ops.flat_map(lambda grp: grp.pipe(
+                ops.map(lambda _: (grp.key, threading.current_thread())))))
+
+        results = self.collect(source)
+        threads = {key: {thread for key_, thread in results if key_ == key} for key in range(2)}
+        assert len(threads[0]) == 1
+        assert len(threads[1]) == 1
+        assert threads[0] != threads[1]
+        assert threading.current_thread() not in threads[0] | threads[1]
+
+    def test_group_by_parallel_starts_only_used_workers(self):
+        started = []
+
+        def thread_factory(target):
+            started.append(target)
+            return default_thread_factory(target)
+
+        with patch('rx.scheduler.eventloopscheduler.default_thread_factory', thread_factory):
+            source = rx.of(1, 2, 3, 4).pipe(
+                ops.group_by_parallel(lambda x: x % 2, workers=8),
+                ops.flat_map(lambda grp: grp.pipe(ops.count())))
+
+            assert sorted(self.collect(source)) == [2, 2]
+
+        assert len(started) == 2
+
+    def test_group_by_parallel_element_mapper(self):
+        source = rx.of(1, 2, 3, 4).pipe(
+            ops.group_by_parallel(lambda x: x % 2, lambda x: x * 10),
+            ops.flat_map(lambda grp: grp.pipe(ops.sum())))
+
+        assert sorted(self.collect(source)) == [40, 60]
+
+    def test_group_by_parallel_sharding_scheduler(self):
+        scheduler = ShardingScheduler()
+        source = rx.of("a1", "b1", "a2").pipe(
+            ops.group_by_parallel(lambda x: x[0], scheduler=scheduler),
+            ops.merge_all())
+
+        assert self.collect(source) == ["a1", "b1", "a2"]
+        assert scheduler.keys == ["a", "b"]
+
+    def test_group_by_parallel_workers_out_of_range(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            ops.group_by_parallel(lambda x: x, workers=0)
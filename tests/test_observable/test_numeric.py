@@ -0,0 +1,97 @@
+import unittest
+
+import pytest
+
+import rx
+from rx import operators as ops
+from rx.internal.exceptions import SequenceContainsNoElementsError
+from rx.operators import numeric
+
+np = pytest.importorskip("numpy")
+
+
+class TestNumeric(unittest.TestCase):
+
+    def setUp(self):
+        self.data = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0, 5.0])
+        self.chunks = numeric.from_array(self.data, 4)
+
+    def test_from_array(self):
+        chunks = self.chunks.pipe(ops.to_list()).run()
+        assert [len(c) for c in chunks] == [4, 4, 3]
+        np.testing.assert_array_equal(np.concatenate(chunks), self.data)
+
+    def test_chunk(self):
+        chunks = rx.from_iterable(self.data.tolist()).pipe(numeric.chunk(4), ops.to_list()).run()
+        assert [len(c) for c in chunks] == [4, 4, 3]
+        np.testing.assert_array_equal(np.concatenate(chunks), self.data)
+
+    def test_chunk_batches(self):
+        source = rx.from_iterable(self.data.tolist(), batch_size=3)
+        chunks = source.pipe(numeric.chunk(4, dtype=np.float32), ops.to_list()).run()
+        assert [len(c) for c in chunks] == [4, 4, 3]
+        assert chunks[0].dtype == np.float32
+
+    def test_chunk_splits_large_batch(self):
+        source = rx.from_iterable(range(10), batch_size=10)
+        chunks = source.pipe(numeric.chunk(3), ops.to_list()).run()
+        assert [c.tolist() for c in chunks] == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+    def test_map_filter(self):
+        result = self.chunks.pipe(
+            numeric.map(lambda c: c * 2),
+            numeric.filter(lambda c: c > 8),
+            ops.to_list()
+        ).run()
+        np.testing.assert_array_equal(np.concatenate(result), [10.0, 18.0, 12.0, 10.0, 10.0])
+
+    def test_filter_drops_empty_chunks(self):
+        result = self.chunks.pipe(numeric.filter(lambda c: c > 8), ops.to_list()).run()
+        assert len(result) == 1
+
+    def test_scan_carries_state(self):
+        result = self.chunks.pipe(numeric.scan(np.add), ops.to_list()).run()
+        np.testing.assert_allclose(np.concatenate(result), np.cumsum(self.data))
+
+        result = self.chunks.pipe(numeric.scan(np.maximum), ops.to_list()).run()
+        np.testing.assert_array_equal(np.concatenate(result), np.maximum.accumulate(self.data))
+
+    def test_scan_seed(self):
+        result = self.chunks.pipe(numeric.scan(np.add, seed=10.0), ops.to_list()).run()
+        np.testing.assert_allclose(np.concatenate(result), np.cumsum(self.data) + 10.0)
+
+    def test_aggregates(self):
+        assert self.chunks.pipe(numeric.sum()).run() == pytest.approx(self.data.sum())
+        assert self.chunks.pipe(numeric.average()).run() == pytest.approx(self.data.mean())
+        assert self.chunks.pipe(numeric.min()).run() == 1.0
+        assert self.chunks.pipe(numeric.max()).run() == 9.0
+
+    def test_statistics(self):
+        assert self.chunks.pipe(numeric.variance()).run() == pytest.approx(np.var(self.data, ddof=1))
+        assert self.chunks.pipe(numeric.variance(ddof=0)).run() == pytest.approx(np.var(self.data))
+        assert self.chunks.pipe(numeric.standard_deviation()).run() == pytest.approx(np.std(self.data, ddof=1))
+        assert self.chunks.pipe(numeric.median()).run() == np.median(self.data)
+        np.testing.assert_array_equal(self.chunks.pipe(numeric.mode()).run(), [5.0])
+
+    def test_variance_single_sample(self):
+        one = numeric.from_array(np.array([5.0]), 4)
+        assert np.isnan(one.pipe(numeric.variance()).run())
+        assert np.isnan(one.pipe(numeric.standard_deviation()).run())
+        assert one.pipe(numeric.variance(ddof=0)).run() == 0.0
+
+        rows = numeric.from_array(np.array([[1.0, 2.0]]), 4)
+        assert np.isnan(rows.pipe(numeric.variance()).run()).all()
+
+    def test_two_dimensional_chunks(self):
+        data = np.arange(20.0).reshape(10, 2)
+        chunks = numeric.from_array(data, 3)
+        np.testing.assert_allclose(chunks.pipe(numeric.sum()).run(), data.sum(axis=0))
+        np.testing.assert_allclose(chunks.pipe(numeric.variance()).run(), np.var(data, axis=0, ddof=1))
+
+    def test_empty(self):
+        empty = numeric.from_array(np.array([]), 4)
+        assert empty.pipe(numeric.sum()).run() == 0
+        with self.assertRaises(SequenceContainsNoElementsError):
+            empty.pipe(numeric.average()).run()
+        with self.assertRaises(SequenceContainsNoElementsError):
+            empty.pipe(numeric.max()).run()
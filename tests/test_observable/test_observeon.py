@@ -1,8 +1,13 @@
+import threading
+import time
 import unittest
 
 import rx
 from rx import operators as ops
-from rx.scheduler import ImmediateScheduler
+from rx.core import Observer
+from rx.core.observer import ObserveOnObserver
+from rx.internal import BufferOverflowException
+from rx.scheduler import ImmediateScheduler, EventLoopScheduler
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -14,6 +19,16 @@ disposed = ReactiveTest.disposed
 created = ReactiveTest.created
 
 
+class CountingScheduler(TestScheduler):
+    def __init__(self):
+        super().__init__()
+        self.scheduled = 0
+
+    def schedule(self, action, state=None):
+        self.scheduled += 1
+        return super().schedule(action, state)
+
+
 class TestObserveOn(unittest.TestCase):
 
     def test_observe_on_normal(self):
@@ -94,3 +109,135 @@ class TestObserveOn(unittest.TestCase):
             scheduler=expected_subscribe_scheduler)
 
         assert expected_subscribe_scheduler == actual_subscribe_scheduler
+
+    def test_observe_on_drains_queue_in_one_action(self):
+        scheduler = CountingScheduler()
+        xs = rx.from_([1, 2, 3, 4, 5], scheduler=ImmediateScheduler())
+        results = []
+
+        xs.pipe(ops.observe_on(scheduler)).subscribe(results.append, on_completed=lambda: results.append('c'))
+        scheduler.start()
+
+        assert results == [1, 2, 3, 4, 5, 'c']
+        assert scheduler.scheduled == 1
+
+    def test_observe_on_budget(self):
+        scheduler = CountingScheduler()
+        xs = rx.from_([1, 2, 3, 4, 5], scheduler=ImmediateScheduler())
+        results = []
+
+        xs.pipe(ops.observe_on(scheduler, budget=2)).subscribe(results.append, on_completed=lambda: results.append('c'))
+        scheduler.start()
+
+        assert results == [1, 2, 3, 4, 5, 'c']
+        assert scheduler.scheduled == 3
+
+    def test_observe_on_budget_splits_batch(self):
+        scheduler = CountingScheduler()
+        xs = rx.from_iterable(range(10), batch_size=10)
+        results = []
+
+        xs.pipe(ops.observe_on(scheduler, budget=4)).subscribe(results.append, on_completed=lambda: results.append('c'))
+        scheduler.start()
+
+        assert results == list(range(10)) + ['c']
+        assert scheduler.scheduled == 3
+
+    def test_observe_on_dispose_drops_queued(self):
+        scheduler = TestScheduler()
+        xs = rx.from_([1, 2, 3], scheduler=ImmediateScheduler())
+        results = []
+
+        subscription = xs.pipe(ops.observe_on(scheduler)).subscribe(results.append)
+        subscription.dispose()
+        scheduler.start()
+
+        assert results == []
+
+    def _observe_bounded(self, overflow):
+        scheduler = TestScheduler()
+        xs = rx.from_([1, 2, 3, 4, 5], scheduler=ImmediateScheduler())
+        results = []
+
+        xs.pipe(ops.observe_on(scheduler, buffer_size=2, overflow=overflow)).subscribe(
+            results.append, results.append, lambda: results.append('c'))
+        scheduler.start()
+        return results
+
+    def test_observe_on_bounded_drop_newest(self):
+        assert self._observe_bounded('drop_newest') == [1, 2, 'c']
+
+    def test_observe_on_bounded_drop_oldest(self):
+        assert self._observe_bounded('drop_oldest') == [4, 5, 'c']
+
+    def test_observe_on_bounded_latest(self):
+        assert self._observe_bounded('latest') == [1, 5, 'c']
+
+    def test_observe_on_bounded_error(self):
+        results = self._observe_bounded('error')
+        assert results[:2] == [1, 2]
+        assert isinstance(results[2], BufferOverflowException)
+        assert len(results) == 3
+
+    def test_observe_on_bounded_block(self):
+        scheduler = EventLoopScheduler()
+        results = []
+        queued = []
+        done = threading.Event()
+
+        def on_next(value):
+            queued.append(len(observer.queue))
+            time.sleep(0.001)
+            results.append(value)
+
+        observer = ObserveOnObserver(scheduler, Observer(on_next, None, done.set),
+                                     buffer_size=3, overflow='block')
+        rx.range(0, 50).subscribe(observer)
+        assert done.wait(10)
+        scheduler.dispose()
+
+        assert results == list(range(50))
+        assert max(queued) <= 3
+
+    def test_observe_on_bounded_block_holds_buffer_size(self):
+        scheduler = EventLoopScheduler()
+        sent = 0
+        held = []
+        results = []
+        done = threading.Event()
+
+        def on_next(value):
+            held.append(sent - len(results))
+            time.sleep(0.001)
+            results.append(value)
+
+        observer = ObserveOnObserver(scheduler, Observer(on_next, None, done.set),
+                                     buffer_size=3, overflow='block')
+        for value in range(50):
+            observer.on_next(value)
+            sent += 1
+        observer.on_completed()
+        assert done.wait(10)
+        scheduler.dispose()
+
+        assert results == list(range(50))
+        assert max(held) <= 4
+
+    def test_observe_on_bounded_block_dispose(self):
+        observer = ObserveOnObserver(TestScheduler(), Observer(), buffer_size=1, overflow='block')
+        observer.on_next(1)
+
+        thread = threading.Thread(target=observer.on_next, args=(2,))
+        thread.start()
+        time.sleep(0.05)
+        observer.dispose()
+        thread.join(2)
+
+        assert not thread.is_alive()
+        assert len(observer.queue) == 1
+
+    def test_observe_on_bounded_invalid(self):
+        with self.assertRaises(ValueError):
+            ops.observe_on(TestScheduler(), buffer_size=0)
+        with self.assertRaises(ValueError):
+            ops.observe_on(TestScheduler(), buffer_size=1, overflow='unknown')
@@ -0,0 +1,113 @@
+import math
+import threading
+import time
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.internal import ArgumentOutOfRangeException, BufferOverflowException
+from rx.scheduler import ProcessPoolScheduler
+
+
+class TestParallelMap(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.scheduler = ProcessPoolScheduler(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.scheduler.dispose()
+
+    def test_parallel_map_ordered(self):
+        result = rx.range(-100, 100).pipe(
+            ops.parallel_map(abs, chunksize=7, scheduler=self.scheduler),
+            ops.to_list()
+        ).run()
+
+        assert result == [abs(x) for x in range(-100, 100)]
+
+    def test_parallel_map_unordered(self):
+        result = rx.range(0, 100).pipe(
+            ops.parallel_map(math.sqrt, ordered=False, chunksize=10, scheduler=self.scheduler),
+            ops.to_list()
+        ).run()
+
+        assert sorted(result) == [math.sqrt(x) for x in range(100)]
+
+    def test_parallel_map_batches(self):
+        result = rx.range(0, 100, batch_size=16).pipe(
+            ops.parallel_map(abs, chunksize=5, scheduler=self.scheduler),
+            ops.to_list()
+        ).run()
+
+        assert result == list(range(100))
+
+    def test_parallel_map_empty(self):
+        result = rx.empty().pipe(
+            ops.parallel_map(abs, scheduler=self.scheduler),
+            ops.to_list()
+        ).run()
+
+        assert result == []
+
+    def test_parallel_map_mapper_error(self):
+        with self.assertRaises(ValueError):
+            rx.from_([4, 1, -1, 9]).pipe(
+                ops.parallel_map(math.sqrt, scheduler=self.scheduler),
+                ops.to_list()
+            ).run()
+
+    def test_parallel_map_source_error(self):
+        ex = 'ex'
+        with self.assertRaises(Exception):
+            rx.throw(ex).pipe(
+                ops.parallel_map(abs, scheduler=self.scheduler)
+            ).run()
+
+    def test_parallel_map_own_pool(self):
+        result = rx.range(0, 10).pipe(
+            ops.parallel_map(abs, max_workers=2),
+            ops.to_list()
+        ).run()
+
+        assert result == list(range(10))
+
+    def test_parallel_map_buffer_blocks(self):
+        result = rx.range(0, 200).pipe(
+            ops.parallel_map(abs, chunksize=5, scheduler=self.scheduler, buffer_size=2),
+            ops.to_list()
+        ).run()
+
+        assert result == list(range(200))
+
+    def test_parallel_map_buffer_overflow(self):
+        with self.assertRaises(BufferOverflowException):
+            rx.from_([0.05] * 20).pipe(
+                ops.parallel_map(time.sleep, scheduler=self.scheduler, buffer_size=1, overflow='error')
+            ).run()
+
+    def test_parallel_map_invalid_chunksize(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            ops.parallel_map(abs, chunksize=0)
+
+
+class TestProcessPoolScheduler(unittest.TestCase):
+
+    def test_processpool_schedule_action(self):
+        scheduler = ProcessPoolScheduler(1)
+        ident = threading.current_thread().ident
+        evt = threading.Event()
+
+        def action(scheduler, state):
+            assert ident != threading.current_thread().ident
+            evt.set()
+
+        scheduler.schedule(action)
+        assert evt.wait(5)
+        scheduler.dispose()
+
+    def test_processpool_submit(self):
+        scheduler = ProcessPoolScheduler(1)
+        assert scheduler.submit(abs, -3).result(timeout=30) == 3
+        scheduler.dispose()
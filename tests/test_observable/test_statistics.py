@@ -0,0 +1,172 @@
+import math
+import random
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.core.operators.statistics import P2Quantile, SpaceSaving
+from rx.internal import ArgumentOutOfRangeException
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class RxException(Exception):
+    pass
+
+
+def _raise(ex):
+    raise RxException(ex)
+
+
+class TestStatistics(unittest.TestCase):
+
+    def test_variance(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(220, 4),
+            on_next(230, 4),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_next(260, 5),
+            on_next(270, 7),
+            on_next(280, 9),
+            on_completed(290))
+
+        results = scheduler.start(lambda: xs.pipe(ops.variance(ddof=0)))
+        assert results.messages == [on_next(290, 4.0), on_completed(290)]
+        assert xs.subscriptions == [subscribe(200, 290)]
+
+    def test_variance_sample(self):
+        values = []
+        rx.from_([1, 2, 3, 4, 5]).pipe(ops.variance()).subscribe(values.append)
+        assert values == [2.5]
+
+    def test_variance_empty(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(150, 1), on_completed(250))
+
+        results = scheduler.start(lambda: xs.pipe(ops.variance()))
+        assert len(results.messages) == 1
+        assert results.messages[0].time == 250
+        assert results.messages[0].value.kind == 'E'
+
+    def test_variance_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_error(220, ex))
+
+        results = scheduler.start(lambda: xs.pipe(ops.variance()))
+        assert results.messages == [on_error(220, ex)]
+
+    def test_variance_single_value(self):
+        values = []
+        rx.of(5.0).pipe(ops.variance()).subscribe(values.append)
+        rx.of(5.0).pipe(ops.standard_deviation()).subscribe(values.append)
+        rx.of(5.0).pipe(ops.variance(ddof=0)).subscribe(values.append)
+        assert math.isnan(values[0])
+        assert math.isnan(values[1])
+        assert values[2] == 0.0
+
+    def test_variance_batched(self):
+        values = []
+        rx.range(0, 1000, batch_size=64).pipe(ops.variance(ddof=0)).subscribe(values.append)
+        assert math.isclose(values[0], (1000 ** 2 - 1) / 12)
+
+    def test_standard_deviation(self):
+        values = []
+        rx.from_([2, 4, 4, 4, 5, 5, 7, 9]).pipe(ops.standard_deviation(ddof=0)).subscribe(values.append)
+        assert values == [2.0]
+
+    def test_median_exact_small(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 4),
+            on_next(220, 1),
+            on_next(230, 3),
+            on_next(240, 2),
+            on_completed(250))
+
+        results = scheduler.start(lambda: xs.pipe(ops.median()))
+        assert results.messages == [on_next(250, 2.5), on_completed(250)]
+
+    def test_median_empty(self):
+        error = []
+        rx.empty().pipe(ops.median()).subscribe(on_error=error.append)
+        assert len(error) == 1
+
+    def test_median_estimate(self):
+        rand = random.Random(42)
+        data = [rand.uniform(0, 1000) for _ in range(10000)]
+        values = []
+        rx.from_(data).pipe(ops.median()).subscribe(values.append)
+        assert abs(values[0] - sorted(data)[5000]) < 20
+
+    def test_quantile_estimate(self):
+        rand = random.Random(7)
+        data = [rand.gauss(0, 1) for _ in range(20000)]
+        values = []
+        rx.from_(data).pipe(ops.quantile(0.9)).subscribe(values.append)
+        assert abs(values[0] - sorted(data)[18000]) < 0.05
+
+    def test_quantile_bounded_memory(self):
+        estimator = P2Quantile(0.5)
+        for value in range(100000):
+            estimator.update(value)
+        assert len(estimator.heights) == 5
+        assert abs(estimator.value() - 50000) < 100
+
+    def test_quantile_out_of_range(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            ops.quantile(1.5)
+
+    def test_mode(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 2),
+            on_next(240, 3),
+            on_next(250, 2),
+            on_completed(260))
+
+        results = scheduler.start(lambda: xs.pipe(ops.mode()))
+        assert results.messages == [on_next(260, 2), on_completed(260)]
+
+    def test_mode_ties(self):
+        values = []
+        rx.from_([1, 2, 1, 2, 3]).pipe(ops.mode()).subscribe(values.append)
+        assert sorted(values) == [1, 2]
+
+    def test_mode_heavy_hitter(self):
+        rand = random.Random(1)
+        data = []
+        for index in range(20000):
+            data.append('hot' if index % 5 == 0 else rand.randrange(1000000))
+        values = []
+        rx.from_(data).pipe(ops.mode(max_counters=50)).subscribe(values.append)
+        assert values == ['hot']
+
+    def test_space_saving_bounded(self):
+        counter = SpaceSaving(10)
+        for value in range(10000):
+            counter.update(value)
+        assert len(counter.counts) == 10
+        assert len(counter.heap) <= 40
+
+    def test_mode_unhashable(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, []), on_completed(220))
+
+        results = scheduler.start(lambda: xs.pipe(ops.mode()))
+        assert len(results.messages) == 1
+        assert results.messages[0].time == 210
+        assert isinstance(results.messages[0].value.exception, TypeError)
@@ -157,3 +157,15 @@ class TestTakeLast(unittest.TestCase):
 
         assert results.messages == []
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_take_last_negative_completed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+                on_next(210, 2), on_next(250, 3), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.take_last(-1))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_completed(300)]
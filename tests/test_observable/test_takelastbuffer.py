@@ -136,6 +136,18 @@ class TestTakeLastBuffer(unittest.TestCase):
         assert [on_next(650, predicate), on_completed(650)] == res.messages
         assert xs.subscriptions == [subscribe(200, 650)]
 
+    def test_take_last_buffer_negative_completed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+                on_next(210, 2), on_next(250, 3), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.take_last_buffer(-1))
+
+        res = scheduler.start(create)
+
+        assert res.messages == [on_next(300, []), on_completed(300)]
+
 # def test_Take_last_buffer_Three_Error():
 #     var ex, res, scheduler, xs
 #     ex = 'ex'
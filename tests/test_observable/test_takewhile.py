@@ -1,7 +1,10 @@
+import threading
+import time
 import unittest
 
 import rx
 from rx import operators as ops
+from rx.subject import Subject
 from rx.testing import TestScheduler, ReactiveTest, is_prime
 
 on_next = ReactiveTest.on_next
@@ -231,3 +234,54 @@ class TestTakeWhile(unittest.TestCase):
             290, 13), on_next(320, 3), on_next(350, 7), on_next(390, 4), on_completed(390)]
         assert xs.subscriptions == [subscribe(200, 390)]
         assert(invoked == 6)
+
+    def test_take_while_concurrent_sources(self):
+        source = Subject()
+        running = 0
+        overlapped = False
+        values = []
+        completed = []
+
+        def predicate(x):
+            nonlocal running, overlapped
+
+            running += 1
+            overlapped = overlapped or running > 1
+            time.sleep(0.0005)
+            running -= 1
+            return x < 40
+
+        source.pipe(ops.take_while(predicate)).subscribe(values.append, on_completed=lambda: completed.append(True))
+
+        def produce(start):
+            for x in range(start, 80, 4):
+                source.on_next(x)
+
+        threads = [threading.Thread(target=produce, args=(start,)) for start in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not overlapped
+        assert completed == [True]
+        assert all(x < 40 for x in values)
+
+    def test_take_while_emits_outside_lock(self):
+        source = Subject()
+        values = []
+
+        def on_next(x):
+            values.append(x)
+            if x == 1:
+                # Another thread pushing an element while the first is
+                # emitted must not block on the predicate lock.
+                thread = threading.Thread(target=source.on_next, args=(2,))
+                thread.start()
+                thread.join(5)
+                assert not thread.is_alive()
+
+        source.pipe(ops.take_while(lambda x: x < 3)).subscribe(on_next)
+        source.on_next(1)
+
+        assert values == [1, 2]
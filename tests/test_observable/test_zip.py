@@ -2,6 +2,7 @@ import unittest
 
 import rx
 from rx import operators as ops
+from rx.subject import Subject
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -485,3 +486,26 @@ class TestZip(unittest.TestCase):
         assert results.messages == [on_next(210, 7), on_next(220, 7),
                                     on_next(230, 7), on_next(240, 7)]
         assert n1.subscriptions == [subscribe(200, 1000)]
+
+    def test_zip_many_uneven(self):
+        subjects = [Subject() for _ in range(100)]
+        results = []
+        completed = []
+        rx.zip(*subjects).subscribe(results.append, on_completed=lambda: completed.append(True))
+
+        for i, subject in enumerate(subjects):
+            subject.on_next(i)
+            if i % 2:
+                subject.on_next(-i)
+        assert results == [tuple(range(100))]
+
+        for i, subject in enumerate(subjects):
+            if not i % 2:
+                subject.on_next(-i)
+        assert results == [tuple(range(100)), tuple(-i for i in range(100))]
+
+        for subject in subjects[1:]:
+            subject.on_completed()
+        assert completed == []
+        subjects[0].on_next(42)
+        assert completed == [True]
@@ -246,3 +246,41 @@ class TestCurrentThreadScheduler(unittest.TestCase):
         scheduler.ensure_trampoline(outer_action)
         assert ran1 is True
         assert ran2 is False
+
+    def test_currentthread_schedule_timed_and_immediate_order(self):
+        scheduler = CurrentThreadScheduler()
+        tests = []
+
+        def outer(scheduler, state=None):
+            scheduler.schedule_relative(0.05, lambda s, _: tests.append('later'))
+            scheduler.schedule_relative(0.02, lambda s, _: tests.append('soon'))
+            scheduler.schedule(lambda s, _: tests.append('now'))
+
+            def slow(scheduler, state):
+                sleep(0.03)
+                tests.append('slow')
+                scheduler.schedule(lambda s, _: tests.append('after slow'))
+
+            scheduler.schedule(slow)
+
+        scheduler.ensure_trampoline(outer)
+
+        # The timed item due while slow ran comes before the item
+        # scheduled by slow.
+        assert tests == ['now', 'slow', 'soon', 'after slow', 'later']
+
+    def test_currentthread_cancel_timed_does_not_wait(self):
+        scheduler = CurrentThreadScheduler()
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        def outer(scheduler, state=None):
+            scheduler.schedule_relative(1.0, action).dispose()
+
+        start = default_now()
+        scheduler.ensure_trampoline(outer)
+        assert ran is False
+        assert default_now() - start < timedelta(milliseconds=500)
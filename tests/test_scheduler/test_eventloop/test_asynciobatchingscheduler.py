@@ -0,0 +1,148 @@
+import unittest
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+from rx.scheduler.eventloop import AsyncIOBatchingScheduler
+
+
+class TestAsyncIOBatchingScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_asyncio_batching_schedule_now(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+        diff = scheduler.now - datetime.utcfromtimestamp(self.loop.time())
+        assert abs(diff) < timedelta(milliseconds=1)
+
+    def test_asyncio_batching_schedule_action(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+        ran = []
+
+        async def go():
+            for n in range(3):
+                scheduler.schedule(lambda scheduler, state: ran.append(state), n)
+            assert ran == []
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(go())
+        assert ran == [0, 1, 2]
+
+    def test_asyncio_batching_same_tick(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+        calls = []
+        original = self.loop.call_soon
+
+        def call_soon(*args, **kw):
+            calls.append(args[0])
+            return original(*args, **kw)
+
+        ran = []
+
+        def action(scheduler_, state):
+            ran.append(state)
+            if state < 10:
+                # Actions scheduled while running go to the next tick.
+                scheduler.schedule(action, state + 10)
+
+        async def go():
+            self.loop.call_soon = call_soon
+            try:
+                for n in range(5):
+                    scheduler.schedule(action, n)
+                await asyncio.sleep(0.01)
+            finally:
+                del self.loop.call_soon
+
+        self.loop.run_until_complete(go())
+        assert ran == [0, 1, 2, 3, 4, 10, 11, 12, 13, 14]
+        assert calls.count(scheduler._run_ready) == 2
+
+    def test_asyncio_batching_schedule_action_due(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+
+        async def go():
+            starttime = self.loop.time()
+            endtime = None
+
+            def action(scheduler, state):
+                nonlocal endtime
+                endtime = self.loop.time()
+
+            scheduler.schedule_relative(0.2, action)
+
+            await asyncio.sleep(0.3)
+            assert endtime is not None
+            diff = endtime - starttime
+            assert diff > 0.18
+
+        self.loop.run_until_complete(go())
+
+    def test_asyncio_batching_schedule_action_cancel(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        async def go():
+            scheduler.schedule(action).dispose()
+            d = scheduler.schedule_relative(0.05, action)
+            d.dispose()
+            assert d.timer.cancelled()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(go())
+        assert ran is False
+
+    def test_asyncio_batching_error(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+        ex = Exception('ex')
+        errors = []
+        ran = []
+
+        def fail(scheduler, state):
+            raise ex
+
+        async def go():
+            self.loop.set_exception_handler(lambda loop, context: errors.append(context['exception']))
+            scheduler.schedule(fail)
+            scheduler.schedule(lambda scheduler, state: ran.append(True))
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(go())
+        assert errors == [ex]
+        assert ran == [True]
+
+    def test_asyncio_batching_threadsafe(self):
+        scheduler = AsyncIOBatchingScheduler(self.loop)
+        idents = set()
+        done = threading.Event()
+        count = 100
+
+        def action(scheduler, state):
+            idents.add(threading.get_ident())
+            if state == count - 1:
+                done.set()
+
+        def produce():
+            for n in range(count):
+                scheduler.schedule(action, n)
+            scheduler.schedule_relative(0.01, action, -1)
+
+        async def go():
+            thread = threading.Thread(target=produce)
+            thread.start()
+            while not done.is_set():
+                await asyncio.sleep(0.01)
+            thread.join()
+            return threading.get_ident()
+
+        ident = self.loop.run_until_complete(go())
+        assert idents == {ident}
@@ -0,0 +1,125 @@
+import unittest
+
+import asyncio
+import threading
+from time import sleep
+
+import rx
+from rx import operators as ops
+from rx.internal.exceptions import DisposedException
+from rx.scheduler.eventloop import AsyncIOShardedScheduler
+
+
+class TestAsyncIOShardedScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = AsyncIOShardedScheduler(3)
+
+    def tearDown(self):
+        self.scheduler.dispose()
+
+    def test_asyncio_sharded_shards(self):
+        shards = self.scheduler.shards
+        assert len(shards) == 3
+        assert len({shard._loop for shard in shards}) == 3
+        assert all(shard._loop.is_running() for shard in shards)
+
+    def test_asyncio_sharded_shard_key(self):
+        assert self.scheduler.shard('a') is self.scheduler.shard('a')
+        assert len({self.scheduler.shard(key) for key in range(30)}) == 3
+
+    def test_asyncio_sharded_schedule_action(self):
+        evt = threading.Event()
+        loops = []
+
+        def action(scheduler, state):
+            loops.append(asyncio.get_event_loop())
+            evt.set()
+
+        self.scheduler.schedule(action)
+        assert evt.wait(5)
+        assert loops[0] in [shard._loop for shard in self.scheduler.shards]
+
+    def test_asyncio_sharded_schedule_recursive(self):
+        evt = threading.Event()
+        idents = []
+
+        def action(scheduler, state):
+            idents.append(threading.get_ident())
+            if state < 5:
+                self.scheduler.schedule(action, state + 1)
+            else:
+                evt.set()
+
+        self.scheduler.schedule(action, 0)
+        assert evt.wait(5)
+        assert len(set(idents)) == 1
+
+    def test_asyncio_sharded_schedule_cancel(self):
+        evt = threading.Event()
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        def cancel(scheduler, state):
+            # Disposing on the loop itself must not wait for the loop.
+            scheduler.schedule_relative(0.05, action).dispose()
+            scheduler.schedule(action).dispose()
+            evt.set()
+
+        self.scheduler.schedule(cancel)
+        assert evt.wait(5)
+        self.scheduler.schedule_relative(0.05, action).dispose()
+        sleep(0.1)
+        assert ran is False
+
+    def test_asyncio_sharded_key_order(self):
+        done = threading.Event()
+        results = {}
+        idents = {}
+        count = 200
+
+        def record(group, value):
+            results.setdefault(group, []).append(value)
+            idents.setdefault(group, set()).add(threading.get_ident())
+
+        rx.range(0, count).pipe(
+            ops.group_by(lambda x: x % 4),
+            ops.flat_map(lambda group: group.pipe(
+                ops.observe_on(self.scheduler.shard(group.key)),
+                ops.do_action(lambda x, key=group.key: record(key, x)))),
+        ).subscribe(on_completed=done.set)
+
+        assert done.wait(5)
+        for key in range(4):
+            assert results[key] == list(range(key, count, 4))
+            assert len(idents[key]) == 1
+
+    def test_asyncio_sharded_loop_factory(self):
+        created = []
+
+        def loop_factory():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        scheduler = AsyncIOShardedScheduler(2, loop_factory=loop_factory)
+        try:
+            assert [shard._loop for shard in scheduler.shards] == created
+        finally:
+            scheduler.dispose()
+
+    def test_asyncio_sharded_dispose(self):
+        loops = [shard._loop for shard in self.scheduler.shards]
+        self.scheduler.dispose()
+
+        with self.assertRaises(DisposedException):
+            self.scheduler.schedule(lambda scheduler, state: None)
+
+        for _ in range(100):
+            if all(loop.is_closed() for loop in loops):
+                break
+            sleep(0.01)
+        assert all(loop.is_closed() for loop in loops)
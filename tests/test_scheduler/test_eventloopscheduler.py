@@ -2,8 +2,9 @@ import pytest
 import unittest
 
 import threading
-from datetime import timedelta
+from datetime import datetime, timedelta
 from time import sleep
+from unittest.mock import patch
 
 from rx.scheduler import EventLoopScheduler
 from rx.internal import DisposedException
@@ -226,3 +227,34 @@ class TestEventLoopScheduler(unittest.TestCase):
 
         assert ran is False
         assert scheduler._has_thread() is False
+
+    def test_eventloop_dispose_from_action(self):
+        threads = []
+
+        def thread_factory(target):
+            thread = threading.Thread(target=target, daemon=True)
+            threads.append(thread)
+            return thread
+
+        scheduler = EventLoopScheduler(thread_factory=thread_factory)
+
+        def action(scheduler, state):
+            scheduler.dispose()
+
+        scheduler.schedule(action)
+
+        threads[0].join(2)
+        assert not threads[0].is_alive()
+
+    def test_eventloop_schedule_clock_change(self):
+        scheduler = EventLoopScheduler(exit_if_empty=True)
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            gate.release()
+
+        scheduler.schedule_relative(0.05, action)
+
+        # Setting the wall clock back must not postpone the action.
+        with patch('rx.scheduler.scheduler.default_now', lambda: datetime.utcnow() - timedelta(hours=1)):
+            assert gate.acquire(timeout=2)
@@ -98,3 +98,16 @@ class TestNewThreadScheduler(unittest.TestCase):
         sleep(0.10)
         disp.dispose()
         assert 0 < counter < 3
+
+    def test_new_thread_threads_created(self):
+        scheduler = NewThreadScheduler()
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            gate.release()
+
+        for _ in range(3):
+            scheduler.schedule(action)
+            assert gate.acquire(timeout=5)
+
+        assert scheduler.threads_created == 3
@@ -0,0 +1,136 @@
+import unittest
+
+import threading
+from datetime import timedelta
+from time import sleep
+
+from rx.internal.basic import default_now
+from rx.internal.exceptions import DisposedException
+from rx.scheduler import PooledThreadScheduler
+
+
+class TestPooledThreadScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = PooledThreadScheduler(2)
+
+    def tearDown(self):
+        self.scheduler.dispose()
+
+    def test_pooled_schedule_action(self):
+        ident = threading.current_thread().ident
+        evt = threading.Event()
+
+        def action(scheduler, state):
+            assert ident != threading.current_thread().ident
+            evt.set()
+
+        self.scheduler.schedule(action)
+        assert evt.wait(5)
+
+    def test_pooled_schedule_action_due(self):
+        evt = threading.Event()
+        start = default_now()
+        end = None
+
+        def action(scheduler, state):
+            nonlocal end
+            end = default_now()
+            evt.set()
+
+        self.scheduler.schedule_relative(timedelta(milliseconds=200), action)
+        assert evt.wait(5)
+        assert end - start > timedelta(milliseconds=180)
+
+    def test_pooled_schedule_action_cancel(self):
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        d = self.scheduler.schedule_relative(0.05, action)
+        d.dispose()
+
+        sleep(0.1)
+        assert ran is False
+        assert self.scheduler._pending == [0]
+
+    def test_pooled_reuses_threads(self):
+        gate = threading.Semaphore(0)
+        idents = set()
+
+        def action(scheduler, state):
+            idents.add(threading.current_thread().ident)
+            gate.release()
+
+        for _ in range(10):
+            self.scheduler.schedule(action)
+            assert gate.acquire(timeout=5)
+
+        assert len(idents) == 1
+        assert self.scheduler.threads_created == 1
+
+    def test_pooled_bounded(self):
+        barrier = threading.Barrier(3)
+        gate = threading.Semaphore(0)
+        idents = set()
+
+        def blocking(scheduler, state):
+            barrier.wait(5)
+
+        def action(scheduler, state):
+            idents.add(threading.current_thread().ident)
+            gate.release()
+
+        self.scheduler.schedule(blocking)
+        self.scheduler.schedule(blocking)
+        for _ in range(4):
+            self.scheduler.schedule(action)
+
+        barrier.wait(5)
+        for _ in range(4):
+            assert gate.acquire(timeout=5)
+
+        assert len(idents) == 2
+        assert self.scheduler.threads_created == 2
+
+    def test_pooled_recursive_same_thread(self):
+        evt = threading.Event()
+        idents = []
+
+        def action(scheduler, state):
+            idents.append(threading.current_thread().ident)
+            if state < 3:
+                scheduler.schedule(action, state + 1)
+            else:
+                evt.set()
+
+        self.scheduler.schedule(action, 0)
+        assert evt.wait(5)
+        assert len(set(idents)) == 1
+
+    def test_pooled_schedule_periodic(self):
+        gate = threading.Semaphore(0)
+        period = 0.05
+        counter = 3
+
+        def action(state):
+            nonlocal counter
+            if state:
+                counter -= 1
+                if counter == 0:
+                    gate.release()
+                return state - 1
+
+        disp = self.scheduler.schedule_periodic(period, action, counter)
+        assert gate.acquire(timeout=5)
+        disp.dispose()
+        assert self.scheduler._pending == [0]
+
+    def test_pooled_dispose(self):
+        self.scheduler.dispose()
+
+        with self.assertRaises(DisposedException):
+            self.scheduler.schedule(lambda scheduler, state: None)
+
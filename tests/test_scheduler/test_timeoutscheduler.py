@@ -98,3 +98,53 @@ class TestTimeoutScheduler(unittest.TestCase):
 
         sleep(0.1)
         assert ran is False
+
+    def test_timeout_schedule_many(self):
+        scheduler = TimeoutScheduler()
+        gate = threading.Semaphore(0)
+        count = 1000
+        ran = []
+
+        def action(scheduler, state):
+            ran.append(state)
+            if len(ran) == count:
+                gate.release()
+
+        for i in range(count):
+            scheduler.schedule_relative(timedelta(milliseconds=i % 50), action, i)
+
+        assert gate.acquire(timeout=5)
+        assert sorted(ran) == list(range(count))
+
+    def test_timeout_schedule_order(self):
+        scheduler = TimeoutScheduler()
+        gate = threading.Semaphore(0)
+        ran = []
+
+        def action(scheduler, state):
+            ran.append(state)
+            if len(ran) == 3:
+                gate.release()
+
+        scheduler.schedule_relative(timedelta(milliseconds=60), action, 3)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action, 1)
+        scheduler.schedule_relative(timedelta(milliseconds=40), action, 2)
+
+        assert gate.acquire(timeout=5)
+        assert ran == [1, 2, 3]
+
+    def test_timeout_action_waits_on_timer(self):
+        scheduler = TimeoutScheduler()
+        fired = threading.Event()
+        waited = []
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            scheduler.schedule_relative(timedelta(milliseconds=10), lambda s, t: fired.set())
+            waited.append(fired.wait(2))
+            gate.release()
+
+        scheduler.schedule(action)
+
+        assert gate.acquire(timeout=5)
+        assert waited == [True]
@@ -71,3 +71,18 @@ class TestVirtualTimeScheduler(unittest.TestCase):
 
         with pytest.raises(ArgumentOutOfRangeException):
             scheduler.advance_to(scheduler._clock - 1)
+
+    def test_virtual_schedule_action_cancel(self):
+        scheduler = VirtualSchedulerTestScheduler()
+        ran = []
+
+        def action(scheduler, state):
+            ran.append(state)
+
+        disposables = [scheduler.schedule_relative(n, action, n) for n in range(1, 11)]
+        for d in disposables[::2]:
+            d.dispose()
+
+        assert len(scheduler._queue) == 5
+        scheduler.start()
+        assert ran == [2, 4, 6, 8, 10]
@@ -0,0 +1,154 @@
+import unittest
+
+import threading
+from datetime import timedelta
+from time import sleep
+
+from rx.internal.basic import default_now
+from rx.internal.exceptions import DisposedException
+from rx.scheduler import WorkStealingScheduler
+
+
+class TestWorkStealingScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = WorkStealingScheduler(4)
+
+    def tearDown(self):
+        self.scheduler.dispose()
+
+    def test_workstealing_now(self):
+        diff = self.scheduler.now - default_now()
+        assert abs(diff) < timedelta(milliseconds=1)
+
+    def test_workstealing_schedule_action(self):
+        ident = threading.current_thread().ident
+        evt = threading.Event()
+
+        def action(scheduler, state):
+            assert ident != threading.current_thread().ident
+            evt.set()
+
+        self.scheduler.schedule(action)
+        assert evt.wait(5)
+
+    def test_workstealing_schedule_action_state(self):
+        evt = threading.Event()
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+            evt.set()
+
+        self.scheduler.schedule(action, 42)
+        assert evt.wait(5)
+        assert result == [42]
+
+    def test_workstealing_schedule_action_due_relative(self):
+        evt = threading.Event()
+        start = default_now()
+
+        def action(scheduler, state):
+            evt.set()
+
+        self.scheduler.schedule_relative(timedelta(milliseconds=100), action)
+        assert evt.wait(5)
+        assert default_now() - start >= timedelta(milliseconds=90)
+
+    def test_workstealing_schedule_action_absolute(self):
+        evt = threading.Event()
+
+        def action(scheduler, state):
+            evt.set()
+
+        self.scheduler.schedule_absolute(default_now() + timedelta(milliseconds=50), action)
+        assert evt.wait(5)
+
+    def test_workstealing_schedule_action_cancel(self):
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        d = self.scheduler.schedule_relative(0.05, action)
+        d.dispose()
+
+        sleep(0.1)
+        assert ran is False
+
+    def test_workstealing_recursive_affinity(self):
+        evt = threading.Event()
+        threads = set()
+        count = 0
+
+        def action(scheduler, state):
+            nonlocal count
+            threads.add(threading.current_thread().ident)
+            count += 1
+            if count < 100:
+                scheduler.schedule(action)
+            else:
+                evt.set()
+
+        self.scheduler.schedule(action)
+        assert evt.wait(5)
+        assert len(threads) == 1
+
+    def test_workstealing_steals(self):
+        lock = threading.Lock()
+        threads = set()
+        done = threading.Event()
+        remaining = [64]
+
+        def work(scheduler, state):
+            sleep(0.01)
+            with lock:
+                threads.add(threading.current_thread().ident)
+                remaining[0] -= 1
+                if not remaining[0]:
+                    done.set()
+
+        def spawn(scheduler, state):
+            # All work lands on the queue of the spawning worker.
+            for _ in range(64):
+                scheduler.schedule(work)
+
+        self.scheduler.schedule(spawn)
+        assert done.wait(10)
+        assert len(threads) > 1
+
+    def test_workstealing_many_actions(self):
+        lock = threading.Lock()
+        done = threading.Event()
+        remaining = [10000]
+
+        def action(scheduler, state):
+            with lock:
+                remaining[0] -= 1
+                if not remaining[0]:
+                    done.set()
+
+        for _ in range(10000):
+            self.scheduler.schedule(action)
+        assert done.wait(10)
+
+    def test_workstealing_periodic(self):
+        evt = threading.Event()
+        counter = [0]
+
+        def action(state):
+            counter[0] += 1
+            if counter[0] == 3:
+                evt.set()
+
+        disposable = self.scheduler.schedule_periodic(0.01, action)
+        assert evt.wait(5)
+        disposable.dispose()
+
+    def test_workstealing_dispose(self):
+        scheduler = WorkStealingScheduler(2)
+        scheduler.dispose()
+
+        with self.assertRaises(DisposedException):
+            scheduler.schedule(lambda s, t: None)
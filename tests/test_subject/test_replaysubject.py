@@ -624,3 +624,65 @@ def test_replay_subject_dies_out():
     assert results4.messages == [
         on_completed(900)]
 
+
+
+def test_replay_window_trims_by_time():
+    scheduler = TestScheduler()
+    subject = ReplaySubject(window=100, scheduler=scheduler)
+    results = scheduler.create_observer()
+
+    for time in range(110, 300, 10):
+        scheduler.schedule_absolute(time, lambda sc, st, time=time: subject.on_next(time))
+    scheduler.schedule_absolute(300, lambda sc, st: subject.subscribe(results))
+    scheduler.start()
+
+    assert [message.value.value for message in results.messages] == list(range(200, 300, 10))
+
+
+def test_replay_buffer_size_compacts():
+    subject = ReplaySubject(buffer_size=3)
+    for value in range(1000):
+        subject.on_next(value)
+
+    assert len(subject.values) <= 6
+    results = []
+    subject.subscribe(results.append)
+    assert results == [997, 998, 999]
+
+
+def test_replay_late_subscribers_share_snapshot():
+    subject = ReplaySubject()
+    for value in range(5):
+        subject.on_next(value)
+
+    results1 = []
+    results2 = []
+    subject.subscribe(results1.append)
+    snapshot = subject.snapshot
+    subject.subscribe(results2.append)
+
+    assert snapshot is subject.snapshot
+    assert results1 == results2 == [0, 1, 2, 3, 4]
+
+    subject.on_next(5)
+    assert subject.snapshot is None
+    assert results1 == results2 == [0, 1, 2, 3, 4, 5]
+
+
+def test_replay_dispose_during_replay():
+    results = []
+    subscription = [None]
+
+    def on_next(value):
+        results.append(value)
+        if value == 2:
+            subscription[0].dispose()
+
+    scheduler = TestScheduler()
+    subject = ReplaySubject(scheduler=scheduler)
+    for value in range(10):
+        subject.on_next(value)
+    subscription[0] = subject.subscribe(on_next)
+    scheduler.start()
+
+    assert results == [0, 1, 2]